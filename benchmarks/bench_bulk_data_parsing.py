@@ -0,0 +1,83 @@
+"""Measure how long it takes to parse the bulk data section of a synthetic nastran deck.
+
+Run with `python benchmarks/bench_bulk_data_parsing.py [number_of_grids]`.
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
+from nastran_to_kratos.nastran.bulk_data.entries import Grid
+from nastran_to_kratos.nastran.bulk_data.tables import GridTable
+
+
+def synthetic_bulk_data(number_of_grids: int) -> list[str]:
+    lines = [
+        f"GRID    {i:>8}        {i % 1000 * 0.5:>8.3f}{i % 1000 * 0.25:>8.3f}     0.0"
+        for i in range(1, number_of_grids + 1)
+    ]
+    lines.extend(f"CROD    {i:>8}{i % 10 + 1:>8}{i:>8}{i + 1:>8}" for i in range(1, number_of_grids))
+    for i in range(1, 11):
+        lines.append(f"PROD    {i:>8}{i:>8}{i * 10.0:>8.1f}")
+        lines.append(f"MAT1    {i:>8} 210000.     0.3")
+    lines.extend(
+        f"FORCE   {i:>8}{i:>8}       0  1000.0     1.0     0.0     0.0" for i in range(1, 101)
+    )
+    lines.extend(f"SPC     {i:>8}{i:>8}  123456     0.0" for i in range(1, 101))
+    return lines
+
+
+def to_large_field(line: str) -> list[str]:
+    fields = [line[i : i + 8].strip() for i in range(8, len(line), 8)]
+    fields += [""] * (8 - len(fields))
+    large = [field.rjust(16) for field in fields]
+    return [f"{line[:8].strip()}*".ljust(8) + "".join(large[:4]), "*".ljust(8) + "".join(large[4:])]
+
+
+def to_free_field(line: str) -> str:
+    return ",".join(line[i : i + 8].strip() for i in range(0, len(line), 8))
+
+
+def best_time(function: Callable[[], object], repeats: int = 5) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(number_of_grids: int) -> None:
+    lines = synthetic_bulk_data(number_of_grids)
+    best = best_time(lambda: BulkDataSection.from_file_content(lines))
+    print(f"{len(lines)} cards parsed in {best:.3f} s ({best / len(lines) * 1e6:.2f} us per card)")
+
+    grid_lines = [line for line in lines if line.startswith("GRID")]
+    per_entry = best_time(
+        lambda: GridTable.from_grids(
+            [
+                Grid.from_file_content([line[i : i + 8] for i in range(0, len(line), 8)])
+                for line in grid_lines
+            ]
+        )
+    )
+    batched = best_time(lambda: GridTable.from_file_content(grid_lines))
+    section = best_time(lambda: BulkDataSection.from_file_content(grid_lines).grid_table())
+    for name, formatted_lines in [
+        ("small field", grid_lines),
+        ("large field", [large for line in grid_lines for large in to_large_field(line)]),
+        ("free field", [to_free_field(line) for line in grid_lines]),
+    ]:
+        best = best_time(lambda lines=formatted_lines: BulkDataSection.from_file_content(lines))
+        print(f"{len(grid_lines)} GRID cards in {name} format parsed in {best:.3f} s")
+
+    print(
+        f"{len(grid_lines)} GRID cards into a GridTable: {per_entry:.3f} s entry by entry, "
+        f"{batched:.3f} s batched ({per_entry / batched:.1f}x), {section:.3f} s through the "
+        "section including the Grid entries"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
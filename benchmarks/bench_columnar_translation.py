@@ -0,0 +1,46 @@
+"""Compare translating a synthetic deck with the TranslationLayer and the ColumnarTranslationLayer.
+
+Run with `python benchmarks/bench_columnar_translation.py [number_of_grids]`.
+"""
+
+import sys
+
+from bench_bulk_data_parsing import best_time, synthetic_bulk_data
+
+from nastran_to_kratos.nastran import BulkDataSection, NastranSimulation
+from nastran_to_kratos.translation_layer import ColumnarTranslationLayer, TranslationLayer
+
+
+def main(number_of_grids: int) -> None:
+    nastran = NastranSimulation(
+        bulk_data=BulkDataSection.from_file_content(synthetic_bulk_data(number_of_grids))
+    )
+    translation_layer = TranslationLayer.from_nastran(nastran)
+    columnar = ColumnarTranslationLayer.from_nastran(nastran)
+
+    stages = [
+        (
+            "from_nastran",
+            lambda: TranslationLayer.from_nastran(nastran),
+            lambda: ColumnarTranslationLayer.from_nastran(nastran),
+        ),
+        ("to_kratos", translation_layer.to_kratos, columnar.to_kratos),
+        (
+            "to_kratos grouped",
+            lambda: translation_layer.to_kratos(group_properties=True),
+            lambda: columnar.to_kratos(group_properties=True),
+        ),
+        ("to_nastran", translation_layer.to_nastran, columnar.to_nastran),
+    ]
+    print(f"{number_of_grids} grids, {number_of_grids - 1} trusses")
+    for name, by_object, by_column in stages:
+        object_time = best_time(by_object, repeats=3)
+        column_time = best_time(by_column, repeats=3)
+        print(
+            f"  {name:<18} objects {object_time:.3f} s, columns {column_time:.3f} s "
+            f"({object_time / column_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
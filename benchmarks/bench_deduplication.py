@@ -0,0 +1,45 @@
+"""Deduplicate a synthetic deck with one PROD and MAT1 per CROD, drawn from a few distinct values.
+
+Run with `python benchmarks/bench_deduplication.py [number_of_rods]`.
+"""
+
+import sys
+
+from bench_bulk_data_parsing import best_time
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection, deduplicate
+from nastran_to_kratos.nastran.bulk_data.entries import Crod, Grid, Mat1, Prod
+from nastran_to_kratos.translation_layer.connector import trusses_from_nastran
+
+DISTINCT_VALUES = 10
+
+
+def synthetic_rods(number_of_rods: int) -> BulkDataSection:
+    entries = [
+        Grid(id=i + 1, cp=None, x1=float(i), x2=0.0, x3=0.0) for i in range(number_of_rods + 1)
+    ]
+    for i in range(1, number_of_rods + 1):
+        entries += [
+            Crod(eid=i, pid=i, g1=i, g2=i + 1),
+            Prod(pid=i, mid=i, a=1.0 + i % DISTINCT_VALUES),
+            Mat1(mid=i, e=2.1e5 * (1 + 1e-9 * (i % 3)), nu=0.3),
+        ]
+    return BulkDataSection(entries=entries)
+
+
+def main(number_of_rods: int) -> None:
+    bulk_data = synthetic_rods(number_of_rods)
+
+    exact = best_time(lambda: deduplicate(bulk_data), repeats=3)
+    close = best_time(lambda: deduplicate(bulk_data, rel_tolerance=1e-6), repeats=3)
+    deduplicated, report = deduplicate(bulk_data, rel_tolerance=1e-6)
+    print(f"exact: {exact:.3f} s ({deduplicate(bulk_data)[1].summary()})")
+    print(f"tolerance 1e-6: {close:.3f} s ({report.summary()})")
+
+    before = best_time(lambda: trusses_from_nastran(bulk_data), repeats=3)
+    after = best_time(lambda: trusses_from_nastran(deduplicated), repeats=3)
+    print(f"trusses_from_nastran: {before:.3f} s before, {after:.3f} s after")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
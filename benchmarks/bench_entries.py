@@ -0,0 +1,45 @@
+"""Measure the memory per entry and the speed of hashing entries, like in sets and dict keys.
+
+Run with `python benchmarks/bench_entries.py [number_of_grids]`.
+"""
+
+import sys
+import tracemalloc
+
+from bench_bulk_data_parsing import best_time, synthetic_bulk_data
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
+from nastran_to_kratos.nastran.bulk_data.entries import Grid
+
+
+def main(number_of_grids: int) -> None:
+    lines = synthetic_bulk_data(number_of_grids)[:number_of_grids]
+
+    tracemalloc.start()
+    grids = BulkDataSection.from_file_content(lines).grids
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    arguments = [(grid.id, grid.cp, grid.x1, grid.x2, grid.x3) for grid in grids]
+    construction = best_time(lambda: [Grid(*grid_arguments) for grid_arguments in arguments])
+    unhashed_grids = iter(
+        [[Grid(*grid_arguments) for grid_arguments in arguments] for _ in range(5)]
+    )
+    first_hash = best_time(lambda: [hash(grid) for grid in next(unhashed_grids)])
+    grid_set = set(grids)
+    lookup = best_time(lambda: sum(grid in grid_set for grid in grids))
+
+    def per_grid(seconds: float) -> str:
+        return f"{seconds / len(grids) * 1e9:.0f} ns/grid"
+
+    grid = grids[0]
+    footprint = sys.getsizeof(grid) + (sys.getsizeof(vars(grid)) if hasattr(grid, "__dict__") else 0)
+    print(f"{len(grids)} grids, {footprint} bytes/grid object (including its __dict__, if any)")
+    print(f"allocated while parsing:  {memory / len(grids):.0f} bytes/grid including values")
+    print(f"construction:             {per_grid(construction)}")
+    print(f"first hash:               {per_grid(first_hash)}")
+    print(f"set lookup (hashed):      {per_grid(lookup)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
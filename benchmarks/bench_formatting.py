@@ -0,0 +1,33 @@
+"""Compare formatting GRID cards entry by entry with formatting a GridTable at once.
+
+Run with `python benchmarks/bench_formatting.py [number_of_grids]`.
+"""
+
+import sys
+
+import numpy as np
+from bench_bulk_data_parsing import best_time
+
+from nastran_to_kratos.nastran.bulk_data.entries import Grid
+from nastran_to_kratos.nastran.bulk_data.tables import GridTable
+
+
+def synthetic_grids(number_of_grids: int) -> list[Grid]:
+    rng = np.random.default_rng(0)
+    coordinates = np.round(rng.uniform(-1000.0, 1000.0, (number_of_grids, 3)), 3).tolist()
+    return [Grid(id=i + 1, x1=x1, x2=x2, x3=x3) for i, (x1, x2, x3) in enumerate(coordinates)]
+
+
+def main(number_of_grids: int) -> None:
+    grids = synthetic_grids(number_of_grids)
+    table = GridTable.from_grids(grids)
+
+    per_entry = best_time(lambda: [grid.to_file_content() for grid in grids])
+    batched = best_time(table.to_file_content)
+    print(f"{number_of_grids} GRID cards formatted")
+    print(f"  entry by entry: {per_entry:.3f} s")
+    print(f"  batched:        {batched:.3f} s ({per_entry / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
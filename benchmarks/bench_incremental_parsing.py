@@ -0,0 +1,33 @@
+"""Compare parsing a synthetic deck in full with parsing it incrementally after a one-card edit.
+
+Run with `python benchmarks/bench_incremental_parsing.py [number_of_grids]`.
+"""
+
+import sys
+
+from bench_bulk_data_parsing import best_time, synthetic_bulk_data
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection, IncrementalParser
+
+
+def main(number_of_grids: int) -> None:
+    lines = synthetic_bulk_data(number_of_grids)
+    edited_lines = list(lines)
+    edited_lines[-101] = edited_lines[-101].replace("1000.0", "2000.0")
+
+    parser = IncrementalParser()
+    parser.parse(lines)
+
+    def parse_incrementally() -> None:
+        parser.parse(edited_lines)
+        parser.parse(lines)
+
+    full = best_time(lambda: BulkDataSection.from_file_content(lines), repeats=3)
+    incremental = best_time(parse_incrementally, repeats=3) / 2
+    _, changes = parser.parse(edited_lines)
+    print(f"{len(lines)} lines, {len(changes.added)} added, {len(changes.removed)} removed")
+    print(f"full: {full:.3f} s, incremental: {incremental:.3f} s ({full / incremental:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,41 @@
+"""Compare resolving the loads of every subcase by a scan over all forces with the set index.
+
+Run with `python benchmarks/bench_load_sets.py [number_of_load_sets]`.
+"""
+
+import sys
+
+from bench_bulk_data_parsing import best_time
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
+from nastran_to_kratos.nastran.bulk_data.entries import Force
+
+FORCES_PER_SET = 20
+
+
+def main(number_of_load_sets: int) -> None:
+    bulk_data = BulkDataSection(
+        entries=[
+            Force(sid=i % number_of_load_sets + 1, g=i, cid=0, f=1.0, n1=1.0, n2=0.0, n3=0.0)
+            for i in range(number_of_load_sets * FORCES_PER_SET)
+        ]
+    )
+    sids = range(1, number_of_load_sets + 1)
+
+    def scan() -> None:
+        for sid in sids:
+            [force for force in bulk_data.forces if force.sid == sid]
+
+    def lookup() -> None:
+        bulk_data.entries = list(bulk_data.entries)
+        for sid in sids:
+            bulk_data.forces_in_set(sid)
+
+    scanned = best_time(scan, repeats=1)
+    indexed = best_time(lookup, repeats=3)
+    print(f"{number_of_load_sets} load sets, {len(bulk_data.entries)} forces")
+    print(f"scan: {scanned:.3f} s, index: {indexed:.3f} s ({scanned / indexed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,56 @@
+"""Measure renumbering the nodes of a truss lattice with scattered ids before the kratos export.
+
+Run with `python benchmarks/bench_node_renumbering.py [width]`, the lattice has width x width nodes.
+"""
+
+import random
+import sys
+
+from bench_bulk_data_parsing import best_time
+
+from nastran_to_kratos.translation_layer import Material, Point, TranslationLayer, Truss
+
+
+def lattice(width: int) -> TranslationLayer:
+    # Scattered ids, like the ones of preprocessors numbering by region.
+    ids = random.Random(0).sample(range(1, 100 * width * width), width * width)
+    steel = Material(name="Steel", young_modulus=210_000)
+    connectors = []
+    for row in range(width):
+        for column in range(width):
+            node = ids[row * width + column]
+            if column + 1 < width:
+                connectors.append(Truss(node, ids[row * width + column + 1], steel, 35))
+            if row + 1 < width:
+                connectors.append(Truss(node, ids[(row + 1) * width + column], steel, 35))
+    random.Random(1).shuffle(connectors)
+    return TranslationLayer(
+        nodes=[Point(ids[i], i % width, i // width, 0) for i in range(width * width)],
+        connectors=connectors,
+    )
+
+
+def bandwidth(translation_layer: TranslationLayer) -> int:
+    """The largest difference of the positions of two connected nodes in the kratos model."""
+    positions = {
+        node.id: i for i, node in enumerate(sorted(translation_layer.nodes, key=lambda n: n.id))
+    }
+    return max(
+        abs(positions[connector.first_point_index] - positions[connector.second_point_index])
+        for connector in translation_layer.connectors
+    )
+
+
+def main(width: int) -> None:
+    translation_layer = lattice(width)
+    renumbered, _ = translation_layer.renumber_nodes()
+
+    renumbering_time = best_time(translation_layer.renumber_nodes, repeats=3)
+    export_time = best_time(translation_layer.to_kratos, repeats=3)
+    print(f"{width * width} nodes, {len(translation_layer.connectors)} trusses")
+    print(f"  renumber_nodes {renumbering_time:.3f} s (to_kratos {export_time:.3f} s)")
+    print(f"  bandwidth {bandwidth(translation_layer)} -> {bandwidth(renumbered)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,31 @@
+"""Measure how parsing a large bulk data section scales with the number of processes.
+
+Run with `python benchmarks/bench_parallel_parsing.py [number_of_grids]`.
+"""
+
+import os
+import sys
+
+from bench_bulk_data_parsing import best_time, synthetic_bulk_data
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection, parse_bulk_data_in_parallel
+
+
+def main(number_of_grids: int) -> None:
+    lines = synthetic_bulk_data(number_of_grids)
+    serial = best_time(lambda: BulkDataSection.from_file_content(lines), repeats=3)
+    print(f"{len(lines)} cards, {os.cpu_count()} processors")
+    print(f"serial: {serial:.3f} s")
+
+    processors = os.cpu_count() or 1
+    worker_counts = sorted({2, processors, *(2**i for i in range(processors.bit_length()))})
+    for max_workers in worker_counts:
+        parallel = best_time(
+            lambda max_workers=max_workers: parse_bulk_data_in_parallel(lines, max_workers),
+            repeats=3,
+        )
+        print(f"{max_workers:>3} processes: {parallel:.3f} s ({serial / parallel:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
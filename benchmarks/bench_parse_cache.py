@@ -0,0 +1,34 @@
+"""Compare parsing a synthetic nastran deck with loading it from the parse cache.
+
+Run with `python benchmarks/bench_parse_cache.py [number_of_grids]`.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from bench_bulk_data_parsing import best_time, synthetic_bulk_data
+
+from nastran_to_kratos.nastran import NastranSimulation, ParseCache
+
+
+def main(number_of_grids: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "model.bdf"
+        lines = ["$$ Case Control Cards", "$$ Bulk Data Cards", "BEGIN BULK"]
+        lines += synthetic_bulk_data(number_of_grids)
+        path.write_text("\n".join([*lines, "ENDDATA"]) + "\n")
+
+        cache = ParseCache(Path(directory) / "cache")
+        cache.read(path, max_workers=1)
+
+        parse = best_time(lambda: NastranSimulation.from_path(path, max_workers=1), repeats=3)
+        hit = best_time(lambda: cache.read(path), repeats=3)
+        cache_size = sum(file_.stat().st_size for file_ in cache.directory.glob("*.npz"))
+        print(f"{len(lines)} lines ({path.stat().st_size / 1e6:.1f} MB)")
+        print(f"parse: {parse:.3f} s, cache hit: {hit:.3f} s ({parse / hit:.1f}x)")
+        print(f"cache file: {cache_size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
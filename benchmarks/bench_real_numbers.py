@@ -0,0 +1,51 @@
+"""Compare the real number decoders with float() on the real fields of GRID, MAT1 and FORCE cards.
+
+Run with `python benchmarks/bench_real_numbers.py [number_of_fields]`.
+"""
+
+import sys
+
+import numpy as np
+from bench_bulk_data_parsing import best_time
+
+from nastran_to_kratos.nastran.bulk_data import parse_real, parse_real_column
+
+
+def realistic_fields(number_of_fields: int) -> list[str]:
+    """Coordinates of grids, material constants in implicit exponent notation and force factors."""
+    patterns = [
+        lambda i: f"{i % 1000 * 0.5:.3f}",
+        lambda i: f"{-(i % 700) * 0.25:.2f}",
+        lambda _: "2.1+5",
+        lambda _: "7.85-9",
+        lambda i: f"{i % 100 * 10.0:.1f}",
+        lambda _: "1.",
+    ]
+    return [patterns[i % len(patterns)](i) for i in range(number_of_fields)]
+
+
+def main(number_of_fields: int) -> None:
+    fields = realistic_fields(number_of_fields)
+    plain_fields = [field for field in fields if "+" not in field and "-" not in field[1:]]
+    strings = np.array([field.encode() for field in fields], dtype="S8")
+    plain_strings = np.array([field.encode() for field in plain_fields], dtype="S8")
+
+    plain = best_time(lambda: [float(field) for field in plain_fields])
+    scalar_plain = best_time(lambda: [parse_real(field) for field in plain_fields])
+    scalar = best_time(lambda: [parse_real(field) for field in fields])
+    astype = best_time(lambda: plain_strings.astype(np.float64))
+    column = best_time(lambda: parse_real_column(strings))
+
+    def per_field(seconds: float, count: int) -> str:
+        return f"{seconds / count * 1e9:.0f} ns/field"
+
+    print(f"{len(fields)} fields, {len(plain_fields)} of them without implicit exponents")
+    print(f"float() on plain fields:      {per_field(plain, len(plain_fields))}")
+    print(f"parse_real on plain fields:   {per_field(scalar_plain, len(plain_fields))}")
+    print(f"parse_real on all fields:     {per_field(scalar, len(fields))}")
+    print(f"NumPy astype on plain fields: {per_field(astype, len(plain_fields))}")
+    print(f"parse_real_column:            {per_field(column, len(fields))}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 600_000)
@@ -0,0 +1,30 @@
+"""Report the wall time of each stage when translating a synthetic deck.
+
+Run with `python benchmarks/bench_translation_stages.py [number_of_grids]`.
+"""
+
+import sys
+
+from bench_bulk_data_parsing import synthetic_bulk_data
+
+from nastran_to_kratos.nastran import BulkDataSection, NastranSimulation
+from nastran_to_kratos.translation_layer import StageTimings, TranslationLayer
+
+
+def main(number_of_grids: int) -> None:
+    nastran = NastranSimulation(
+        bulk_data=BulkDataSection.from_file_content(synthetic_bulk_data(number_of_grids))
+    )
+
+    print(f"{number_of_grids} grids, {number_of_grids - 1} trusses")
+    timings = StageTimings()
+    translation_layer = TranslationLayer.from_nastran(nastran, timings=timings)
+    print(f"  from_nastran  {timings.summary()}")
+
+    timings = StageTimings()
+    translation_layer.to_kratos(timings=timings)
+    print(f"  to_kratos     {timings.summary()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,24 @@
+"""Measure the validation of all references in a synthetic deck.
+
+Run with `python benchmarks/bench_validation.py [number_of_grids]`.
+"""
+
+import sys
+
+from bench_bulk_data_parsing import best_time, synthetic_bulk_data
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection, validate_references
+
+
+def main(number_of_grids: int) -> None:
+    bulk_data = BulkDataSection.from_file_content(synthetic_bulk_data(number_of_grids))
+    del bulk_data.entries[number_of_grids // 2]
+
+    validation = best_time(lambda: validate_references(bulk_data), repeats=3)
+    dangling_references = validate_references(bulk_data)
+    print(f"{len(bulk_data.entries)} entries, {len(dangling_references)} dangling references")
+    print(f"validation: {validation:.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,48 @@
+"""Compare the time and peak memory of writing a synthetic deck from a list of lines and streamed.
+
+Run with `python benchmarks/bench_writing.py [number_of_grids]`.
+"""
+
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import TextIO
+
+from bench_bulk_data_parsing import best_time, synthetic_bulk_data
+
+from nastran_to_kratos.nastran import BulkDataSection, NastranSimulation
+
+
+def peak_memory(function: Callable[[], None]) -> int:
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(number_of_grids: int) -> None:
+    simulation = NastranSimulation(
+        bulk_data=BulkDataSection.from_file_content(synthetic_bulk_data(number_of_grids))
+    )
+    path = Path(tempfile.mkdtemp()) / "model.bdf"
+
+    def write(export: Callable[[TextIO], None]) -> Callable[[], None]:
+        def write_file() -> None:
+            with path.open("w") as file_:
+                export(file_)
+
+        return write_file
+
+    from_list = write(lambda file_: file_.writelines(simulation.to_file_content()))
+    streamed = write(simulation.write_to)
+
+    for name, function in [("list of lines", from_list), ("write_to", streamed)]:
+        duration = best_time(function, repeats=3)
+        print(f"{name}: {duration:.3f} s, peak {peak_memory(function) / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -27,7 +27,7 @@ class Model:
 
         for i, line in enumerate(stripped_mdpa_content):
             if line.startswith("Begin Properties"):
-                model.properties = _properties_from_mdpa(stripped_mdpa_content[i:])
+                model.properties.update(_properties_from_mdpa(stripped_mdpa_content[i:]))
             if line.startswith("Begin Nodes"):
                 model.nodes = _nodes_from_mdpa(stripped_mdpa_content[i:])
             if line.startswith("Begin Elements"):
@@ -27,4 +27,4 @@ def kratos_to_nastran(kratos_directory: Path | str, output_file: Path | str) ->
     nastran = translation_layer.to_nastran()
 
     with output_file.open("w") as file_:
-        file_.writelines(nastran.to_file_content())
+        nastran.write_to(file_)
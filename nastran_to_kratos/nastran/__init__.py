@@ -2,6 +2,13 @@
 
 from .bulk_data import BulkDataSection
 from .case_control import CaseControlSection
-from .nastran_simulation import NastranSimulation
+from .nastran_simulation import MissingSectionError, NastranSimulation
+from .parse_cache import ParseCache
 
-__all__ = ["BulkDataSection", "CaseControlSection", "NastranSimulation"]
+__all__ = [
+    "BulkDataSection",
+    "CaseControlSection",
+    "MissingSectionError",
+    "NastranSimulation",
+    "ParseCache",
+]
@@ -1,5 +1,44 @@
 """Bulk data describes the model and the loads on the model."""
 
-from .bulk_data_section import BulkDataSection, EntryIdentifyerNotSupportedError
+from .bulk_data_index import BulkDataIndex
+from .bulk_data_section import (
+    BulkDataSection,
+    EntryIdentifyerNotSupportedError,
+    EntryTypeWithoutSetError,
+    TooManyFreeFieldsError,
+)
+from .deduplication import DeduplicationReport, InvalidToleranceError, deduplicate
+from .includes import CyclicIncludeError, IncludeCache, resolve_includes
+from .incremental_parsing import ChangeSet, IncrementalParser
+from .parallel_parsing import parse_bulk_data_in_parallel
+from .real_numbers import format_real, parse_real, parse_real_column
+from .validation import (
+    DanglingReference,
+    DanglingReferencesError,
+    check_references,
+    validate_references,
+)
 
-__all__ = ["BulkDataSection", "EntryIdentifyerNotSupportedError"]
+__all__ = [
+    "BulkDataIndex",
+    "BulkDataSection",
+    "ChangeSet",
+    "CyclicIncludeError",
+    "DanglingReference",
+    "DanglingReferencesError",
+    "DeduplicationReport",
+    "EntryIdentifyerNotSupportedError",
+    "EntryTypeWithoutSetError",
+    "IncludeCache",
+    "IncrementalParser",
+    "InvalidToleranceError",
+    "TooManyFreeFieldsError",
+    "check_references",
+    "deduplicate",
+    "format_real",
+    "parse_bulk_data_in_parallel",
+    "parse_real",
+    "parse_real_column",
+    "resolve_includes",
+    "validate_references",
+]
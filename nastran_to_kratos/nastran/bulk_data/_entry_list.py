@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, SupportsIndex, TypeVar
+
+from .entries import _BulkDataEntry
+from .tables._bulk_data_table import TableT, _BulkDataTable
+
+EntryT = TypeVar("EntryT", bound=_BulkDataEntry)
+
+
+class _EntryList(list[_BulkDataEntry]):
+    """A list of bulk data entries, that additionally sorts its entries into buckets by type.
+
+    Appending keeps the buckets up to date, so the entries of one type are available without
+    scanning the whole list. Every other modification of the list discards the buckets and they are
+    rebuilt on the next access. Within a bucket the entries keep the order of the list.
+
+    Entries of types with a set_id_field, like loads and constraints, are additionally indexed by
+    their set id on the first lookup of a set, so the entries of one set are found without scanning
+    all entries of their type.
+
+    The entries of a type can also be kept as a column-oriented table, like the table decoded while
+    reading them from a file. Such a table is discarded as soon as an entry of its type is appended
+    or the list is modified otherwise. Modifying the fields of an entry in place is not noticed, so
+    entries must be replaced instead, like for hashing them.
+    """
+
+    def __init__(self, entries: Iterable[_BulkDataEntry] = ()) -> None:
+        super().__init__(entries)
+        self._buckets: dict[type, list[Any]] | None = None
+        self._set_indexes: dict[type, dict[int, list[Any]]] = {}
+        self._tables: dict[type, Any] = {}
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[_EntryList], tuple[list[_BulkDataEntry]], dict[str, Any]]:
+        """Pickle this list with its tables but without its buckets."""
+        return (_EntryList, (list(self),), {"_tables": self._tables})
+
+    def of_type(self, entry_type: type[EntryT]) -> list[EntryT]:
+        """Return the entries of one type. The returned list must not be modified."""
+        return self._filled_buckets().get(entry_type, [])
+
+    def entry_types(self) -> list[type[_BulkDataEntry]]:
+        """Return the types of the entries in the order of their first occurrence."""
+        return list(self._filled_buckets())
+
+    def of_set(self, entry_type: type[EntryT], set_id: int) -> list[EntryT]:
+        """Return the entries of one type in a set. The returned list must not be modified."""
+        set_index = self._set_indexes.get(entry_type)
+        if set_index is None:
+            set_index = {}
+            for entry in self.of_type(entry_type):
+                self._add_to_set_index(set_index, entry)
+            self._set_indexes[entry_type] = set_index
+
+        return set_index.get(set_id, [])
+
+    def table(self, table_type: type[TableT]) -> TableT:
+        """Return the entries of the entry type of a table as that table.
+
+        The table is built from the entries on the first call and kept until it is discarded.
+        """
+        entry_type = table_type._entry_type  # noqa: SLF001
+        table = self._tables.get(entry_type)
+        if table is None:
+            table = self._tables[entry_type] = table_type.from_entries(self.of_type(entry_type))
+        return table
+
+    def keep_table(self, table: _BulkDataTable) -> None:
+        """Keep a table containing exactly the entries of its entry type in the order of the list.
+
+        It is returned by table instead of building a new one from the entries.
+        """
+        self._tables[table._entry_type] = table  # noqa: SLF001
+
+    def append(self, entry: _BulkDataEntry) -> None:
+        """Append an entry to the list and its bucket."""
+        super().append(entry)
+        self._tables.pop(type(entry), None)
+        if self._buckets is not None:
+            self._add_to_bucket(self._buckets, entry)
+        set_index = self._set_indexes.get(type(entry))
+        if set_index is not None:
+            self._add_to_set_index(set_index, entry)
+
+    def extend(self, entries: Iterable[_BulkDataEntry]) -> None:
+        """Append several entries to the list and their buckets."""
+        if self._buckets is None:
+            super().extend(entries)
+            self._tables = {}
+            return
+        for entry in entries:
+            self.append(entry)
+
+    def __iadd__(self, entries: Iterable[_BulkDataEntry]) -> _EntryList:  # type: ignore[override, misc]  # noqa: PYI034
+        """Append several entries to the list and their buckets."""
+        self.extend(entries)
+        return self
+
+    def insert(self, index: SupportsIndex, entry: _BulkDataEntry) -> None:
+        """Insert an entry before the index."""
+        super().insert(index, entry)
+        self._discard_indexes()
+
+    def __setitem__(self, index: Any, value: Any) -> None:  # noqa: ANN401
+        """Replace one or several entries."""
+        super().__setitem__(index, value)
+        self._discard_indexes()
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        """Delete one or several entries."""
+        super().__delitem__(index)
+        self._discard_indexes()
+
+    def __imul__(self, value: SupportsIndex) -> _EntryList:  # noqa: PYI034
+        """Repeat the entries in place."""
+        super().__imul__(value)
+        self._discard_indexes()
+        return self
+
+    def pop(self, index: SupportsIndex = -1) -> _BulkDataEntry:
+        """Remove and return the entry at the index."""
+        entry = super().pop(index)
+        self._discard_indexes()
+        return entry
+
+    def remove(self, entry: _BulkDataEntry) -> None:
+        """Remove the first occurrence of an entry."""
+        super().remove(entry)
+        self._discard_indexes()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        super().clear()
+        self._discard_indexes()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Sort the entries in place."""
+        super().sort(*args, **kwargs)
+        self._discard_indexes()
+
+    def reverse(self) -> None:
+        """Reverse the order of the entries in place."""
+        super().reverse()
+        self._discard_indexes()
+
+    def _filled_buckets(self) -> dict[type, list[Any]]:
+        buckets = self._buckets
+        if buckets is None:
+            buckets = {}
+            for entry in self:
+                self._add_to_bucket(buckets, entry)
+            self._buckets = buckets
+        return buckets
+
+    def _add_to_bucket(self, buckets: dict[type, list[Any]], entry: _BulkDataEntry) -> None:
+        bucket = buckets.get(type(entry))
+        if bucket is None:
+            bucket = buckets[type(entry)] = []
+        bucket.append(entry)
+
+    def _add_to_set_index(self, set_index: dict[int, list[Any]], entry: _BulkDataEntry) -> None:
+        set_id = getattr(entry, type(entry).set_id_field)  # type: ignore[arg-type]
+        entries_in_set = set_index.get(set_id)
+        if entries_in_set is None:
+            entries_in_set = set_index[set_id] = []
+        entries_in_set.append(entry)
+
+    def _discard_indexes(self) -> None:
+        self._buckets = None
+        self._set_indexes = {}
+        self._tables = {}
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import mmap
+import re
+from array import array
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+
+import numpy as np
+
+from .bulk_data_section import (
+    _IGNORED_ENTRY_IDENTIFYERS,
+    SMALL_FIELD_WIDTH,
+    BulkDataSection,
+    _entry_from_lines,
+)
+from .entries import _BulkDataEntry
+from .tables._bulk_data_table import TableT
+
+_BULK_DATA_START = re.compile(rb"^BEGIN\s+BULK[^\n]*\n?", re.MULTILINE)
+_BULK_DATA_END = re.compile(rb"^ENDDATA", re.MULTILINE)
+_CARD = re.compile(rb"^([A-Za-z][A-Za-z0-9]*)[^\r\n]*(?:\r?\n[+*, ][^\r\n]*)*", re.MULTILINE)
+"A card starts with its identifyer and is continued on lines starting with '+', '*' or a blank."
+
+_LINE_FEED = ord("\n")
+
+
+class BulkDataIndex:
+    """An index over the cards in the bulk data section of a nastran file.
+
+    The file is memory-mapped and scanned once on construction, recording the type, byte offset and
+    length of every card. Cards are only decoded into entries when they are accessed, so extracting
+    a single type of entry from a large file does not require parsing all the other entries.
+
+    Example:
+    ```python
+    with BulkDataIndex(Path("/path/to/nastran.bdf")) as index:
+        rbe2s = index.to_bulk_data_section(["RBE2"])
+    ```
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        "Location of the indexed file."
+
+        self._card_types: list[str] = []
+        self._offsets = array("q")
+        self._lengths = array("q")
+        self._positions_by_card_type: dict[str, array] = {}
+
+        with path.open("rb") as file_:
+            if path.stat().st_size == 0:
+                self._buffer: mmap.mmap | bytes = b""
+            else:
+                self._buffer = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._scan()
+
+    def __enter__(self) -> BulkDataIndex:  # noqa: PYI034
+        """Use the index as a context manager, which releases the file mapping on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the file mapping."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of indexed cards."""
+        return len(self._offsets)
+
+    @property
+    def card_types(self) -> set[str]:
+        """Return the identifyers of all card types present in the file."""
+        return set(self._positions_by_card_type)
+
+    def count(self, card_type: str) -> int:
+        """Return the number of cards of a type without decoding them."""
+        return len(self._positions_by_card_type.get(card_type, ()))
+
+    def close(self) -> None:
+        """Release the file mapping. Entries decoded before stay valid."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = b""
+
+    def card_type(self, position: int) -> str:
+        """Return the identifyer of the card at a position in the index."""
+        return self._card_types[position]
+
+    def raw_card(self, position: int) -> str:
+        """Return the text of the card at a position in the index including continuation lines."""
+        return self._raw_card_bytes(position).decode().rstrip("\r")
+
+    def line_numbers(self) -> list[int]:
+        """Return the number of the first line of every card, counting from 1.
+
+        The numbers refer to the lines of the whole file and are listed in the order of the index,
+        which is also the order of the entries of to_bulk_data_section() without card types.
+        """
+        characters = np.frombuffer(self._buffer, dtype=np.uint8)
+        line_starts = np.flatnonzero(characters == _LINE_FEED) + 1
+        offsets = np.frombuffer(self._offsets, dtype=np.int64)
+        line_numbers: list[int] = (np.searchsorted(line_starts, offsets, side="right") + 1).tolist()
+        return line_numbers
+
+    def table(self, table_type: type[TableT]) -> TableT:
+        """Decode all cards of the entry type of a table into that table.
+
+        If all cards are single small field lines, they are decoded column by column at once without
+        creating an entry per card.
+        """
+        identifyer = table_type._entry_type.identifyer  # noqa: SLF001
+        positions = self._positions_by_card_type.get(identifyer, ())
+        raw_cards = [self._raw_card_bytes(position) for position in positions]
+
+        small_field_identifyer = identifyer.ljust(SMALL_FIELD_WIDTH).encode()
+        if all(
+            raw_card.startswith(small_field_identifyer)
+            and b"," not in raw_card
+            and b"\n" not in raw_card
+            for raw_card in raw_cards
+        ):
+            return table_type.from_file_content(raw_cards)
+        return table_type.from_entries([self.entry(position) for position in positions])
+
+    def entry(self, position: int) -> _BulkDataEntry:
+        """Decode the card at a position in the index into an entry."""
+        entry = _entry_from_lines(self.raw_card(position).splitlines())
+        if entry is None:
+            raise IndexError(position)
+        return entry
+
+    def entries(self, card_type: str | None = None) -> Iterator[_BulkDataEntry]:
+        """Lazily decode all entries or only the entries of one card type in file order."""
+        if card_type is None:
+            positions: Iterable[int] = range(len(self))
+        else:
+            positions = self._positions_by_card_type.get(card_type, ())
+
+        for position in positions:
+            yield self.entry(position)
+
+    def to_bulk_data_section(self, card_types: Iterable[str] | None = None) -> BulkDataSection:
+        """Decode the cards of the selected types (or all cards) into a bulk data section."""
+        if card_types is None:
+            return BulkDataSection(entries=list(self.entries()))
+
+        positions = sorted(
+            position
+            for card_type in set(card_types)
+            for position in self._positions_by_card_type.get(card_type, ())
+        )
+        return BulkDataSection(entries=[self.entry(position) for position in positions])
+
+    def _raw_card_bytes(self, position: int) -> bytes:
+        offset = self._offsets[position]
+        return self._buffer[offset : offset + self._lengths[position]]
+
+    def _scan(self) -> None:
+        start_match = _BULK_DATA_START.search(self._buffer)
+        start = 0 if start_match is None else start_match.end()
+        end_match = _BULK_DATA_END.search(self._buffer, start)
+        end = len(self._buffer) if end_match is None else end_match.start()
+
+        card_types_by_identifyer: dict[bytes, str] = {}
+        for match in _CARD.finditer(self._buffer, start, end):
+            identifyer = match.group(1)
+            card_type = card_types_by_identifyer.get(identifyer)
+            if card_type is None:
+                card_type = identifyer.decode()
+                card_types_by_identifyer[identifyer] = card_type
+            if card_type in _IGNORED_ENTRY_IDENTIFYERS:
+                continue
+
+            position = len(self._offsets)
+            self._card_types.append(card_type)
+            self._offsets.append(match.start())
+            self._lengths.append(match.end() - match.start())
+            self._positions_by_card_type.setdefault(card_type, array("q")).append(position)
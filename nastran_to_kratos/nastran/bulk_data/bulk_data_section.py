@@ -1,45 +1,119 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
 
-from .entries import Crod, Force, Grid, Mat1, Prod, Rbe2, Spc, _BulkDataEntry
+from ._entry_list import EntryT, _EntryList
+from .entries import Crod, Force, Grid, Mat1, Prod, Rbe2, Spc, _BulkDataEntry, entry_class_for
+from .tables import CrodTable, GridTable, Mat1Table, ProdTable
+from .tables._bulk_data_table import _BulkDataTable
 
 
-@dataclass
+@dataclass(init=False)
 class BulkDataSection:
-    """The bulk data section containing the model and loads."""
+    """The bulk data section containing the model and loads.
 
-    entries: list[_BulkDataEntry]
+    The entries are additionally kept in buckets by their type, so the properties returning all
+    entries of one type do not need to scan the entire section.
+    """
+
+    entries: _EntryList
+    """All entries of this section. A plain list assigned to it is wrapped in an _EntryList."""
+
+    includes: list[str] = field(default_factory=list)
+    """File names of the INCLUDE statements in this section. They are not resolved when reading a
+    section, see resolve_includes for reading the included files."""
+
+    def __init__(self, entries: Iterable[_BulkDataEntry], includes: list[str] | None = None) -> None:
+        self.entries = entries if isinstance(entries, _EntryList) else _EntryList(entries)
+        self.includes = [] if includes is None else includes
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Wrap the entries in a list that keeps them sorted into buckets by type."""
+        if name == "entries" and not isinstance(value, _EntryList):
+            value = _EntryList(value)
+        super().__setattr__(name, value)
 
     @property
     def crods(self) -> list[Crod]:
-        """Return all Crod objects in the entries."""
-        return [elem for elem in self.entries if isinstance(elem, Crod)]
+        """Return a copy of the list of all Crod objects in the entries."""
+        return self._entries_of_type(Crod)
 
     @property
     def forces(self) -> list[Force]:
-        """Return all Force objects in the entries."""
-        return [elem for elem in self.entries if isinstance(elem, Force)]
+        """Return a copy of the list of all Force objects in the entries."""
+        return self._entries_of_type(Force)
 
     @property
     def grids(self) -> list[Grid]:
-        """Return all Grid objects in the entries."""
-        return [elem for elem in self.entries if isinstance(elem, Grid)]
+        """Return a copy of the list of all Grid objects in the entries."""
+        return self._entries_of_type(Grid)
 
     @property
     def mat1s(self) -> list[Mat1]:
-        """Return all Mat1 objects in the entries."""
-        return [elem for elem in self.entries if isinstance(elem, Mat1)]
+        """Return a copy of the list of all Mat1 objects in the entries."""
+        return self._entries_of_type(Mat1)
 
     @property
     def prods(self) -> list[Prod]:
-        """Return all Prod objects in the entries."""
-        return [elem for elem in self.entries if isinstance(elem, Prod)]
+        """Return a copy of the list of all Prod objects in the entries."""
+        return self._entries_of_type(Prod)
+
+    @property
+    def rbe2s(self) -> list[Rbe2]:
+        """Return a copy of the list of all Rbe2 objects in the entries."""
+        return self._entries_of_type(Rbe2)
 
     @property
     def spcs(self) -> list[Spc]:
-        """Return all Spc objects in the entries."""
-        return [elem for elem in self.entries if isinstance(elem, Spc)]
+        """Return a copy of the list of all Spc objects in the entries."""
+        return self._entries_of_type(Spc)
+
+    def forces_in_set(self, sid: int) -> list[Force]:
+        """Return a copy of the list of the Force objects of one load set."""
+        return self.entries_in_set(Force, sid)
+
+    def spcs_in_set(self, sid: int) -> list[Spc]:
+        """Return a copy of the list of the Spc objects of one single-point constraint set."""
+        return self.entries_in_set(Spc, sid)
+
+    def entries_in_set(self, entry_type: type[EntryT], set_id: int) -> list[EntryT]:
+        """Return a copy of the list of the entries of a type with a set_id_field in one set.
+
+        The entries of the type are indexed by their set id on the first call, so every further
+        lookup only takes time proportional to the number of entries in the set.
+
+        Raises:
+            EntryTypeWithoutSetError: if the entries of the type do not belong to sets.
+
+        """
+        if entry_type.set_id_field is None:
+            raise EntryTypeWithoutSetError(entry_type)
+        return list(self.entries.of_set(entry_type, set_id))
+
+    def crod_table(self) -> CrodTable:
+        """Return all Crod objects in the entries as a column-oriented table, see grid_table."""
+        return self.entries.table(CrodTable)
+
+    def grid_table(self) -> GridTable:
+        """Return all Grid objects in the entries as a column-oriented table.
+
+        If all GRID cards were decoded in blocks when reading the section, the table is joined from
+        the decoded columns without going through the Grid objects. Otherwise it is built from the
+        Grid objects once. The table is kept until a Grid is added or the entries are modified
+        otherwise, so it must not be modified.
+        """
+        return self.entries.table(GridTable)
+
+    def mat1_table(self) -> Mat1Table:
+        """Return all Mat1 objects in the entries as a column-oriented table, see grid_table."""
+        return self.entries.table(Mat1Table)
+
+    def prod_table(self) -> ProdTable:
+        """Return all Prod objects in the entries as a column-oriented table, see grid_table."""
+        return self.entries.table(ProdTable)
 
     @classmethod
     def empty(cls) -> BulkDataSection:
@@ -47,47 +121,277 @@ class BulkDataSection:
         return BulkDataSection(entries=[])
 
     @classmethod
-    def from_file_content(cls, file_content: list[str]) -> BulkDataSection:  # noqa: C901
-        """Construct this class from the contents of a nastran file."""
+    def from_file_content(cls, file_content: Iterable[str]) -> BulkDataSection:
+        """Construct this class from the contents of a nastran file.
+
+        The lines are processed one after another, so a lazy iterable of lines can be passed. Runs
+        of single line small field cards of a type with a table, like GRID or CROD, are decoded in
+        blocks column by column (see _BulkDataTable.from_file_content), all other cards one by one.
+        The decoded columns are kept as the tables of the section, see grid_table.
+        """
         bulk_data = BulkDataSection.empty()
+        blocks: dict[type[_BulkDataTable], list[_BulkDataTable]] = {}
+        entry_types_outside_blocks: set[type[_BulkDataEntry]] = set()
 
-        for line in file_content:
-            entry_identifyer = line.strip().split(" ")[0].split(",")[0].strip()
-
-            processed_entry: _BulkDataEntry | None = None
-            match entry_identifyer:
-                case "CROD":
-                    processed_entry = Crod.from_file_content(_split_short_line(line))
-                case "FORCE":
-                    processed_entry = Force.from_file_content(_split_short_line(line))
-                case "GRID":
-                    processed_entry = Grid.from_file_content(_split_short_line(line))
-                case "MAT1":
-                    processed_entry = Mat1.from_file_content(_split_short_line(line))
-                case "PROD":
-                    processed_entry = Prod.from_file_content(_split_short_line(line))
-                case "SPC":
-                    processed_entry = Spc.from_file_content(_split_short_line(line))
-                case "RBE2":
-                    processed_entry = Rbe2.from_file_content(_split_short_line(line))
-
-                case "SOL" | "CEND" | "BEGIN" | "ENDDATA" | "PARAM":
-                    pass
-                case _:
-                    raise EntryIdentifyerNotSupportedError(entry_identifyer)
+        for table_type, lines_or_fields in _blocks_and_cards(file_content):
+            if table_type is not None:
+                block = table_type.from_file_content(lines_or_fields)
+                bulk_data.entries.extend(block.to_entries())
+                blocks.setdefault(table_type, []).append(block)
+                continue
 
+            processed_entry = _entry_from_fields(lines_or_fields)
             if processed_entry is not None:
                 bulk_data.entries.append(processed_entry)
+                entry_types_outside_blocks.add(type(processed_entry))
+            elif _is_include(lines_or_fields):
+                bulk_data.includes.append(_include_file_name(lines_or_fields))
+
+        for table_type, tables in blocks.items():
+            if table_type._entry_type not in entry_types_outside_blocks:  # noqa: SLF001
+                bulk_data.entries.keep_table(table_type.concatenate(tables))
 
         return bulk_data
 
+    @classmethod
+    def from_path(cls, path: Path) -> BulkDataSection:
+        """Read a file only containing bulk data, like an included file, skipping comments."""
+        with path.open() as bulk_data_file:
+            return BulkDataSection.from_file_content(
+                line.removesuffix("\n") for line in bulk_data_file if not line.startswith("$")
+            )
+
     def to_file_content(self) -> list[str]:
         """Export this section into lines for saving to a nastran file."""
-        return [entry.to_file_content() for entry in self.entries]
+        file_content = [entry.to_file_content() for entry in self.entries]
+        file_content.extend(f"INCLUDE '{file_name}'" for file_name in self.includes)
+        return file_content
+
+    def write_to(self, stream: TextIO) -> None:
+        """Write this section to a text stream line by line, the same lines as to_file_content.
+
+        The lines are formatted in blocks of a fixed number of entries and each block is written at
+        once, so only one block of lines is held in memory besides the section.
+        """
+        entries = self.entries
+        for start in range(0, len(entries), _WRITE_BLOCK_SIZE):
+            block = entries[start : start + _WRITE_BLOCK_SIZE]
+            stream.write("".join([f"{entry.to_file_content()}\n" for entry in block]))
+        stream.writelines(f"INCLUDE '{file_name}'\n" for file_name in self.includes)
+
+    def _entries_of_type(self, entry_type: type[EntryT]) -> list[EntryT]:
+        # A copy, so that modifying the returned list does not corrupt the buckets.
+        return list(self.entries.of_type(entry_type))
+
+
+SMALL_FIELD_WIDTH = 8
+"Number of characters in a field of the small field format."
+
+LARGE_FIELD_WIDTH = 16
+"Number of characters in a data field of the large field format."
+
+_WRITE_BLOCK_SIZE = 1024
+"Number of entries formatted before writing their lines to a stream."
+
+_CONTINUATION_COLUMN = 72
+"Index of the column where the continuation marker of a fixed format line starts."
+
+_DATA_FIELDS_PER_LINE = 8
+"Number of data fields in a small field line, which are followed by the continuation marker."
+
+_LARGE_DATA_FIELDS_PER_LINE = 4
+"Number of data fields in a large field line, which are followed by the continuation marker."
+
+_CONTINUATION_LEADERS = ("", "+", "*")
+"First characters of the leading field of continuation lines. A blank leading field is empty."
+
+_BLOCK_TABLE_TYPES: dict[str, type[_BulkDataTable]] = {
+    table_type._entry_type.identifyer.ljust(SMALL_FIELD_WIDTH): table_type  # noqa: SLF001
+    for table_type in (CrodTable, GridTable, Mat1Table, ProdTable)
+}
+"Tables decoding blocks of cards by the padded identifyer in the first field of the cards."
+
+_MIN_BLOCK_LENGTH = 16
+"""Number of consecutive cards of one type from which on they are decoded as a block. Decoding
+shorter runs column by column is slower than reading their cards one by one."""
+
+_MAX_BLOCK_LENGTH = 65_536
+"Number of cards after which a block is decoded, so only one block of lines is held in memory."
+
+
+_INCLUDE = "INCLUDE"
+
+_IGNORED_ENTRY_IDENTIFYERS = frozenset({"SOL", "CEND", "BEGIN", "ENDDATA", "PARAM", _INCLUDE})
+"Identifyers of lines in the bulk data section, that do not describe an entry of the model."
+
+
+def _entry_identifyer(line: str) -> str:
+    return line.strip().split(" ")[0].split(",")[0].strip()
+
+
+def _is_include(fields: list[str]) -> bool:
+    return _entry_identifyer(fields[0]) == _INCLUDE
+
+
+def _include_file_name(fields: list[str]) -> str:
+    """Extract the file name of an INCLUDE statement, which may be continued on several lines."""
+    statement = "".join(fields).strip()[len(_INCLUDE) :].strip()
+    if statement[:1] in ("'", '"'):
+        return statement[1:].partition(statement[0])[0]
+    return statement
+
+
+def _entry_from_lines(lines: list[str]) -> _BulkDataEntry | None:
+    """Construct the entry described by the lines of a card or None if it should be ignored."""
+    return _entry_from_fields(next(_cards(lines), []))
+
+
+def _entry_from_fields(fields: list[str]) -> _BulkDataEntry | None:
+    """Construct the entry described by the fields of a card or None if it should be ignored."""
+    leading_field = fields[0] if fields else ""
+    entry_class = entry_class_for(leading_field)
+
+    if entry_class is None:
+        entry_identifyer = _entry_identifyer(leading_field).removesuffix("*")
+        entry_class = entry_class_for(entry_identifyer)
+
+        if entry_class is None:
+            if entry_identifyer in _IGNORED_ENTRY_IDENTIFYERS:
+                return None
+            raise EntryIdentifyerNotSupportedError(entry_identifyer)
+
+    return entry_class.from_file_content(fields)
+
+
+def _blocks_and_cards(
+    lines: Iterable[str],
+) -> Iterator[tuple[type[_BulkDataTable], list[str]] | tuple[None, list[str]]]:
+    """Group runs of single line small field cards of one type with a table into blocks.
+
+    Blocks are yielded as their table type and their lines. All other cards, including runs that
+    are shorter than _MIN_BLOCK_LENGTH, are yielded as None and their fields, see _cards. Blocks
+    and cards are yielded in the order of the lines.
+    """
+    run_type: type[_BulkDataTable] | None = None
+    run: list[str] = []
+    "Lines of consecutive cards, which are either all in a block of run_type or all not in a block."
+
+    for line in lines:
+        if not line or line.isspace():
+            continue
+
+        table_type = None if "," in line else _BLOCK_TABLE_TYPES.get(line[:SMALL_FIELD_WIDTH])
+        if table_type is not None and table_type is run_type and len(run) < _MAX_BLOCK_LENGTH:
+            run.append(line)
+        elif table_type is not None or run_type is not None:
+            # A continuation line turns the last card of a block into a card of several lines.
+            first_line = run.pop() if table_type is None and _continues_card(line) else None
+            yield from _run_as_blocks_and_cards(run_type, run)
+            run_type = table_type
+            run = [line] if first_line is None else [first_line, line]
+        else:
+            run.append(line)
+
+    yield from _run_as_blocks_and_cards(run_type, run)
+
+
+def _run_as_blocks_and_cards(
+    run_type: type[_BulkDataTable] | None, run: list[str]
+) -> Iterator[tuple[type[_BulkDataTable], list[str]] | tuple[None, list[str]]]:
+    if run_type is not None and len(run) >= _MIN_BLOCK_LENGTH:
+        yield run_type, run
+    else:
+        for fields in _cards(run):
+            yield None, fields
+
+
+def _cards(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Assemble the lines into cards and yield the fields of one card after another.
+
+    A card is continued on every following line whose first field starts with "+" or "*" or is
+    blank. The data fields of a continuation line are appended to the fields of the card, after the
+    previous line has been brought to its 8 data fields (4 in the large field format): the
+    continuation marker at its end is removed and trailing blank fields left out are added as empty
+    fields. Every line is only visited once, so the time needed grows linearly with the number of
+    fields even for very long cards. Lines without any content are skipped.
+    """
+    card: list[str] | None = None
+    last_line_start = 0
+    "Index in the card of the first data field of the line read last."
+    last_line_width = _DATA_FIELDS_PER_LINE
+    "Number of data fields of the line read last."
+
+    for line in lines:
+        if not line or line.isspace():
+            continue
+
+        fields = _split_line(line)
+        if card is not None and fields[0].lstrip()[:1] in _CONTINUATION_LEADERS:
+            last_line_end = last_line_start + last_line_width
+            del card[last_line_end:]
+            card += [""] * (last_line_end - len(card))
+            last_line_start = len(card)
+            last_line_width = _data_fields_per_line(fields[0])
+            card += fields[1:]
+            continue
+
+        if card is not None:
+            yield card
+        card = fields
+        last_line_start = 1
+        last_line_width = _data_fields_per_line(fields[0])
+
+    if card is not None:
+        yield card
+
+
+def _data_fields_per_line(leading_field: str) -> int:
+    """Return the number of data fields of a line, which is smaller in the large field format.
+
+    Large field cards and their continuation lines are marked with a "*" in the leading field.
+    """
+    return _LARGE_DATA_FIELDS_PER_LINE if "*" in leading_field else _DATA_FIELDS_PER_LINE
+
+
+def _continues_card(line: str) -> bool:
+    """Return whether a line is a continuation line or blank, so a card might continue after it."""
+    leading_field = line[:SMALL_FIELD_WIDTH].partition(",")[0]
+    return leading_field.lstrip()[:1] in _CONTINUATION_LEADERS
+
+
+def _split_line(line: str) -> list[str]:
+    """Split a line in small field, large field or free field format.
+
+    The first field of the result is the identifyer or continuation marker, all further fields are
+    data fields.
+    """
+    if "," in line:
+        return _split_free_line(line)
+    if "*" in line[:SMALL_FIELD_WIDTH]:
+        return _split_large_line(line)
+    return _split_short_line(line)
 
 
 def _split_short_line(line: str) -> list[str]:
-    return [line[i : i + 8] for i in range(0, len(line), 8)]
+    return [line[i : i + SMALL_FIELD_WIDTH] for i in range(0, len(line), SMALL_FIELD_WIDTH)]
+
+
+def _split_large_line(line: str) -> list[str]:
+    # Columns 73-80 only contain the continuation marker.
+    data = line[SMALL_FIELD_WIDTH:_CONTINUATION_COLUMN]
+    return [
+        line[:SMALL_FIELD_WIDTH],
+        *(data[i : i + LARGE_FIELD_WIDTH] for i in range(0, len(data), LARGE_FIELD_WIDTH)),
+    ]
+
+
+def _split_free_line(line: str) -> list[str]:
+    fields = line.rstrip().split(",")
+    data_fields_per_line = _data_fields_per_line(fields[0])
+    if len(fields) > data_fields_per_line + 2:
+        raise TooManyFreeFieldsError(line, data_fields_per_line)
+    # Drop the continuation marker following the data fields.
+    return fields[: data_fields_per_line + 1]
 
 
 class EntryIdentifyerNotSupportedError(Exception):
@@ -95,3 +399,20 @@ class EntryIdentifyerNotSupportedError(Exception):
 
     def __init__(self, entry_identifyer: str) -> None:
         super().__init__(f"{entry_identifyer} is not a supported entry type.")
+
+
+class EntryTypeWithoutSetError(TypeError):
+    """Raised when looking up the entries of a set for an entry type without a set id."""
+
+    def __init__(self, entry_type: type[_BulkDataEntry]) -> None:
+        super().__init__(f"{entry_type.__name__} entries do not belong to a set.")
+
+
+class TooManyFreeFieldsError(ValueError):
+    """Raised when a free field line contains more fields than fit on a single line of a card."""
+
+    def __init__(self, line: str, data_fields_per_line: int) -> None:
+        super().__init__(
+            f"A free field line can contain at most {data_fields_per_line} data fields and a "
+            f"continuation marker: {line}"
+        )
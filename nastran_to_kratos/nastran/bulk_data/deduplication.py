@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import dataclasses
+import math
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any
+
+from .bulk_data_section import BulkDataSection
+from .entries import Conrod, Crod, Mat1, Prod, _BulkDataEntry
+
+_DistinctEntry = tuple[float, int, int, list[float]]
+"The first real field, the position, the id and all real fields of an entry kept by deduplicate."
+
+
+@dataclass
+class DeduplicationReport:
+    """The entries merged by deduplicate and the reduction of the number of entries."""
+
+    mat1_ids: dict[int, int] = field(default_factory=dict)
+    "Material identification numbers of removed MAT1 entries and the MAT1 replacing them."
+
+    prod_ids: dict[int, int] = field(default_factory=dict)
+    "Property identification numbers of removed PROD entries and the PROD replacing them."
+
+    mat1s_before: int = 0
+    "Number of MAT1 entries before the deduplication."
+
+    prods_before: int = 0
+    "Number of PROD entries before the deduplication."
+
+    @property
+    def mat1s_after(self) -> int:
+        """Return the number of MAT1 entries after the deduplication."""
+        return self.mat1s_before - len(self.mat1_ids)
+
+    @property
+    def prods_after(self) -> int:
+        """Return the number of PROD entries after the deduplication."""
+        return self.prods_before - len(self.prod_ids)
+
+    def summary(self) -> str:
+        """Return a single line describing the reduction of the number of entries."""
+        return (
+            f"MAT1: {self.mat1s_before} -> {self.mat1s_after}, "
+            f"PROD: {self.prods_before} -> {self.prods_after}"
+        )
+
+
+def deduplicate(
+    bulk_data: BulkDataSection, rel_tolerance: float = 0.0
+) -> tuple[BulkDataSection, DeduplicationReport]:
+    """Merge MAT1 and PROD entries, that only differ by their identification number.
+
+    Of every group of identical entries the first one is kept and all references to the others are
+    changed to it: the mid of PRODs and CONRODs and the pid of CRODs. MAT1s are merged first, so
+    PRODs that referenced identical materials become identical as well. The returned section
+    contains all other entries of bulk_data unchanged and in the same order.
+
+    Args:
+        bulk_data: the section to deduplicate. It is not modified.
+        rel_tolerance: the relative difference up to which two real fields are considered equal,
+            like in math.isclose. By default, real fields must be exactly equal.
+
+    """
+    if not 0 <= rel_tolerance < 1:
+        raise InvalidToleranceError(rel_tolerance)
+
+    mat1s = bulk_data.mat1s
+    mat1_ids = _canonical_ids(mat1s, rel_tolerance)
+    prods = [_remapped(prod, "mid", mat1_ids) for prod in bulk_data.prods]
+    prod_ids = _canonical_ids(prods, rel_tolerance)
+    remapped_prods = {
+        id(prod): remapped_prod for prod, remapped_prod in zip(bulk_data.prods, prods, strict=True)
+    }
+
+    entries: list[_BulkDataEntry] = []
+    for entry in bulk_data.entries:
+        if isinstance(entry, Mat1):
+            if entry.mid not in mat1_ids:
+                entries.append(entry)
+        elif isinstance(entry, Prod):
+            if entry.pid not in prod_ids:
+                entries.append(remapped_prods[id(entry)])
+        elif isinstance(entry, Crod):
+            entries.append(_remapped(entry, "pid", prod_ids))
+        elif isinstance(entry, Conrod):
+            entries.append(_remapped(entry, "mid", mat1_ids))
+        else:
+            entries.append(entry)
+
+    report = DeduplicationReport(
+        mat1_ids=mat1_ids,
+        prod_ids=prod_ids,
+        mat1s_before=len(mat1s),
+        prods_before=len(prods),
+    )
+    return BulkDataSection(entries=entries, includes=list(bulk_data.includes)), report
+
+
+def _remapped(entry: Any, name: str, ids: dict[int, int]) -> Any:  # noqa: ANN401
+    """Return the entry with the id in the field name replaced, if it is in ids."""
+    canonical_id = ids.get(getattr(entry, name))
+    if canonical_id is None:
+        return entry
+    return dataclasses.replace(entry, **{name: canonical_id})
+
+
+def _canonical_ids(entries: Sequence[_BulkDataEntry], rel_tolerance: float) -> dict[int, int]:
+    """Return the ids of all entries equal to an earlier entry and the id of that earlier entry.
+
+    The id is the first field of an entry, all other fields are compared. Only real fields may
+    differ by the tolerance, all other fields must be equal.
+    """
+    if rel_tolerance == 0:
+        return _canonical_ids_exact(entries)
+    return _canonical_ids_close(entries, rel_tolerance)
+
+
+def _canonical_ids_exact(entries: Sequence[_BulkDataEntry]) -> dict[int, int]:
+    canonical_ids: dict[int, int] = {}
+    first_ids: dict[tuple, int] = {}
+    for entry in entries:
+        entry_id, *values = entry._field_values()  # noqa: SLF001
+        first_id = first_ids.setdefault(tuple(values), entry_id)
+        if first_id != entry_id:
+            canonical_ids[entry_id] = first_id
+    return canonical_ids
+
+
+def _canonical_ids_close(entries: Sequence[_BulkDataEntry], rel_tolerance: float) -> dict[int, int]:
+    """Compare each entry only with the earlier distinct entries close in their first real field.
+
+    The distinct entries are grouped by their fields that must be exactly equal and sorted by their
+    first real field within each group, so the candidates are found by bisection.
+    """
+    canonical_ids: dict[int, int] = {}
+    groups: dict[tuple, list[_DistinctEntry]] = {}
+    for position, entry in enumerate(entries):
+        entry_id, *values = entry._field_values()  # noqa: SLF001
+        reals = [value for value in values if isinstance(value, float)]
+        exact_values = tuple(float if isinstance(value, float) else value for value in values)
+        distinct_entries = groups.setdefault(exact_values, [])
+
+        first_real = reals[0] if reals else 0.0
+        # Every b with math.isclose(first_real, b) lies within this distance of first_real.
+        distance = rel_tolerance * abs(first_real) / (1 - rel_tolerance)
+        canonical_id = None
+        canonical_position = len(entries)
+        for i in range(
+            bisect_left(distinct_entries, first_real - distance, key=itemgetter(0)),
+            len(distinct_entries),
+        ):
+            other_first_real, other_position, other_id, other_reals = distinct_entries[i]
+            if other_first_real > first_real + distance:
+                break
+            if other_position < canonical_position and all(
+                math.isclose(a, b, rel_tol=rel_tolerance)
+                for a, b in zip(reals, other_reals, strict=True)
+            ):
+                canonical_id, canonical_position = other_id, other_position
+
+        if canonical_id is None:
+            insort(distinct_entries, (first_real, position, entry_id, reals), key=itemgetter(0))
+        else:
+            canonical_ids[entry_id] = canonical_id
+    return canonical_ids
+
+
+class InvalidToleranceError(ValueError):
+    """Raised when the relative tolerance of a deduplication is not in the interval [0, 1)."""
+
+    def __init__(self, rel_tolerance: float) -> None:
+        super().__init__(f"The relative tolerance must be at least 0 and below 1: {rel_tolerance}")
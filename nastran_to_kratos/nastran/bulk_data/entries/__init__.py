@@ -1,6 +1,11 @@
 """For each supported entry type (like CROD, GRID, ...) one class exists in this package."""
 
-from ._bulk_data_entry import _BulkDataEntry
+from ._bulk_data_entry import (
+    FieldTooLongError,
+    MissingRequiredFieldError,
+    _BulkDataEntry,
+    entry_class_for,
+)
 from .conrod import Conrod
 from .crod import Crod
 from .force import Force
@@ -10,4 +15,17 @@ from .prod import Prod
 from .rbe2 import Rbe2
 from .spc import Spc
 
-__all__ = ["Conrod", "Crod", "Force", "Grid", "Mat1", "Prod", "Rbe2", "Spc", "_BulkDataEntry"]
+__all__ = [
+    "Conrod",
+    "Crod",
+    "FieldTooLongError",
+    "Force",
+    "Grid",
+    "Mat1",
+    "MissingRequiredFieldError",
+    "Prod",
+    "Rbe2",
+    "Spc",
+    "_BulkDataEntry",
+    "entry_class_for",
+]
@@ -1,55 +1,134 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from collections.abc import Callable, Mapping
+from dataclasses import MISSING, dataclass, fields
+from typing import Any, ClassVar, NamedTuple, NoReturn, TypeVar, overload
 
-T = TypeVar("T")
+from nastran_to_kratos.nastran.bulk_data.real_numbers import format_real
+
+EntryT = TypeVar("EntryT", bound="_BulkDataEntry")
+
+_FIELD_WIDTH = 8
+_BLANK_FIELD = " " * _FIELD_WIDTH
+
+REQUIRED: Any = object()
+"Default value of fields, that must be present in an entry."
+
+
+class _Field(NamedTuple):
+    """Description of how a single field of an entry is read."""
+
+    field_index: int
+    "Index of the field in the list of fields of the entry."
+
+    parse: Callable[[str], Any]
+    "Function converting the stripped field string into its value (like int, parse_real, str, ...)."
+
+    default: Any = REQUIRED
+    "Value used if the field is blank or not present at all."
+
+
+class _FieldSchema:
+    """The fields of an entry type, in the order of the arguments of the entry class.
+
+    On construction the schema is compiled into a function, that reads all fields in a single
+    expression without looping over the field descriptions for every entry.
+    """
+
+    def __init__(self, *fields: _Field) -> None:
+        self.fields = fields
+        self.decode = _compile_decoder(fields)
+        """Convert the fields of an entry into the arguments of its entry class.
+
+        Most fields in nastran are optional. In that case they are either not present at all or just
+        entirely blank spaces and the default value of the field is used instead.
+
+        Raises:
+            MissingRequiredFieldError: if a field without a default value is blank or not present.
+        """
+
+
+def _compile_decoder(fields: tuple[_Field, ...]) -> Callable[[list[str]], tuple]:
+    field_count = max((field.field_index for field in fields), default=0) + 1
+    namespace: dict[str, Any] = {"_missing": _raise_missing_required_field}
+    source = [
+        "def decode(raw_entry):",
+        f"    if len(raw_entry) < {field_count}:",
+        f"        raw_entry = [*raw_entry, *[''] * ({field_count} - len(raw_entry))]",
+        "    return (",
+    ]
+    for i, (field_index, parse, default) in enumerate(fields):
+        namespace[f"parse_{i}"] = parse
+        namespace[f"default_{i}"] = default
+        fallback = f"_missing(raw_entry, {field_index})" if default is REQUIRED else f"default_{i}"
+        field = f"(field := raw_entry[{field_index}].strip())"
+        source.append(f"        parse_{i}(field) if {field} else {fallback},")
+    source.append("    )")
+
+    exec("\n".join(source), namespace)  # noqa: S102
+    return namespace["decode"]
+
+
+def _raise_missing_required_field(raw_entry: list[str], field_index: int) -> NoReturn:
+    raise MissingRequiredFieldError(raw_entry, field_index)
+
+
+_ENTRY_CLASS_MAPPING: dict[str, type[_BulkDataEntry]] = {}
+"""All supported entry classes by their identifyer. Every identifyer is additionally stored padded to
+the width of a small field, so the first 8 characters of a line can be looked up directly."""
+
+
+def entry_class_for(identifyer: str) -> type[_BulkDataEntry] | None:
+    """Return the entry class registered for an identifyer like "GRID" or None if it is unknown."""
+    return _ENTRY_CLASS_MAPPING.get(identifyer)
 
 
 class _BulkDataEntry(ABC):
     """The template for any single nastran element.
 
+    Subclasses setting an `identifyer` are registered automatically and are read by the bulk data
+    section without further changes. The fields are read as described by the `_schema` of the
+    subclass, unless it overrides from_file_content. Subclasses are declared with
+    `@_entry_dataclass`, which makes them slotted dataclasses with a cached hash.
+
     This class should not be used directly.
     """
 
-    @classmethod
-    @abstractmethod
-    def from_file_content(cls, file_content: list[str]) -> _BulkDataEntry:
-        """Create this class from the relevant entry in a nastran file."""
+    __slots__ = ("_cached_hash",)
+    _cached_hash: int | None
 
-    @classmethod
-    def _read_optional_field(
-        cls,
-        raw_entry: list[str],
-        field_index: int,
-        target_class: type[T],
-        default_value: T,
-    ) -> T:
-        """Read an optional field from a nastran entry.
+    identifyer: ClassVar[str]
+    "The name of the entry in the first field of a line, like GRID or CROD."
 
-        Most fields in nastran are optional. In that case they are either not present at all or just
-        entirely blank spaces. If a field exists and has content, this function strips the raw field
-        string of all blank spaces and converts it to the respective class (like int, float, str,
-        ...). If not, a default value is returned (like None, 0.0, ...).
+    set_id_field: ClassVar[str | None] = None
+    """Name of the field containing the id of the set the entry belongs to, like the load set of a
+    FORCE. The bulk data section indexes the entries of such types by their set id."""
 
-        Args:
-            raw_entry: entire list of fields in the entry, that is also passed to read()
-            field_index: index of the relevant field in the raw entry
-            target_class: class this entry should be parsed into if it is present
-            default_value (T): default value to be returned if the field is not present
+    id_field: ClassVar[str | None] = None
+    "Name of the field containing the identification number, that other entries refer to."
 
-        Returns:
-            either the string parsed into the target class or the default value
+    references: ClassVar[Mapping[str, str]] = {}
+    """Names of the fields referring to other entries and the identifyers of the entries they refer
+    to, like {"g1": "GRID"}. Fields may contain a single identification number or a list of them."""
 
-        """
-        try:
-            field_is_empty = raw_entry[field_index] in ["", " " * 8]
-        except IndexError:
-            field_is_empty = True
+    _schema: ClassVar[_FieldSchema] = _FieldSchema()
 
-        if field_is_empty:
-            return default_value
-        return target_class(raw_entry[field_index].strip())
+    _field_values: ClassVar[Callable[[Any], tuple]]
+    "Return the values of all fields of an entry in the order of the arguments of the class."
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Register every subclass with an identifyer, so that lines of its type can be read."""
+        super().__init_subclass__(**kwargs)
+        identifyer = cls.__dict__.get("identifyer")
+        if identifyer is not None:
+            _ENTRY_CLASS_MAPPING[identifyer] = cls
+            _ENTRY_CLASS_MAPPING[identifyer.ljust(8)] = cls
+
+    @classmethod
+    def from_file_content(cls: type[EntryT], file_content: list[str]) -> EntryT:  # noqa: PYI019
+        """Create this class from the fields of the relevant entry in a nastran file."""
+        return cls(*cls._schema.decode(file_content))
 
     @abstractmethod
     def to_file_content(self) -> str:
@@ -57,18 +136,130 @@ class _BulkDataEntry(ABC):
         raise NotImplementedError
 
     def _fields_to_line(self, fields: list[str | float | None]) -> str:
-        line = ""
-        for field in fields:
-            if field is None:
-                line += " " * 8
-            else:
-                field_string = str(field)
-                if field_string.endswith(".0"):
-                    field_string = field_string[:-2]
-
-                line += field_string.rjust(8)
-        return line.rstrip()
+        """Join the fields into the data fields of a small field line, reals as by format_real.
+
+        Raises:
+            FieldTooLongError: if an integer or a string does not fit into a field.
+
+        """
+        return "".join(
+            [self._format_field(field_index, field) for field_index, field in enumerate(fields, 1)]
+        ).rstrip()
+
+    def _format_field(self, field_index: int, field: str | float | None) -> str:
+        if field is None:
+            return _BLANK_FIELD
+        text = format_real(field) if isinstance(field, float) else str(field)
+        if len(text) > _FIELD_WIDTH:
+            raise FieldTooLongError(self.identifyer, field_index, text)
+        return text.rjust(_FIELD_WIDTH)
 
-    @abstractmethod
     def __hash__(self) -> int:
-        raise NotImplementedError
+        """Return a hash of the fields of this instance, which is computed only once."""
+        cached_hash = self._cached_hash
+        if cached_hash is None:
+            values = self._field_values()
+            try:
+                cached_hash = hash(values)
+            except TypeError:
+                cached_hash = hash(
+                    tuple(tuple(value) if isinstance(value, list) else value for value in values)
+                )
+            _set_cached_hash(self, cached_hash)
+        return cached_hash
+
+
+_set_cached_hash = _BulkDataEntry.__dict__["_cached_hash"].__set__
+
+
+@overload
+def _entry_dataclass(cls: type[EntryT], /) -> type[EntryT]: ...
+
+
+@overload
+def _entry_dataclass(*, frozen: bool = False) -> Callable[[type[EntryT]], type[EntryT]]: ...
+
+
+def _entry_dataclass(
+    cls: type[EntryT] | None = None, /, *, frozen: bool = False
+) -> type[EntryT] | Callable[[type[EntryT]], type[EntryT]]:
+    """Turn an entry class into a slotted dataclass, whose hash is computed only once.
+
+    Slots remove the dictionary of every instance, which roughly halves the memory of an entry.
+    The hash is computed on first use and then stored in the entry, so entries must not be modified
+    once they have been hashed (by putting them into a set or using them as keys of a dictionary).
+    Use dataclasses.replace to change the fields of an entry instead.
+
+    With frozen=True, modifying the fields raises an error. Creating frozen entries is two to three
+    times slower, as every slot has to be written through a descriptor, which is why the entries of
+    this package are not frozen.
+    """
+
+    def wrap(cls: type[EntryT]) -> type[EntryT]:
+        cls = dataclass(slots=True, frozen=frozen)(cls)
+        cls.__init__, cls._field_values = _compile_methods(cls, frozen=frozen)  # type: ignore[method-assign]
+        cls.__hash__ = _BulkDataEntry.__hash__  # type: ignore[method-assign]
+        cls.__reduce__ = _reduce_entry  # type: ignore[assignment,method-assign]
+        return cls
+
+    return wrap if cls is None else wrap(cls)
+
+
+def _reduce_entry(entry: _BulkDataEntry) -> tuple[type[_BulkDataEntry], tuple]:
+    """Pickle only the fields of an entry, as hashes of strings differ between processes."""
+    return type(entry), entry._field_values()  # noqa: SLF001
+
+
+def _compile_methods(
+    cls: type[_BulkDataEntry], *, frozen: bool
+) -> tuple[Callable[..., None], Callable[[Any], tuple]]:
+    """Return an __init__, that also resets the cached hash, and a function returning the fields.
+
+    The __init__ of frozen dataclasses would set every field through object.__setattr__, so the
+    __init__ of frozen entries writes the slots through their descriptors instead.
+    """
+    namespace: dict[str, Any] = {"set_cached_hash": _set_cached_hash}
+    parameters = ["self"]
+    body = ["    set_cached_hash(self, None)" if frozen else "    self._cached_hash = None"]
+    for i, field in enumerate(fields(cls)):  # type: ignore[arg-type]
+        if field.default_factory is not MISSING:
+            msg = f"The field {field.name} of an entry must not have a default factory."
+            raise TypeError(msg)
+        if field.default is MISSING:
+            parameters.append(field.name)
+        else:
+            namespace[f"default_{i}"] = field.default
+            parameters.append(f"{field.name}=default_{i}")
+        if frozen:
+            namespace[f"set_{i}"] = getattr(cls, field.name).__set__
+            body.append(f"    set_{i}(self, {field.name})")
+        else:
+            body.append(f"    self.{field.name} = {field.name}")
+
+    values = "".join(f"self.{field.name}, " for field in fields(cls))  # type: ignore[arg-type]
+    source = [
+        f"def __init__({', '.join(parameters)}):",
+        *body,
+        "def field_values(self):",
+        f"    return ({values})",
+    ]
+    exec("\n".join(source), namespace)  # noqa: S102
+    namespace["__init__"].__qualname__ = f"{cls.__qualname__}.__init__"
+    return namespace["__init__"], namespace["field_values"]
+
+
+class FieldTooLongError(ValueError):
+    """Raised when the value of a field does not fit into the 8 characters of a small field."""
+
+    def __init__(self, identifyer: str, field_index: int, text: str) -> None:
+        super().__init__(
+            f"Field {field_index} of {identifyer} does not fit into 8 characters: {text}"
+        )
+
+
+class MissingRequiredFieldError(ValueError):
+    """Raised when a field, that must be present in an entry, is blank or missing."""
+
+    def __init__(self, raw_entry: list[str], field_index: int) -> None:
+        identifyer = raw_entry[0].strip() if raw_entry else ""
+        super().__init__(f"Field {field_index} of {identifyer} must not be empty.")
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import ClassVar
 
-from ._bulk_data_entry import _BulkDataEntry
+from nastran_to_kratos.nastran.bulk_data.real_numbers import parse_real
 
+from ._bulk_data_entry import _BulkDataEntry, _entry_dataclass, _Field, _FieldSchema
 
-@dataclass
+
+@_entry_dataclass
 class Conrod(_BulkDataEntry):
     """A tension-compression-torsion element."""
 
+    identifyer: ClassVar[str] = "CONROD"
+    id_field: ClassVar[str | None] = "eid"
+    references: ClassVar[Mapping[str, str]] = {"g1": "GRID", "g2": "GRID", "mid": "MAT1"}
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(
+        _Field(1, int),
+        _Field(2, int),
+        _Field(3, int),
+        _Field(4, int),
+        _Field(5, parse_real),
+        _Field(6, parse_real, None),
+        _Field(7, parse_real, None),
+        _Field(8, parse_real, None),
+    )
+
     eid: int
     """Element identification number."""
 
@@ -29,27 +46,8 @@ class Conrod(_BulkDataEntry):
     nsm: float | None = None
     """Nonstructural mass per unit length. (Real)"""
 
-    @classmethod
-    def from_file_content(cls, file_content: list[str]) -> Conrod:
-        """Construct a CONTROD from the entry in a nastran file."""
-        return Conrod(
-            eid=int(file_content[1]),
-            g1=int(file_content[2]),
-            g2=int(file_content[3]),
-            mid=int(file_content[4]),
-            a=float(file_content[5]),
-            j=cls._read_optional_field(file_content, 6, float, None),
-            c=cls._read_optional_field(file_content, 7, float, None),
-            nsm=cls._read_optional_field(file_content, 8, float, None),
-        )
-
     def to_file_content(self) -> str:
-        """Export this Crod into a line for saving to a nastran file."""
-        return "CONROD    " + self._fields_to_line(
+        """Export this Conrod into a line for saving to a nastran file."""
+        return "CONROD  " + self._fields_to_line(
             [self.eid, self.g1, self.g2, self.mid, self.a, self.j, self.c, self.nsm]
         )
-
-    def __hash__(self) -> int:
-        """Return a hash of this instance."""
-        attributes = tuple(sorted(vars(self).items()))
-        return hash(attributes)
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import ClassVar
 
-from ._bulk_data_entry import _BulkDataEntry
+from ._bulk_data_entry import _BulkDataEntry, _entry_dataclass, _Field, _FieldSchema
 
 
-@dataclass
+@_entry_dataclass
 class Crod(_BulkDataEntry):
     """A tension-compression-torsion element."""
 
+    identifyer: ClassVar[str] = "CROD"
+    id_field: ClassVar[str | None] = "eid"
+    references: ClassVar[Mapping[str, str]] = {"pid": "PROD", "g1": "GRID", "g2": "GRID"}
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(
+        _Field(1, int),
+        _Field(2, int),
+        _Field(3, int),
+        _Field(4, int),
+    )
+
     eid: int
     """Element identification number."""
 
@@ -21,21 +32,6 @@ class Crod(_BulkDataEntry):
     g2: int
     """Grid point identification numbers of connection point 2."""
 
-    @classmethod
-    def from_file_content(cls, file_content: list[str]) -> Crod:
-        """Construct a Crod from the entry in a nastran file."""
-        return Crod(
-            eid=int(file_content[1]),
-            pid=int(file_content[2]),
-            g1=int(file_content[3]),
-            g2=int(file_content[4]),
-        )
-
     def to_file_content(self) -> str:
         """Export this Crod into a line for saving to a nastran file."""
         return "CROD    " + self._fields_to_line([self.eid, self.pid, self.g1, self.g2])
-
-    def __hash__(self) -> int:
-        """Return a hash of this instance."""
-        attributes = tuple(sorted(vars(self).items()))
-        return hash(attributes)
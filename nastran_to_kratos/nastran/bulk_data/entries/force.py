@@ -1,14 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import ClassVar
 
-from ._bulk_data_entry import _BulkDataEntry
+from nastran_to_kratos.nastran.bulk_data.real_numbers import parse_real
 
+from ._bulk_data_entry import _BulkDataEntry, _entry_dataclass, _Field, _FieldSchema
 
-@dataclass
+
+@_entry_dataclass
 class Force(_BulkDataEntry):
     """Defines a static concentrated force at a grid point by specifying a vector."""
 
+    identifyer: ClassVar[str] = "FORCE"
+    set_id_field: ClassVar[str | None] = "sid"
+    references: ClassVar[Mapping[str, str]] = {"g": "GRID"}
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(
+        _Field(1, int),
+        _Field(2, int),
+        _Field(3, int, None),
+        _Field(4, parse_real),
+        _Field(5, parse_real),
+        _Field(6, parse_real),
+        _Field(7, parse_real),
+    )
+
     sid: int
     "Load set identification number."
 
@@ -30,19 +46,6 @@ class Force(_BulkDataEntry):
     n3: float
     "Z-Components of a vector measured in coordinate system defined by CID."
 
-    @classmethod
-    def from_file_content(cls, file_content: list[str]) -> Force:
-        """Construct a Force from the entry in a nastran file."""
-        return Force(
-            sid=int(file_content[1]),
-            g=int(file_content[2]),
-            cid=cls._read_optional_field(file_content, 3, int, None),
-            f=float(file_content[4]),
-            n1=float(file_content[5]),
-            n2=float(file_content[6]),
-            n3=float(file_content[7]),
-        )
-
     def to_file_content(self) -> str:
         """Export this Force into a line for saving to a nastran file."""
         return "FORCE   " + self._fields_to_line(
@@ -56,8 +59,3 @@ class Force(_BulkDataEntry):
                 self.n3,
             ]
         )
-
-    def __hash__(self) -> int:
-        """Return a hash of this instance."""
-        attributes = tuple(sorted(vars(self).items()))
-        return hash(attributes)
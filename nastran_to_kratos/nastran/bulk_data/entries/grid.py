@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import ClassVar
 
-from ._bulk_data_entry import _BulkDataEntry
+from nastran_to_kratos.nastran.bulk_data.real_numbers import parse_real
 
+from ._bulk_data_entry import _BulkDataEntry, _entry_dataclass, _Field, _FieldSchema
 
-@dataclass
+
+@_entry_dataclass
 class Grid(_BulkDataEntry):
     """A geometric grid point."""
 
+    identifyer: ClassVar[str] = "GRID"
+    id_field: ClassVar[str | None] = "id"
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(
+        _Field(1, int),
+        _Field(2, int, None),
+        _Field(3, parse_real, 0.0),
+        _Field(4, parse_real, 0.0),
+        _Field(5, parse_real, 0.0),
+        _Field(6, int, None),
+        _Field(7, str, None),
+        _Field(8, int, None),
+    )
+
     id: int
     """Grid point identification number."""
 
@@ -35,27 +50,8 @@ class Grid(_BulkDataEntry):
     seid: int | None = None
     """Superelement identification number."""
 
-    @classmethod
-    def from_file_content(cls, file_content: list[str]) -> Grid:
-        """Construct a Grid from the entry in a nastran file."""
-        return Grid(
-            id=int(file_content[1]),
-            cp=cls._read_optional_field(file_content, 2, int, None),
-            x1=cls._read_optional_field(file_content, 3, float, 0.0),
-            x2=cls._read_optional_field(file_content, 4, float, 0.0),
-            x3=cls._read_optional_field(file_content, 5, float, 0.0),
-            cd=cls._read_optional_field(file_content, 6, int, None),
-            ps=cls._read_optional_field(file_content, 7, str, None),
-            seid=cls._read_optional_field(file_content, 8, int, None),
-        )
-
     def to_file_content(self) -> str:
         """Export this Grid into a line for saving to a nastran file."""
         return "GRID    " + self._fields_to_line(
             [self.id, self.cp, self.x1, self.x2, self.x3, self.cd, self.ps, self.seid]
         )
-
-    def __hash__(self) -> int:
-        """Return a hash of this instance."""
-        attributes = tuple(sorted(vars(self).items()))
-        return hash(attributes)
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import ClassVar
 
-from ._bulk_data_entry import _BulkDataEntry
+from nastran_to_kratos.nastran.bulk_data.real_numbers import parse_real
 
+from ._bulk_data_entry import _BulkDataEntry, _entry_dataclass, _Field, _FieldSchema
 
-@dataclass
+
+@_entry_dataclass
 class Mat1(_BulkDataEntry):
     """Defines the material properties for linear isotropic materials."""
 
+    identifyer: ClassVar[str] = "MAT1"
+    id_field: ClassVar[str | None] = "mid"
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(
+        _Field(1, int),
+        _Field(2, parse_real, None),
+        _Field(3, parse_real, None),
+        _Field(4, parse_real, None),
+        _Field(5, parse_real, None),
+        _Field(6, parse_real, None),
+        _Field(7, parse_real, None),
+        _Field(8, parse_real, None),
+        _Field(9, parse_real, None),
+        _Field(10, parse_real, None),
+        _Field(11, parse_real, None),
+        _Field(12, int, None),
+    )
+
     mid: int
     "Material identification number."
 
@@ -46,24 +65,6 @@ class Mat1(_BulkDataEntry):
     mcsid: int | None = None
     "Material coordinate system identification number."
 
-    @classmethod
-    def from_file_content(cls, file_content: list[str]) -> Mat1:
-        """Construct a Mat1 from the entry in a nastran file."""
-        return Mat1(
-            mid=int(file_content[1]),
-            e=cls._read_optional_field(file_content, 2, float, None),
-            g=cls._read_optional_field(file_content, 3, float, None),
-            nu=cls._read_optional_field(file_content, 4, float, None),
-            rho=cls._read_optional_field(file_content, 5, float, None),
-            a=cls._read_optional_field(file_content, 6, float, None),
-            tref=cls._read_optional_field(file_content, 7, float, None),
-            ge=cls._read_optional_field(file_content, 8, float, None),
-            st=cls._read_optional_field(file_content, 9, float, None),
-            sc=cls._read_optional_field(file_content, 10, float, None),
-            ss=cls._read_optional_field(file_content, 11, float, None),
-            mcsid=cls._read_optional_field(file_content, 12, int, None),
-        )
-
     def to_file_content(self) -> str:
         """Export this Mat1 into a line for saving to a nastran file."""
         return "MAT1    " + self._fields_to_line(
@@ -82,8 +83,3 @@ class Mat1(_BulkDataEntry):
                 self.mcsid,
             ]
         )
-
-    def __hash__(self) -> int:
-        """Return a hash of this instance."""
-        attributes = tuple(sorted(vars(self).items()))
-        return hash(attributes)
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import ClassVar
 
-from ._bulk_data_entry import _BulkDataEntry
+from nastran_to_kratos.nastran.bulk_data.real_numbers import parse_real
 
+from ._bulk_data_entry import _BulkDataEntry, _entry_dataclass, _Field, _FieldSchema
 
-@dataclass
+
+@_entry_dataclass
 class Prod(_BulkDataEntry):
     """Defines the properties of a rod element (CROD entry)."""
 
+    identifyer: ClassVar[str] = "PROD"
+    id_field: ClassVar[str | None] = "pid"
+    references: ClassVar[Mapping[str, str]] = {"mid": "MAT1"}
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(
+        _Field(1, int),
+        _Field(2, int),
+        _Field(3, parse_real),
+        _Field(4, parse_real, None),
+        _Field(5, parse_real, None),
+        _Field(6, parse_real, None),
+    )
+
     pid: int
     "Property identification number."
 
@@ -27,18 +42,6 @@ class Prod(_BulkDataEntry):
     nsm: float | None = None
     "Nonstructural mass per unit length."
 
-    @classmethod
-    def from_file_content(cls, file_content: list[str]) -> Prod:
-        """Construct a Prod from the entry in a nastran file."""
-        return Prod(
-            pid=int(file_content[1]),
-            mid=int(file_content[2]),
-            a=float(file_content[3]),
-            j=cls._read_optional_field(file_content, 4, float, None),
-            c=cls._read_optional_field(file_content, 5, float, None),
-            nsm=cls._read_optional_field(file_content, 6, float, None),
-        )
-
     def to_file_content(self) -> str:
         """Export this Prod into a line for saving to a nastran file."""
         return "PROD    " + self._fields_to_line(
@@ -51,8 +54,3 @@ class Prod(_BulkDataEntry):
                 self.nsm,
             ]
         )
-
-    def __hash__(self) -> int:
-        """Return a hash of this instance."""
-        attributes = tuple(sorted(vars(self).items()))
-        return hash(attributes)
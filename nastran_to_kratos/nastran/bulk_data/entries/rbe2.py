@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import ClassVar
 
-from ._bulk_data_entry import _BulkDataEntry
+from nastran_to_kratos.nastran.bulk_data.real_numbers import format_real, parse_real
 
+from ._bulk_data_entry import _BulkDataEntry, _entry_dataclass
 
-@dataclass
+
+@_entry_dataclass
 class Rbe2(_BulkDataEntry):
     """Defines a rigid body with independent degrees-of-freedom that are specified at a single grid point and with
     dependent degrees-of-freedom that are specified at an arbitrary number of grid points.
     """  # noqa: D205, E501
 
+    identifyer: ClassVar[str] = "RBE2"
+    id_field: ClassVar[str | None] = "eid"
+    references: ClassVar[Mapping[str, str]] = {"gn": "GRID", "gmi": "GRID"}
+
     eid: int
     "Element ID"
 
@@ -31,7 +38,11 @@ class Rbe2(_BulkDataEntry):
 
     @classmethod
     def from_file_content(cls, file_content: list[str]) -> Rbe2:
-        """Parses an RBE2 card from Nastran input lines (supporting continuation lines)."""
+        """Parses an RBE2 card from Nastran input lines (supporting continuation lines).
+
+        Alpha and tref are read with parse_real, so they may be written in the notations of nastran
+        (like 1.5-5 meaning 1.5E-5).
+        """
         # Flatten and clean all fields
         flat_fields = []
         for line in file_content:
@@ -53,32 +64,31 @@ class Rbe2(_BulkDataEntry):
                 gmi.append(int(value))
             except ValueError:  # noqa: PERF203
                 if alpha is None:
-                    alpha = float(value)
+                    alpha = parse_real(value)
                 elif tref is None:
-                    tref = float(value)
+                    tref = parse_real(value)
                 else:
                     msg = f"Unexpected extra value in RBE2: {value}"
                     raise ValueError(msg)  # noqa: B904
 
         return cls(eid=eid, gn=gn, cm=cm, gmi=gmi, alpha=alpha, tref=tref)
 
-    def to_file_content(self):  # noqa: ANN201, D102
-        fields = ["RBE2", self.eid, self.gn, self.cm, *self.gmi]
-        # Convert numeric fields to strings with appropriate formatting
-        formatted_fields = []
-        for field in fields:
-            if isinstance(field, int):
-                formatted_fields.append(f"{field:8d}")
-            else:
-                formatted_fields.append(f"{field:8}")
-        # Handle alpha and tref with 8.1f format for floats
-        if self.alpha is not None:
-            formatted_fields.append(f"{self.alpha:8.1f}")
-        if self.tref is not None:
-            formatted_fields.append(f"{self.tref:8.1f}")
-        # Join all fields into a single string and ensure correct length per line
-        return "".join(formatted_fields).rstrip()
-
-    def __hash__(self) -> int:
-        """Return a hash of this instance."""
-        return hash((self.eid, self.gn, self.cm, tuple(self.gmi), self.alpha, self.tref))
+    def to_file_content(self) -> str:
+        """Export this Rbe2 into a line for saving to a nastran file.
+
+        Alpha and tref keep their decimal point, since they are told apart from the grid points by
+        it when reading the line.
+        """
+        return "RBE2    " + self._fields_to_line(
+            [
+                self.eid,
+                self.gn,
+                self.cm,
+                *self.gmi,
+                *(
+                    format_real(value, keep_point=True)
+                    for value in (self.alpha, self.tref)
+                    if value is not None
+                ),
+            ]
+        )
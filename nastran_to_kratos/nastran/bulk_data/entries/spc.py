@@ -1,14 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import ClassVar
 
-from ._bulk_data_entry import _BulkDataEntry
+from nastran_to_kratos.nastran.bulk_data.real_numbers import parse_real
 
+from ._bulk_data_entry import _BulkDataEntry, _entry_dataclass, _Field, _FieldSchema
 
-@dataclass
+
+@_entry_dataclass
 class Spc(_BulkDataEntry):
     """Defines a set of single-point constraints and enforced motion."""
 
+    identifyer: ClassVar[str] = "SPC"
+    set_id_field: ClassVar[str | None] = "sid"
+    references: ClassVar[Mapping[str, str]] = {"g1": "GRID", "g2": "GRID"}
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(
+        _Field(1, int),
+        _Field(2, int),
+        _Field(3, int),
+        _Field(4, parse_real, 0.0),
+        _Field(5, int, None),
+        _Field(6, int, None),
+        _Field(7, parse_real, None),
+    )
+
     sid: int
     "Identification number of the single-point constraint set."
 
@@ -30,19 +46,6 @@ class Spc(_BulkDataEntry):
     d2: float | None = None
     "Value of enforced motion for components g2 at grid c2."
 
-    @classmethod
-    def from_file_content(cls, file_content: list[str]) -> Spc:
-        """Construct a Spc from the entry in a nastran file."""
-        return Spc(
-            sid=int(file_content[1]),
-            g1=int(file_content[2]),
-            c1=int(file_content[3]),
-            d1=cls._read_optional_field(file_content, 4, float, 0.0),
-            g2=cls._read_optional_field(file_content, 5, int, None),
-            c2=cls._read_optional_field(file_content, 6, int, None),
-            d2=cls._read_optional_field(file_content, 7, float, None),
-        )
-
     def to_file_content(self) -> str:
         """Export this Spc into a line for saving to a nastran file."""
         return "SPC     " + self._fields_to_line(
@@ -56,8 +59,3 @@ class Spc(_BulkDataEntry):
                 self.d2,
             ]
         )
-
-    def __hash__(self) -> int:
-        """Return a hash of this instance."""
-        attributes = tuple(sorted(vars(self).items()))
-        return hash(attributes)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .bulk_data_section import BulkDataSection
+from .entries import _BulkDataEntry
+
+
+class IncludeCache:
+    """Included files that have already been parsed, kept between reads of a model.
+
+    Every included file is cached on its own and parsed again only once its modification time or
+    size changes, so that editing the loads of a model does not require parsing its mesh again.
+    The sections are only kept in memory, ParseCache also keeps them between processes.
+    """
+
+    def __init__(self) -> None:
+        self._sections: dict[Path, tuple[tuple[int, int], BulkDataSection]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        return len(self._sections)
+
+    def __iter__(self) -> Iterator[Path]:
+        """Iterate over the paths of the cached files."""
+        return iter(self._sections)
+
+    def get(self, path: Path) -> BulkDataSection | None:
+        """Return the section parsed from a file or None if it is not cached or has changed."""
+        cached = self._sections.get(path)
+        if cached is None or cached[0] != _file_signature(path):
+            return None
+        return cached[1]
+
+    def put(self, path: Path, section: BulkDataSection) -> None:
+        """Store the section parsed from a file."""
+        self._sections[path] = (_file_signature(path), section)
+
+
+def resolve_includes(
+    bulk_data: BulkDataSection,
+    directory: Path,
+    cache: IncludeCache | None = None,
+    max_workers: int | None = 1,
+) -> BulkDataSection:
+    """Return a section with the entries of bulk_data and of all files included by it.
+
+    The entries of an included file follow the entries of the including file, in the order of the
+    INCLUDE statements. With more than one worker, included files are parsed concurrently in a pool
+    of processes, level by level, since the files included by a file are only known after it has
+    been parsed. File names are relative to the directory of the including file.
+
+    Args:
+        bulk_data: the section containing the INCLUDE statements.
+        directory: the directory the file names of the INCLUDE statements in bulk_data refer to.
+        cache: sections of files parsed before. Files that are parsed are added to it.
+        max_workers: the maximum number of processes parsing files at the same time. None stands
+            for the number of processors of the machine. By default, the files are parsed one after
+            another in the calling process.
+
+    Raises:
+        CyclicIncludeError: if a file includes itself directly or indirectly.
+
+    """
+    if cache is None:
+        cache = IncludeCache()
+
+    sections: dict[Path, BulkDataSection] = {}
+    pending = [_include_path(directory, file_name) for file_name in bulk_data.includes]
+    while pending:
+        unparsed = []
+        for path in dict.fromkeys(pending):
+            if path in sections:
+                continue
+            cached_section = cache.get(path)
+            if cached_section is None:
+                unparsed.append(path)
+            else:
+                sections[path] = cached_section
+
+        for path, section in zip(unparsed, _parse_files(unparsed, max_workers), strict=True):
+            cache.put(path, section)
+            sections[path] = section
+
+        pending = [
+            _include_path(path.parent, file_name)
+            for path in pending
+            for file_name in sections[path].includes
+            if _include_path(path.parent, file_name) not in sections
+        ]
+
+    entries = list(bulk_data.entries)
+    for file_name in bulk_data.includes:
+        _add_included_entries(entries, _include_path(directory, file_name), sections, ())
+    return BulkDataSection(entries=entries)
+
+
+def _parse_files(paths: list[Path], max_workers: int | None) -> list[BulkDataSection]:
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if len(paths) <= 1 or max_workers == 1:
+        return [BulkDataSection.from_path(path) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(BulkDataSection.from_path, paths))
+
+
+def _add_included_entries(
+    entries: list[_BulkDataEntry],
+    path: Path,
+    sections: dict[Path, BulkDataSection],
+    including_paths: tuple[Path, ...],
+) -> None:
+    if path in including_paths:
+        raise CyclicIncludeError([*including_paths, path])
+
+    section = sections[path]
+    entries.extend(section.entries)
+    for file_name in section.includes:
+        _add_included_entries(
+            entries, _include_path(path.parent, file_name), sections, (*including_paths, path)
+        )
+
+
+def _include_path(directory: Path, file_name: str) -> Path:
+    return (directory / file_name).resolve()
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class CyclicIncludeError(Exception):
+    """Raised when a file includes itself directly or through other included files."""
+
+    def __init__(self, paths: list[Path]) -> None:
+        super().__init__(f"Cyclic include: {' -> '.join(str(path) for path in paths)}")
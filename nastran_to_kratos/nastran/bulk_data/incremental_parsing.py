@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from .bulk_data_section import (
+    BulkDataSection,
+    _cards,
+    _continues_card,
+    _entry_from_fields,
+    _include_file_name,
+    _is_include,
+)
+from .entries import _BulkDataEntry
+
+_ParsedCard = tuple[_BulkDataEntry | None, str | None]
+"The entry described by a card and the file name, if the card is an INCLUDE statement."
+
+
+@dataclass
+class ChangeSet:
+    """The differences between the entries of two parses of a bulk data section."""
+
+    added: list[_BulkDataEntry] = field(default_factory=list)
+    "Entries of cards that were not present in the previous parse."
+
+    removed: list[_BulkDataEntry] = field(default_factory=list)
+    "Entries of cards of the previous parse that are not present anymore."
+
+    unchanged: int = 0
+    "Number of cards, that were taken from the previous parse without decoding them."
+
+    def is_empty(self) -> bool:
+        """Return whether no entry has been added or removed."""
+        return not self.added and not self.removed
+
+
+class IncrementalParser:
+    """Parses a bulk data section again and again, only decoding the cards that changed.
+
+    The text of every card is remembered together with the entry decoded from it. When parsing
+    again, each card is looked up by its text and only cards that were not present in the previous
+    parse are decoded, so the time for parsing a large section after editing a few cards is
+    dominated by reading the lines. Unchanged cards share their entry with the previous parse.
+    A card repeated with the same text is counted per occurrence: the n-th occurrence is only
+    unchanged if the previous parse contained the card at least n times, and every occurrence has
+    an entry of its own.
+
+    Example:
+    ```python
+    parser = IncrementalParser()
+    bulk_data, _ = parser.parse(lines)
+    bulk_data, changes = parser.parse(edited_lines)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._parsed_cards: dict[str, list[_ParsedCard]] = {}
+
+    def parse(self, file_content: Iterable[str]) -> tuple[BulkDataSection, ChangeSet]:
+        """Construct the bulk data section and the changes compared to the previous parse.
+
+        Raises:
+            EntryIdentifyerNotSupportedError: if a card has an unsupported identifyer, like a
+                continuation line without a card before it.
+
+        """
+        previous_cards = self._parsed_cards
+        parsed_cards: dict[str, list[_ParsedCard]] = {}
+        bulk_data = BulkDataSection.empty()
+        changes = ChangeSet()
+
+        for card in _card_texts(file_content):
+            occurrences = parsed_cards.setdefault(card, [])
+            previous_occurrences = previous_cards.get(card, [])
+            if len(occurrences) < len(previous_occurrences):
+                parsed_card = previous_occurrences[len(occurrences)]
+                changes.unchanged += 1
+            else:
+                parsed_card = _parse_card(card)
+                if parsed_card[0] is not None:
+                    changes.added.append(parsed_card[0])
+            occurrences.append(parsed_card)
+
+            entry, include = parsed_card
+            if entry is not None:
+                bulk_data.entries.append(entry)
+            elif include is not None:
+                bulk_data.includes.append(include)
+
+        changes.removed = [
+            entry
+            for card, previous_occurrences in previous_cards.items()
+            for entry, _ in previous_occurrences[len(parsed_cards.get(card, [])) :]
+            if entry is not None
+        ]
+        self._parsed_cards = parsed_cards
+        return bulk_data, changes
+
+
+def _card_texts(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the text of one card after another, joining continuation lines with line breaks.
+
+    Lines without any content are skipped. A continuation line without a card before it is a card
+    of its own, which can not be decoded, the same as when parsing with
+    BulkDataSection.from_file_content.
+    """
+    card_lines: list[str] = []
+    for line in lines:
+        if not line or line.isspace():
+            continue
+        if card_lines and _continues_card(line):
+            card_lines.append(line)
+            continue
+
+        if card_lines:
+            yield card_lines[0] if len(card_lines) == 1 else "\n".join(card_lines)
+        card_lines = [line]
+
+    if card_lines:
+        yield card_lines[0] if len(card_lines) == 1 else "\n".join(card_lines)
+
+
+def _parse_card(card: str) -> _ParsedCard:
+    fields = next(_cards(card.split("\n")), None)
+    if fields is None:
+        return None, None
+
+    entry = _entry_from_fields(fields)
+    if entry is None and _is_include(fields):
+        return None, _include_file_name(fields)
+    return entry, None
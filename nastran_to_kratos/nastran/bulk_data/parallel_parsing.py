@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import fields
+from functools import cache
+from itertools import chain
+from operator import attrgetter
+from typing import Any
+
+from .bulk_data_section import BulkDataSection, _continues_card
+from .entries import _BulkDataEntry
+
+DEFAULT_CHUNK_SIZE = 50_000
+"Default number of lines parsed by a process at once."
+
+
+def parse_bulk_data_in_parallel(
+    file_content: Iterable[str],
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BulkDataSection:
+    """Construct a bulk data section by parsing chunks of its lines in a pool of processes.
+
+    The lines are split into chunks of about chunk_size lines, only ever between two cards so that
+    continuation lines stay with their card. The parsed chunks are merged in their original order,
+    resulting in the same section as BulkDataSection.from_file_content. Only a few chunks per
+    process are read ahead, so the lines can be streamed from a file. If all lines fit into a
+    single chunk, they are parsed without starting any processes.
+
+    Args:
+        file_content: the lines of the bulk data section.
+        max_workers: the maximum number of processes parsing at the same time. Defaults to the
+            number of processors of the machine.
+        chunk_size: the minimum number of lines in a chunk, except for the last chunk.
+
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers == 1:
+        return BulkDataSection.from_file_content(file_content)
+
+    chunks = _chunks(file_content, chunk_size)
+    leading_chunks = [
+        chunk for chunk in (next(chunks, None), next(chunks, None)) if chunk is not None
+    ]
+    chunks = _prepend(chunks, *leading_chunks)
+    if len(leading_chunks) < 2:  # noqa: PLR2004
+        return BulkDataSection.from_file_content(chain.from_iterable(chunks))
+
+    bulk_data = BulkDataSection.empty()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        parsing: deque[Future[_ParsedChunk]] = deque()
+        for chunk in chunks:
+            parsing.append(executor.submit(_parse_chunk, chunk))
+            if len(parsing) >= 2 * max_workers:
+                _merge(bulk_data, parsing.popleft().result())
+
+        while parsing:
+            _merge(bulk_data, parsing.popleft().result())
+
+    return bulk_data
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    for line in lines:
+        if len(chunk) >= chunk_size and not _continues_card(line):
+            yield chunk
+            chunk = []
+        chunk.append(line)
+
+    if chunk:
+        yield chunk
+
+
+def _prepend(chunks: Iterator[list[str]], *first_chunks: list[str]) -> Iterator[list[str]]:
+    yield from first_chunks
+    yield from chunks
+
+
+_ParsedChunk = tuple[list[tuple[type[_BulkDataEntry], tuple[Any, ...]]], list[str]]
+"""The entries of a chunk as their class and the values of their fields and the included files.
+
+Sending these rows back to the main process is considerably faster than pickling the entries, since
+creating the entries again is the only work left in the main process, which limits the speedup."""
+
+
+def _parse_chunk(lines: list[str]) -> _ParsedChunk:
+    chunk = BulkDataSection.from_file_content(lines)
+    rows = [(type(entry), _field_values(type(entry))(entry)) for entry in chunk.entries]
+    return rows, chunk.includes
+
+
+@cache
+def _field_values(entry_type: type[_BulkDataEntry]) -> Callable[[_BulkDataEntry], tuple[Any, ...]]:
+    names = [field.name for field in fields(entry_type) if field.init]  # type: ignore[arg-type]
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        return lambda entry: (getter(entry),)
+    return getter
+
+
+def _merge(bulk_data: BulkDataSection, chunk: _ParsedChunk) -> None:
+    rows, includes = chunk
+    bulk_data.entries.extend([entry_type(*values) for entry_type, values in rows])
+    bulk_data.includes.extend(includes)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import numpy.typing as npt
+
+_IMPLICIT_EXPONENT = re.compile(r"(?<=[0-9.])(?=[+-])")
+"The position of the sign of an exponent written without E, like in 1.5-3 or 7.+4."
+
+_SPACE, _NULL, _POINT, _PLUS, _MINUS, _ZERO, _LOWER_D, _LOWER_E = (
+    ord(character) for character in " \0.+-0de"
+)
+_LOWER_CASE_BIT = 0x20
+
+_MAX_EXACT_DIGITS = 15
+"Integers of up to 15 digits are exactly representable as float64."
+
+_MAX_EXACT_POWER = 22
+"10 to the power of at most 22 is exactly representable as float64."
+
+_MAX_EXPONENT_DIGITS = 3
+_FLOAT_POWERS_OF_TEN = 10.0 ** np.arange(_MAX_EXACT_POWER + 1)
+
+_SIGNS = np.array([1.0, -1.0])
+
+_BLOCK_SIZE = 2**14
+"Number of strings converted at once, so that the intermediate arrays stay in the CPU cache."
+
+_FIELD_WIDTH = 8
+"Number of characters in a small field, which every formatted real fits into."
+
+
+def parse_real(field: str) -> float:
+    """Convert the string of a real field into a float.
+
+    Besides everything accepted by float(), the notations of nastran are supported: exponents
+    without an E (1.5-3 meaning 1.5E-3, 7.+4 meaning 7.E+4) and double precision exponents with a D
+    (1.5D-3). Most fields are plain decimals, which are converted by float() directly.
+
+    Raises:
+        ValueError: if the field is not a real number.
+
+    """
+    try:
+        return float(field)
+    except ValueError as error:
+        normalized = _IMPLICIT_EXPONENT.sub("E", field.upper().replace("D", "E"), count=1)
+        try:
+            return float(normalized)
+        except ValueError:
+            raise error from None
+
+
+def format_real(value: float, *, keep_point: bool = False) -> str:
+    """Convert a float into a string of at most 8 characters for a small field.
+
+    Values are written as short as possible, like repr does, with a trailing ".0" removed unless
+    keep_point is set. Values whose shortest notation is longer than 8 characters are rounded to the
+    decimal or the exponent notation of nastran (like 1.2346-7, meaning 1.2346E-7) that fits into
+    the field, whichever is closer to the value. Both are read back by parse_real.
+    """
+    text = repr(float(value))
+    if not keep_point:
+        text = text.removesuffix(".0")
+    if len(text) <= _FIELD_WIDTH:
+        return text
+
+    candidates = [_rounded_decimal(value), _rounded_exponent(value)]
+    return min(
+        (candidate for candidate in candidates if candidate is not None),
+        key=lambda candidate: abs(parse_real(candidate) - value),
+    )
+
+
+def _rounded_decimal(value: float) -> str | None:
+    """Return the value rounded to as many decimals as fit into a field or None if none fit."""
+    decimals = _FIELD_WIDTH - len(f"{value:.0f}") - 1
+    while decimals >= 0:
+        text = f"{value:.{decimals}f}"
+        # The text is longer than expected if rounding added a digit before the point.
+        if len(text) <= _FIELD_WIDTH:
+            return text.rstrip("0") if "." in text else f"{text}."
+        decimals -= 1
+    return None
+
+
+def _rounded_exponent(value: float) -> str:
+    """Return the value with as many mantissa digits as fit into a field, exponent without E."""
+    sign = "-" if value < 0 else ""
+    decimals = _FIELD_WIDTH
+    while True:
+        mantissa, _, exponent = f"{abs(value):.{decimals}e}".partition("e")
+        text = f"{sign}{mantissa.rstrip('0')}{int(exponent):+d}"
+        if len(text) <= _FIELD_WIDTH or decimals == 0:
+            return text
+        decimals -= max(len(text) - _FIELD_WIDTH, 1)
+
+
+def parse_real_column(strings: npt.NDArray[np.bytes_]) -> npt.NDArray[np.float64]:
+    """Convert an array of real field strings into floats, all at once.
+
+    The notations supported are the same as in parse_real. Instead of parsing string by string, the
+    strings are split into their characters and the parts of each number (sign, digits of the
+    mantissa, number of decimals, exponent) are computed for all strings with array operations.
+    The value is then the mantissa multiplied or divided by a power of ten, which is exactly the
+    result of float() as long as both are exactly representable. The few strings where this is not
+    the case, or which are not plain numbers (like "inf"), are converted by parse_real.
+
+    Raises:
+        ValueError: if any of the strings is not a real number.
+
+    """
+    width = strings.dtype.itemsize
+    values = np.empty(len(strings), dtype=np.float64)
+    characters = np.ascontiguousarray(strings).view(np.uint8).reshape(len(strings), width)
+    for start in range(0, len(strings), _BLOCK_SIZE):
+        end = start + _BLOCK_SIZE
+        # Transposed, so that each character position is a contiguous row.
+        block = np.ascontiguousarray(characters[start:end].T)
+        is_exact = _parse_block(block, values[start:end])
+        for i in np.flatnonzero(~is_exact).tolist():
+            values[start + i] = parse_real(strings[start + i].decode())
+    return values
+
+
+def _parse_block(
+    characters: npt.NDArray[np.uint8], values: npt.NDArray[np.float64]
+) -> npt.NDArray[np.bool_]:
+    """Write the values of the strings in the columns of characters into values.
+
+    Returns whether each value is exact. All other values must be converted by parse_real instead.
+    """
+    digits = characters - np.uint8(_ZERO)
+    is_digit = digits < 10  # noqa: PLR2004
+    is_point = characters == _POINT
+    is_minus = characters == _MINUS
+    is_sign = is_minus | (characters == _PLUS)
+    lower_case = characters | np.uint8(_LOWER_CASE_BIT)
+    is_exponent_letter = (lower_case == _LOWER_E) | (lower_case == _LOWER_D)
+    is_content = (characters != _SPACE) & (characters != _NULL)
+
+    # The exponent starts at the E (or D) or at a sign directly following the mantissa.
+    starts_exponent = is_exponent_letter.copy()
+    starts_exponent[1:] |= is_sign[1:] & (is_digit[:-1] | is_point[:-1])
+    in_exponent = _from_first(starts_exponent)
+    mantissa_digits = is_digit & ~in_exponent
+    exponent_digits = is_digit & in_exponent
+
+    # Horner's method, multiplying by 10 before each digit and by 1 at all other characters.
+    mantissa = np.zeros(characters.shape[1], dtype=np.int64)
+    mantissa_factors = mantissa_digits.view(np.uint8) * np.uint8(9) + np.uint8(1)
+    mantissa_addends = digits * mantissa_digits.view(np.uint8)
+    exponent = np.zeros(characters.shape[1], dtype=np.int16)
+    exponent_factors = exponent_digits.view(np.uint8) * np.uint8(9) + np.uint8(1)
+    exponent_addends = digits * exponent_digits.view(np.uint8)
+    for position in range(len(characters)):
+        mantissa *= mantissa_factors[position]
+        mantissa += mantissa_addends[position]
+        exponent *= exponent_factors[position]
+        exponent += exponent_addends[position]
+
+    after_point = _follows(_from_first(is_point))
+    exponent *= _SIGNS.take(_any(is_minus & in_exponent)).astype(np.int16)
+    scale = exponent - _count(mantissa_digits & after_point)
+
+    follows_content = _follows(_from_first(is_content))
+    follows_exponent = _follows(in_exponent)
+    is_invalid = (
+        (is_content & ~(is_digit | is_point | is_sign | is_exponent_letter))
+        # The content must not be interrupted by blanks.
+        | (is_content & _follows(_from_first(follows_content & ~is_content)))
+        # The sign of the mantissa must be its first character.
+        | (is_sign & ~in_exponent & follows_content)
+        | (is_point & (in_exponent | after_point))
+        | (is_exponent_letter & follows_exponent)
+        | (is_sign & follows_exponent & ~_follows(is_exponent_letter))
+    ).any(axis=0)
+    exponent_digit_count = _count(exponent_digits)
+    is_invalid |= ~mantissa_digits.any(axis=0)
+    is_invalid |= in_exponent[-1] & (
+        (exponent_digit_count == 0) | (exponent_digit_count > _MAX_EXPONENT_DIGITS)
+    )
+
+    # Dividing or multiplying by 1 is exact, so only one of both operations rounds.
+    np.divide(mantissa, _FLOAT_POWERS_OF_TEN.take(np.clip(-scale, 0, _MAX_EXACT_POWER)), out=values)
+    values *= _FLOAT_POWERS_OF_TEN.take(np.clip(scale, 0, _MAX_EXACT_POWER))
+    values *= _SIGNS.take(_any(is_minus & ~in_exponent))
+    is_exact = _count(mantissa_digits) <= _MAX_EXACT_DIGITS
+    is_exact &= np.abs(scale) <= _MAX_EXACT_POWER
+    return is_exact & ~is_invalid
+
+
+def _any(rows: npt.NDArray[np.bool_]) -> npt.NDArray[np.uint8]:
+    """Return 1 for each column with any marked position and 0 otherwise."""
+    return np.asarray(rows.any(axis=0)).view(np.uint8)
+
+
+def _count(rows: npt.NDArray[np.bool_]) -> npt.NDArray[np.int16]:
+    """Return the number of marked positions in each column."""
+    return rows.view(np.uint8).sum(axis=0, dtype=np.int16)
+
+
+def _from_first(rows: npt.NDArray[np.bool_]) -> npt.NDArray[np.bool_]:
+    """Mark every position from the first marked position onwards in each column."""
+    marked = rows.copy()
+    for position in range(1, len(marked)):
+        marked[position] |= marked[position - 1]
+    return marked
+
+
+def _follows(rows: npt.NDArray[np.bool_]) -> npt.NDArray[np.bool_]:
+    """Mark the positions directly following a marked position in each column."""
+    following = np.zeros_like(rows)
+    following[1:] = rows[:-1]
+    return following
@@ -0,0 +1,9 @@
+"""Column-oriented tables storing all entries of one type in NumPy arrays."""
+
+from ._bulk_data_table import MISSING
+from .crod_table import CrodTable
+from .grid_table import GridTable
+from .mat1_table import Mat1Table
+from .prod_table import ProdTable
+
+__all__ = ["MISSING", "CrodTable", "GridTable", "Mat1Table", "ProdTable"]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import fields
+from functools import cached_property
+from typing import Any, ClassVar, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from nastran_to_kratos.nastran.bulk_data.entries import _BulkDataEntry
+
+from ._fixed_width_decoder import FIELD_WIDTH, MISSING, decode_small_field_block
+from ._fixed_width_encoder import encode_small_field_block
+
+TableT = TypeVar("TableT", bound="_BulkDataTable")
+
+
+class _BulkDataTable(ABC):
+    """The template for a column-oriented table holding all nastran entries of one type.
+
+    Every field of the entry is stored in a typed NumPy array with one row per entry. Optional
+    integer fields use MISSING as a placeholder, optional real fields use NaN. The columns must not
+    be modified in place once a lookup by id has been done, since the sorted ids are cached.
+
+    This class should not be used directly.
+    """
+
+    _entry_type: ClassVar[type[_BulkDataEntry]]
+    "Entry class of the rows. The columns are in the same order as the fields of its schema."
+
+    _id_column: ClassVar[str]
+    "Name of the column containing the identification numbers of the entries."
+
+    @classmethod
+    def from_file_content(  # noqa: PYI019
+        cls: type[TableT], file_content: Sequence[str] | Sequence[bytes]
+    ) -> TableT:
+        """Create this table from small field lines, that all contain an entry of its type.
+
+        Instead of creating one entry per line, all lines are decoded column by column at once.
+
+        Raises:
+            ValueError: if any of the lines does not start with the identifyer of the entry type.
+
+        """
+        identifyer = cls._entry_type.identifyer.ljust(FIELD_WIDTH).encode()
+        if len(file_content) > 0:
+            identifyers = np.array(file_content, dtype=f"S{FIELD_WIDTH}")
+            is_other_type = np.char.ljust(identifyers, FIELD_WIDTH) != identifyer
+            if is_other_type.any():
+                line = int(np.argmax(is_other_type))
+                msg = f"Line {line} is not a {cls._entry_type.identifyer} entry."
+                raise ValueError(msg)
+
+        return cls(*decode_small_field_block(file_content, cls._entry_type._schema))  # noqa: SLF001
+
+    @classmethod
+    def concatenate(cls: type[TableT], tables: Sequence[TableT]) -> TableT:  # noqa: PYI019
+        """Join tables of this type into one table containing the rows of one after another."""
+        columns = fields(cls)  # type: ignore[arg-type]
+        return cls(
+            **{
+                column.name: np.concatenate([getattr(table, column.name) for table in tables])
+                for column in columns
+            }
+        )
+
+    @classmethod
+    @abstractmethod
+    def from_entries(cls: type[TableT], entries: Sequence[Any]) -> TableT:
+        """Construct this table from entries of its type."""
+
+    @abstractmethod
+    def to_entries(self) -> list[Any]:
+        """Export this table to one entry of its type per row."""
+
+    def to_file_content(self) -> list[str]:
+        """Export this table into one small field line per row, the same as the entries would be.
+
+        All rows are encoded column by column at once, see encode_small_field_block.
+        """
+        return encode_small_field_block(
+            self._entry_type.identifyer,
+            [getattr(self, column.name) for column in fields(self)],  # type: ignore[arg-type]
+        )
+
+    def __len__(self) -> int:
+        """Return the number of rows in this table."""
+        return len(getattr(self, self._id_column))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two tables column by column."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            _columns_are_equal(getattr(self, column.name), getattr(other, column.name))
+            for column in fields(self)  # type: ignore[arg-type]
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def rows(self, ids: npt.ArrayLike) -> npt.NDArray[np.intp]:
+        """Return the row index of each id using a binary search over the sorted ids.
+
+        Raises:
+            KeyError: if any of the ids is not present in the table.
+
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        sorted_ids = self._sorted_ids
+        if len(sorted_ids) == 0:
+            if ids.size != 0:
+                raise KeyError(np.unique(ids).tolist())
+            return np.zeros(ids.shape, dtype=np.intp)
+
+        positions = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+        is_present = sorted_ids[positions] == ids
+        if not is_present.all():
+            raise KeyError(np.unique(ids[~is_present]).tolist())
+
+        return self._id_order[positions]
+
+    def contains(self, ids: npt.ArrayLike) -> npt.NDArray[np.bool_]:
+        """Return for each id whether it is present in the table."""
+        return np.isin(np.asarray(ids, dtype=np.int64), getattr(self, self._id_column))
+
+    def take(self: TableT, rows: npt.ArrayLike) -> TableT:  # noqa: PYI019
+        """Return a new table containing only the selected rows in the given order."""
+        columns = fields(self)  # type: ignore[arg-type]
+        return type(self)(**{column.name: getattr(self, column.name)[rows] for column in columns})
+
+    def sorted_by_id(self: TableT) -> TableT:  # noqa: PYI019
+        """Return a copy of this table with the rows sorted by their id."""
+        return self.take(self._id_order)
+
+    @cached_property
+    def _id_order(self) -> npt.NDArray[np.intp]:
+        ids = getattr(self, self._id_column)
+        if len(ids) < 2 or bool(np.all(ids[1:] >= ids[:-1])):  # noqa: PLR2004
+            return np.arange(len(ids), dtype=np.intp)
+        return np.argsort(ids, kind="stable")
+
+    @cached_property
+    def _sorted_ids(self) -> npt.NDArray[np.int64]:
+        return getattr(self, self._id_column)[self._id_order]
+
+
+def _columns_are_equal(first: np.ndarray, second: np.ndarray) -> bool:
+    if first.dtype.kind == "f" and second.dtype.kind == "f":
+        return bool(np.array_equal(first, second, equal_nan=True))
+    return bool(np.array_equal(first, second))
+
+
+def _optional_int(value: int | None) -> int:
+    return MISSING if value is None else value
+
+
+def _optional_float(value: float | None) -> float:
+    return np.nan if value is None else value
+
+
+def _int_or_none(value: int) -> int | None:
+    return None if value == MISSING else value
+
+
+def _float_or_none(value: float) -> float | None:
+    return None if np.isnan(value) else value
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from nastran_to_kratos.nastran.bulk_data.entries._bulk_data_entry import (
+    REQUIRED,
+    MissingRequiredFieldError,
+    _Field,
+    _FieldSchema,
+)
+from nastran_to_kratos.nastran.bulk_data.real_numbers import parse_real, parse_real_column
+
+MISSING = -1
+"Value stored in integer columns for optional fields, that are not present in the entry."
+
+FIELD_WIDTH = 8
+"Number of characters in a small field."
+
+_SPACE, _NULL, _PLUS, _MINUS, _ZERO = (ord(character) for character in " \0+-0")
+
+_IS_INTEGER_CHARACTER = np.zeros(256, dtype=np.bool_)
+_IS_INTEGER_CHARACTER[list(b"0123456789 \0+-")] = True
+
+
+def decode_small_field_block(
+    lines: Sequence[str] | Sequence[bytes], schema: _FieldSchema
+) -> list[np.ndarray]:
+    """Decode a block of small field lines of the same entry type into one array per field.
+
+    All lines are laid into a single fixed-width byte buffer, so that every field is a column of 8
+    byte wide cells, which is then converted for all lines at once. Integer fields are read digit
+    by digit with NumPy operations, real fields with parse_real_column, which also reads the
+    notations of nastran (like reals with an implicit exponent). Only columns that contain something
+    else are converted by the parse function of the field, one value at a time.
+
+    Fields parsed as reals result in float64 columns with NaN for blank optional fields, all other
+    fields in int64 columns with MISSING for blank optional fields.
+
+    Raises:
+        MissingRequiredFieldError: if a field without a default value is blank in any line.
+        ValueError: if a field can not be converted.
+
+    """
+    width = FIELD_WIDTH * (max((field.field_index for field in schema.fields), default=0) + 1)
+    buffer = np.array(lines, dtype=f"S{width}").view(np.uint8).reshape(len(lines), width)
+    return [_decode_column(buffer, field) for field in schema.fields]
+
+
+def _decode_column(buffer: npt.NDArray[np.uint8], field: _Field) -> np.ndarray:
+    start = field.field_index * FIELD_WIDTH
+    cells = buffer[:, start : start + FIELD_WIDTH]
+    # Transposed, so that each character position of the field is a contiguous row.
+    characters = np.ascontiguousarray(cells.T)
+    is_blank = ((characters == _SPACE) | (characters == _NULL)).all(axis=0)
+
+    if field.default is REQUIRED and is_blank.any():
+        line = int(np.argmax(is_blank))
+        raise MissingRequiredFieldError(_raw_entry(buffer[line]), field.field_index)
+
+    if field.parse in (parse_real, float):
+        dtype: type[np.generic] = np.float64
+        default = np.nan if field.default in (None, REQUIRED) else field.default
+    else:
+        dtype = np.int64
+        default = MISSING if field.default in (None, REQUIRED) else int(field.default)
+
+    if is_blank.all():
+        return np.full(len(cells), default, dtype=dtype)
+
+    values: np.ndarray
+    if dtype is np.float64:
+        values = _decode_real_column(cells, is_blank, field)
+    else:
+        values = _decode_integer_column(characters, cells, is_blank, field)
+
+    values[is_blank] = default
+    return values
+
+
+def _decode_integer_column(
+    characters: npt.NDArray[np.uint8],
+    cells: npt.NDArray[np.uint8],
+    is_blank: npt.NDArray[np.bool_],
+    field: _Field,
+) -> npt.NDArray[np.int64]:
+    if not _IS_INTEGER_CHARACTER[characters].all():
+        return _decode_column_by_field(cells, is_blank, field, np.int64)
+
+    digits = characters - np.uint8(_ZERO)
+    is_digit = digits < 10  # noqa: PLR2004
+    if _has_irregular_integers(characters, is_digit):
+        return _decode_column_by_field(cells, is_blank, field, np.int64)
+
+    values = np.zeros(characters.shape[1], dtype=np.int64)
+    for position in range(FIELD_WIDTH):
+        values = np.where(is_digit[position], values * 10 + digits[position], values)
+    return np.where((characters == _MINUS).any(axis=0), -values, values)
+
+
+def _has_irregular_integers(
+    characters: npt.NDArray[np.uint8], is_digit: npt.NDArray[np.bool_]
+) -> bool:
+    """Return whether any cell is not a plain integer with an optional leading sign.
+
+    These are cells with blanks between the sign and the digits or between digits, a sign after
+    the first digit, several signs or a sign without digits. int rejects all of them, so the
+    column has to be converted by the parse function of the field to raise the same errors.
+    """
+    is_sign = (characters == _PLUS) | (characters == _MINUS)
+    is_space = (characters == _SPACE) | (characters == _NULL)
+    follows_digit = np.logical_or.accumulate(is_digit, axis=0)
+    follows_content = np.logical_or.accumulate(is_digit | is_sign, axis=0)
+    precedes_digit = np.logical_or.accumulate(is_digit[::-1], axis=0)[::-1]
+    sign_count = is_sign.sum(axis=0)
+    return bool(
+        (sign_count > 1).any()
+        or (is_sign & follows_digit).any()
+        or (is_space & follows_content & precedes_digit).any()
+        or ((sign_count > 0) & ~is_digit.any(axis=0)).any()
+    )
+
+
+def _decode_real_column(
+    cells: npt.NDArray[np.uint8], is_blank: npt.NDArray[np.bool_], field: _Field
+) -> npt.NDArray[np.float64]:
+    strings = cells.copy().view(f"S{FIELD_WIDTH}").ravel()
+    strings[is_blank] = b"0"
+    try:
+        return parse_real_column(strings)
+    except ValueError:
+        return _decode_column_by_field(cells, is_blank, field, np.float64)
+
+
+def _decode_column_by_field(
+    cells: npt.NDArray[np.uint8],
+    is_blank: npt.NDArray[np.bool_],
+    field: _Field,
+    dtype: type[np.generic],
+) -> np.ndarray:
+    strings = np.ascontiguousarray(cells).view(f"S{FIELD_WIDTH}").ravel().tolist()
+    return np.fromiter(
+        (
+            0 if blank else field.parse(string.decode().strip())
+            for string, blank in zip(strings, is_blank.tolist(), strict=True)
+        ),
+        dtype,
+        len(strings),
+    )
+
+
+def _raw_entry(line: npt.NDArray[np.uint8]) -> list[str]:
+    text = line.tobytes().rstrip(b"\0").decode()
+    return [text[i : i + FIELD_WIDTH] for i in range(0, len(text), FIELD_WIDTH)]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from nastran_to_kratos.nastran.bulk_data.entries._bulk_data_entry import FieldTooLongError
+from nastran_to_kratos.nastran.bulk_data.real_numbers import format_real
+
+from ._fixed_width_decoder import FIELD_WIDTH, MISSING
+
+_SPACE, _POINT, _MINUS, _ZERO = (ord(character) for character in " .-0")
+
+_MAX_DIGITS = FIELD_WIDTH
+_MAX_DECIMALS = FIELD_WIDTH - 1
+_POWERS_OF_TEN = 10 ** np.arange(_MAX_DIGITS + 1, dtype=np.int64)
+_FLOAT_POWERS_OF_TEN = _POWERS_OF_TEN.astype(np.float64)
+
+_MIN_DECIMAL_NOTATION = 1e-4
+"Smallest absolute value repr writes in decimal notation instead of the exponent notation."
+
+
+def encode_small_field_block(identifyer: str, columns: Sequence[np.ndarray]) -> list[str]:
+    """Encode one array per field into small field lines of the same entry type.
+
+    This is the inverse of decode_small_field_block: float64 columns are written as reals with NaN
+    as a blank field, all other columns as integers with MISSING as a blank field. The fields of
+    all lines are written into a single fixed-width byte buffer, one column of 8 byte wide cells
+    per field, whose characters are computed for all lines at once. Reals with up to 7 decimals and
+    8 digits are written digit by digit with NumPy operations, the same as format_real writes them.
+    Only the other reals are converted by format_real, one value at a time.
+
+    Raises:
+        FieldTooLongError: if an integer does not fit into a field.
+
+    """
+    count = len(columns[0]) if columns else 0
+    width = FIELD_WIDTH * (len(columns) + 1)
+    buffer = np.full((count, width), _SPACE, dtype=np.uint8)
+    buffer[:, :FIELD_WIDTH] = np.frombuffer(identifyer.ljust(FIELD_WIDTH).encode(), np.uint8)
+
+    for i, column in enumerate(columns):
+        start = FIELD_WIDTH * (i + 1)
+        cells = buffer[:, start : start + FIELD_WIDTH]
+        if column.dtype.kind == "f":
+            _encode_real_column(np.asarray(column, dtype=np.float64), cells)
+        else:
+            _encode_integer_column(np.asarray(column, dtype=np.int64), cells, identifyer, i + 1)
+
+    lines = np.char.rstrip(buffer.view(f"S{width}").ravel())
+    return [line.decode() for line in lines.tolist()]
+
+
+def _encode_integer_column(
+    values: npt.NDArray[np.int64],
+    cells: npt.NDArray[np.uint8],
+    identifyer: str,
+    field_index: int,
+) -> None:
+    is_present = values != MISSING
+    if not is_present.any():
+        return
+
+    is_negative = values < 0
+    magnitudes = np.abs(values)
+    is_too_long = magnitudes >= _POWERS_OF_TEN[_MAX_DIGITS - is_negative]
+    if (is_too_long & is_present).any():
+        line = int(np.argmax(is_too_long & is_present))
+        raise FieldTooLongError(identifyer, field_index, str(values[line]))
+
+    rows = np.flatnonzero(is_present)
+    cells[rows] = _digit_cells(
+        magnitudes[rows], np.zeros(len(rows), dtype=np.int64), is_negative[rows]
+    )
+
+
+def _encode_real_column(values: npt.NDArray[np.float64], cells: npt.NDArray[np.uint8]) -> None:
+    is_present = ~np.isnan(values)
+    if not is_present.any():
+        return
+
+    mantissas, decimals = _exact_decimals(values)
+    is_negative = np.signbit(values)
+    # The decimal point and the minus sign take a character each, blanks are not written at all.
+    length = np.maximum(_digit_count(mantissas), decimals + 1) + (decimals > 0) + is_negative
+    is_simple = (decimals >= 0) & (length <= FIELD_WIDTH)
+    is_simple &= (np.abs(values) >= _MIN_DECIMAL_NOTATION) | (values == 0)
+
+    rows = np.flatnonzero(is_simple)
+    cells[rows] = _digit_cells(mantissas[rows], decimals[rows], is_negative[rows])
+    for row in np.flatnonzero(is_present & ~is_simple).tolist():
+        text = format_real(float(values[row]))
+        cells[row] = np.frombuffer(text.rjust(FIELD_WIDTH).encode(), np.uint8)
+
+
+def _exact_decimals(
+    values: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Find the fewest decimals, with which each value is written exactly, like repr writes it.
+
+    Returns the digits of each absolute value as an integer (the mantissa) and the number of
+    decimals, which is -1 for values that need more than 7 decimals or 8 digits. A mantissa is
+    exact if dividing it by the power of ten is the value, which is the float closest to the
+    decimal written with the digits of the mantissa.
+    """
+    magnitudes = np.abs(values)
+    mantissas = np.zeros(len(values), dtype=np.int64)
+    decimals = np.full(len(values), -1, dtype=np.int64)
+    is_pending = np.isfinite(magnitudes)
+    for decimal in range(_MAX_DECIMALS + 1):
+        rows = np.flatnonzero(is_pending)
+        if len(rows) == 0:
+            break
+        scaled = np.rint(magnitudes[rows] * _FLOAT_POWERS_OF_TEN[decimal])
+        is_exact = (scaled < _FLOAT_POWERS_OF_TEN[_MAX_DIGITS]) & (
+            scaled / _FLOAT_POWERS_OF_TEN[decimal] == magnitudes[rows]
+        )
+        exact_rows = rows[is_exact]
+        mantissas[exact_rows] = scaled[is_exact]
+        decimals[exact_rows] = decimal
+        is_pending[exact_rows] = False
+    return mantissas, decimals
+
+
+def _digit_count(mantissas: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """Return the number of digits of each non-negative integer, at least 1."""
+    return np.maximum(np.searchsorted(_POWERS_OF_TEN, mantissas, side="right"), 1)
+
+
+def _digit_cells(
+    mantissas: npt.NDArray[np.int64],
+    decimals: npt.NDArray[np.int64],
+    is_negative: npt.NDArray[np.bool_],
+) -> npt.NDArray[np.uint8]:
+    """Write the mantissas right-aligned into cells, with a point before the last decimals digits.
+
+    The characters are computed from the right, one character position for all cells at a time. A
+    value below 1 gets a leading zero like in 0.25.
+    """
+    count = len(mantissas)
+    # Number of characters from the right taken by the digits and the point.
+    digit_end = np.maximum(_digit_count(mantissas), decimals + 1) + (decimals > 0)
+    minus_position = np.where(is_negative, digit_end, -1)
+    remaining = mantissas.astype(np.uint32)
+
+    characters = np.empty((FIELD_WIDTH, count), dtype=np.uint8)
+    for position in range(FIELD_WIDTH):
+        quotients, digits = np.divmod(remaining, np.uint32(10))
+        is_point = (decimals == position) & (position > 0)
+        is_digit = (digit_end > position) & ~is_point
+        characters[FIELD_WIDTH - 1 - position] = (
+            _SPACE
+            + is_digit * (digits.astype(np.uint8) + np.uint8(_ZERO - _SPACE))
+            + is_point * np.uint8(_POINT - _SPACE)
+            + (minus_position == position) * np.uint8(_MINUS - _SPACE)
+        )
+        remaining = np.where(is_point, remaining, quotients)
+    return characters.T
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+import numpy.typing as npt
+
+from nastran_to_kratos.nastran.bulk_data.entries import Crod, _BulkDataEntry
+
+from ._bulk_data_table import _BulkDataTable
+from .mat1_table import Mat1Table
+from .prod_table import ProdTable
+
+
+@dataclass(eq=False)
+class CrodTable(_BulkDataTable):
+    """All tension-compression-torsion elements stored column by column.
+
+    Each column corresponds to the field of the same name in a Crod entry.
+    """
+
+    _entry_type: ClassVar[type[_BulkDataEntry]] = Crod
+    _id_column: ClassVar[str] = "eid"
+
+    eid: npt.NDArray[np.int64]
+    pid: npt.NDArray[np.int64]
+    g1: npt.NDArray[np.int64]
+    g2: npt.NDArray[np.int64]
+
+    @classmethod
+    def empty(cls) -> CrodTable:
+        """Construct a table without any rows."""
+        return CrodTable.from_crods([])
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[Crod]) -> CrodTable:
+        """Construct this class from Crod entries, the same as from_crods."""
+        return CrodTable.from_crods(entries)
+
+    @classmethod
+    def from_crods(cls, crods: Sequence[Crod]) -> CrodTable:
+        """Construct this class from Crod entries."""
+        count = len(crods)
+        return CrodTable(
+            eid=np.fromiter((crod.eid for crod in crods), np.int64, count),
+            pid=np.fromiter((crod.pid for crod in crods), np.int64, count),
+            g1=np.fromiter((crod.g1 for crod in crods), np.int64, count),
+            g2=np.fromiter((crod.g2 for crod in crods), np.int64, count),
+        )
+
+    def to_entries(self) -> list[Crod]:
+        """Export this table to one Crod entry per row, the same as to_crods."""
+        return self.to_crods()
+
+    def to_crods(self) -> list[Crod]:
+        """Export this table to one Crod entry per row."""
+        return [
+            Crod(eid=eid, pid=pid, g1=g1, g2=g2)
+            for eid, pid, g1, g2 in zip(
+                self.eid.tolist(),
+                self.pid.tolist(),
+                self.g1.tolist(),
+                self.g2.tolist(),
+                strict=True,
+            )
+        ]
+
+    @property
+    def connectivity(self) -> npt.NDArray[np.int64]:
+        """Return the grid ids of all elements as an array with the shape (E, 2)."""
+        return np.column_stack((self.g1, self.g2))
+
+    def property_rows(
+        self, prods: ProdTable, mat1s: Mat1Table
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """Resolve the row of the PROD and of the MAT1 entry referenced by every element.
+
+        The references CROD.pid -> PROD and PROD.mid -> MAT1 are joined with one vectorized lookup
+        each, so the cost does not depend on creating an object per element.
+
+        Returns:
+            the PROD row and the MAT1 row for each row of this table
+
+        Raises:
+            KeyError: if an element references a missing PROD or a PROD a missing MAT1.
+
+        """
+        prod_rows = prods.rows(self.pid)
+        mat1_rows = mat1s.rows(prods.mid[prod_rows])
+        return prod_rows, mat1_rows
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+import numpy.typing as npt
+
+from nastran_to_kratos.nastran.bulk_data.entries import Grid, _BulkDataEntry
+
+from ._bulk_data_table import MISSING, _BulkDataTable, _int_or_none, _optional_int
+
+
+@dataclass(eq=False)
+class GridTable(_BulkDataTable):
+    """All geometric grid points stored column by column.
+
+    Each column corresponds to the field of the same name in a Grid entry.
+    """
+
+    _entry_type: ClassVar[type[_BulkDataEntry]] = Grid
+    _id_column: ClassVar[str] = "id"
+
+    id: npt.NDArray[np.int64]
+    cp: npt.NDArray[np.int64]
+    x1: npt.NDArray[np.float64]
+    x2: npt.NDArray[np.float64]
+    x3: npt.NDArray[np.float64]
+    cd: npt.NDArray[np.int64]
+    ps: npt.NDArray[np.int64]
+    seid: npt.NDArray[np.int64]
+
+    @classmethod
+    def empty(cls) -> GridTable:
+        """Construct a table without any rows."""
+        return GridTable.from_grids([])
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[Grid]) -> GridTable:
+        """Construct this class from Grid entries, the same as from_grids."""
+        return GridTable.from_grids(entries)
+
+    @classmethod
+    def from_grids(cls, grids: Sequence[Grid]) -> GridTable:
+        """Construct this class from Grid entries."""
+        count = len(grids)
+        return GridTable(
+            id=np.fromiter((grid.id for grid in grids), np.int64, count),
+            cp=np.fromiter((_optional_int(grid.cp) for grid in grids), np.int64, count),
+            x1=np.fromiter((grid.x1 for grid in grids), np.float64, count),
+            x2=np.fromiter((grid.x2 for grid in grids), np.float64, count),
+            x3=np.fromiter((grid.x3 for grid in grids), np.float64, count),
+            cd=np.fromiter((_optional_int(grid.cd) for grid in grids), np.int64, count),
+            ps=np.fromiter(
+                (MISSING if grid.ps is None else int(grid.ps) for grid in grids), np.int64, count
+            ),
+            seid=np.fromiter((_optional_int(grid.seid) for grid in grids), np.int64, count),
+        )
+
+    def to_entries(self) -> list[Grid]:
+        """Export this table to one Grid entry per row, the same as to_grids."""
+        return self.to_grids()
+
+    def to_grids(self) -> list[Grid]:
+        """Export this table to one Grid entry per row."""
+        return [
+            Grid(
+                id=id_,
+                cp=_int_or_none(cp),
+                x1=x1,
+                x2=x2,
+                x3=x3,
+                cd=_int_or_none(cd),
+                ps=None if ps == MISSING else str(ps),
+                seid=_int_or_none(seid),
+            )
+            for id_, cp, x1, x2, x3, cd, ps, seid in zip(
+                self.id.tolist(),
+                self.cp.tolist(),
+                self.x1.tolist(),
+                self.x2.tolist(),
+                self.x3.tolist(),
+                self.cd.tolist(),
+                self.ps.tolist(),
+                self.seid.tolist(),
+                strict=True,
+            )
+        ]
+
+    @property
+    def coordinates(self) -> npt.NDArray[np.float64]:
+        """Return the locations of all grid points as an array with the shape (N, 3)."""
+        return np.column_stack((self.x1, self.x2, self.x3))
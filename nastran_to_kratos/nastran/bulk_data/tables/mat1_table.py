@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+import numpy.typing as npt
+
+from nastran_to_kratos.nastran.bulk_data.entries import Mat1, _BulkDataEntry
+
+from ._bulk_data_table import (
+    _BulkDataTable,
+    _float_or_none,
+    _int_or_none,
+    _optional_float,
+    _optional_int,
+)
+
+
+@dataclass(eq=False)
+class Mat1Table(_BulkDataTable):
+    """All linear isotropic materials stored column by column.
+
+    Each column corresponds to the field of the same name in a Mat1 entry.
+    """
+
+    _entry_type: ClassVar[type[_BulkDataEntry]] = Mat1
+    _id_column: ClassVar[str] = "mid"
+
+    mid: npt.NDArray[np.int64]
+    e: npt.NDArray[np.float64]
+    g: npt.NDArray[np.float64]
+    nu: npt.NDArray[np.float64]
+    rho: npt.NDArray[np.float64]
+    a: npt.NDArray[np.float64]
+    tref: npt.NDArray[np.float64]
+    ge: npt.NDArray[np.float64]
+    st: npt.NDArray[np.float64]
+    sc: npt.NDArray[np.float64]
+    ss: npt.NDArray[np.float64]
+    mcsid: npt.NDArray[np.int64]
+
+    @classmethod
+    def empty(cls) -> Mat1Table:
+        """Construct a table without any rows."""
+        return Mat1Table.from_mat1s([])
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[Mat1]) -> Mat1Table:
+        """Construct this class from Mat1 entries, the same as from_mat1s."""
+        return Mat1Table.from_mat1s(entries)
+
+    @classmethod
+    def from_mat1s(cls, mat1s: Sequence[Mat1]) -> Mat1Table:
+        """Construct this class from Mat1 entries."""
+        count = len(mat1s)
+
+        def real_column(name: str) -> npt.NDArray[np.float64]:
+            return np.fromiter(
+                (_optional_float(getattr(mat1, name)) for mat1 in mat1s), np.float64, count
+            )
+
+        return Mat1Table(
+            mid=np.fromiter((mat1.mid for mat1 in mat1s), np.int64, count),
+            e=real_column("e"),
+            g=real_column("g"),
+            nu=real_column("nu"),
+            rho=real_column("rho"),
+            a=real_column("a"),
+            tref=real_column("tref"),
+            ge=real_column("ge"),
+            st=real_column("st"),
+            sc=real_column("sc"),
+            ss=real_column("ss"),
+            mcsid=np.fromiter((_optional_int(mat1.mcsid) for mat1 in mat1s), np.int64, count),
+        )
+
+    def to_entries(self) -> list[Mat1]:
+        """Export this table to one Mat1 entry per row, the same as to_mat1s."""
+        return self.to_mat1s()
+
+    def to_mat1s(self) -> list[Mat1]:
+        """Export this table to one Mat1 entry per row."""
+
+        def real_column(column: npt.NDArray[np.float64]) -> list[float | None]:
+            return [_float_or_none(value) for value in column.tolist()]
+
+        return [
+            Mat1(
+                mid=mid,
+                e=e,
+                g=g,
+                nu=nu,
+                rho=rho,
+                a=a,
+                tref=tref,
+                ge=ge,
+                st=st,
+                sc=sc,
+                ss=ss,
+                mcsid=_int_or_none(mcsid),
+            )
+            for mid, e, g, nu, rho, a, tref, ge, st, sc, ss, mcsid in zip(
+                self.mid.tolist(),
+                real_column(self.e),
+                real_column(self.g),
+                real_column(self.nu),
+                real_column(self.rho),
+                real_column(self.a),
+                real_column(self.tref),
+                real_column(self.ge),
+                real_column(self.st),
+                real_column(self.sc),
+                real_column(self.ss),
+                self.mcsid.tolist(),
+                strict=True,
+            )
+        ]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+import numpy.typing as npt
+
+from nastran_to_kratos.nastran.bulk_data.entries import Prod, _BulkDataEntry
+
+from ._bulk_data_table import _BulkDataTable, _float_or_none, _optional_float
+
+
+@dataclass(eq=False)
+class ProdTable(_BulkDataTable):
+    """All rod element properties stored column by column.
+
+    Each column corresponds to the field of the same name in a Prod entry.
+    """
+
+    _entry_type: ClassVar[type[_BulkDataEntry]] = Prod
+    _id_column: ClassVar[str] = "pid"
+
+    pid: npt.NDArray[np.int64]
+    mid: npt.NDArray[np.int64]
+    a: npt.NDArray[np.float64]
+    j: npt.NDArray[np.float64]
+    c: npt.NDArray[np.float64]
+    nsm: npt.NDArray[np.float64]
+
+    @classmethod
+    def empty(cls) -> ProdTable:
+        """Construct a table without any rows."""
+        return ProdTable.from_prods([])
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[Prod]) -> ProdTable:
+        """Construct this class from Prod entries, the same as from_prods."""
+        return ProdTable.from_prods(entries)
+
+    @classmethod
+    def from_prods(cls, prods: Sequence[Prod]) -> ProdTable:
+        """Construct this class from Prod entries."""
+        count = len(prods)
+        return ProdTable(
+            pid=np.fromiter((prod.pid for prod in prods), np.int64, count),
+            mid=np.fromiter((prod.mid for prod in prods), np.int64, count),
+            a=np.fromiter((prod.a for prod in prods), np.float64, count),
+            j=np.fromiter((_optional_float(prod.j) for prod in prods), np.float64, count),
+            c=np.fromiter((_optional_float(prod.c) for prod in prods), np.float64, count),
+            nsm=np.fromiter((_optional_float(prod.nsm) for prod in prods), np.float64, count),
+        )
+
+    def to_entries(self) -> list[Prod]:
+        """Export this table to one Prod entry per row, the same as to_prods."""
+        return self.to_prods()
+
+    def to_prods(self) -> list[Prod]:
+        """Export this table to one Prod entry per row."""
+        return [
+            Prod(
+                pid=pid,
+                mid=mid,
+                a=a,
+                j=_float_or_none(j),
+                c=_float_or_none(c),
+                nsm=_float_or_none(nsm),
+            )
+            for pid, mid, a, j, c, nsm in zip(
+                self.pid.tolist(),
+                self.mid.tolist(),
+                self.a.tolist(),
+                self.j.tolist(),
+                self.c.tolist(),
+                self.nsm.tolist(),
+                strict=True,
+            )
+        ]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import chain, repeat
+from operator import attrgetter
+
+import numpy as np
+import numpy.typing as npt
+
+from .bulk_data_section import BulkDataSection
+from .entries import _BulkDataEntry, entry_class_for
+
+
+@dataclass
+class DanglingReference:
+    """A field of an entry referring to an entry, that is not present in the bulk data section."""
+
+    entry: _BulkDataEntry
+    "The entry containing the reference."
+
+    position: int
+    "Index of the entry in the entries of the bulk data section."
+
+    field_name: str
+    "Name of the field containing the reference."
+
+    referenced_identifyer: str
+    "Identifyer of the type of the missing entry, like GRID."
+
+    referenced_id: int
+    "Identification number of the missing entry."
+
+    line_number: int | None = None
+    "Number of the line the card of the entry starts on, if known."
+
+    def __str__(self) -> str:
+        """Describe the dangling reference in one line."""
+        entry_type = type(self.entry)
+        card = entry_type.identifyer
+        if entry_type.id_field is not None:
+            card += f" {getattr(self.entry, entry_type.id_field)}"
+        location = f"card {self.position}"
+        if self.line_number is not None:
+            location += f" (line {self.line_number})"
+        return (
+            f"{location}: {card} refers to the missing {self.referenced_identifyer} "
+            f"{self.referenced_id} in field {self.field_name}"
+        )
+
+
+def validate_references(
+    bulk_data: BulkDataSection, line_numbers: Sequence[int] | None = None
+) -> list[DanglingReference]:
+    """Return every reference to an entry, that is not present in the bulk data section.
+
+    The references of an entry type are declared in its references attribute. The ids in each
+    referring field of all entries of a type are gathered into one array and looked up in the ids of
+    the referenced type at once with np.isin, so the time needed is dominated by reading the fields
+    of the entries. Only the positions of entries with dangling references are searched for.
+
+    Args:
+        bulk_data: the section to validate.
+        line_numbers: the line number of the card of each entry, like BulkDataIndex.line_numbers
+            returns them. If None, only the positions of the entries are reported.
+
+    Returns:
+        the dangling references ordered by the position of the entry and then by field.
+
+    """
+    ids_by_identifyer: dict[str, npt.NDArray[np.int64]] = {}
+    dangling_references = []
+    for entry_type, entries in _entries_by_type(bulk_data):
+        positions: list[int] | None = None
+        for field_name, referenced_identifyer in entry_type.references.items():
+            rows, referenced_ids = _reference_column(entries, field_name)
+            if referenced_identifyer not in ids_by_identifyer:
+                ids_by_identifyer[referenced_identifyer] = _ids(bulk_data, referenced_identifyer)
+            is_dangling = ~np.isin(referenced_ids, ids_by_identifyer[referenced_identifyer])
+            if not is_dangling.any():
+                continue
+
+            if positions is None:
+                positions = [
+                    position
+                    for position, entry in enumerate(bulk_data.entries)
+                    if type(entry) is entry_type
+                ]
+            for i in np.flatnonzero(is_dangling).tolist():
+                position = positions[rows[i]]
+                dangling_references.append(
+                    DanglingReference(
+                        entry=entries[rows[i]],
+                        position=position,
+                        field_name=field_name,
+                        referenced_identifyer=referenced_identifyer,
+                        referenced_id=int(referenced_ids[i]),
+                        line_number=None if line_numbers is None else line_numbers[position],
+                    )
+                )
+
+    dangling_references.sort(
+        key=lambda reference: (
+            reference.position,
+            list(type(reference.entry).references).index(reference.field_name),
+        )
+    )
+    return dangling_references
+
+
+def check_references(bulk_data: BulkDataSection, line_numbers: Sequence[int] | None = None) -> None:
+    """Make sure that no entry refers to an entry, that is not present in the bulk data section.
+
+    Raises:
+        DanglingReferencesError: listing all dangling references, see validate_references.
+
+    """
+    dangling_references = validate_references(bulk_data, line_numbers)
+    if dangling_references:
+        raise DanglingReferencesError(dangling_references)
+
+
+def _entries_by_type(
+    bulk_data: BulkDataSection,
+) -> list[tuple[type[_BulkDataEntry], list[_BulkDataEntry]]]:
+    return [
+        (entry_type, bulk_data.entries.of_type(entry_type))
+        for entry_type in bulk_data.entries.entry_types()
+        if entry_type.references
+    ]
+
+
+def _reference_column(
+    entries: list[_BulkDataEntry], field_name: str
+) -> tuple[Sequence[int], npt.NDArray[np.int64]]:
+    """Return the referenced ids in a field of all entries and the row of the entry of each id.
+
+    Blank fields are skipped and fields containing lists contribute one id per item.
+    """
+    values = list(map(attrgetter(field_name), entries))
+    rows: Sequence[int]
+    if any(isinstance(value, list) for value in values):
+        rows = list(
+            chain.from_iterable(
+                repeat(row, len(value)) for row, value in enumerate(values) if value is not None
+            )
+        )
+        ids = list(chain.from_iterable(value for value in values if value is not None))
+    elif None in values:
+        rows = [row for row, value in enumerate(values) if value is not None]
+        ids = [values[row] for row in rows]
+    else:
+        rows = range(len(values))
+        ids = values
+    return rows, np.fromiter(ids, np.int64, len(ids))
+
+
+def _ids(bulk_data: BulkDataSection, identifyer: str) -> npt.NDArray[np.int64]:
+    entry_type = entry_class_for(identifyer)
+    if entry_type is None or entry_type.id_field is None:
+        return np.empty(0, np.int64)
+    entries = bulk_data.entries.of_type(entry_type)
+    return np.fromiter(map(attrgetter(entry_type.id_field), entries), np.int64, len(entries))
+
+
+class DanglingReferencesError(ValueError):
+    """Raised when entries refer to entries, that are not present in the bulk data section."""
+
+    def __init__(self, dangling_references: list[DanglingReference]) -> None:
+        self.dangling_references = dangling_references
+        super().__init__(
+            f"{len(dangling_references)} dangling references:\n"
+            + "\n".join(str(reference) for reference in dangling_references)
+        )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, fields, replace
+from typing import TextIO
 
 from .subcase import Subcase
 
@@ -24,7 +26,7 @@ class CaseControlSection:
         return CaseControlSection(general=Subcase.empty(), subcases={})
 
     @classmethod
-    def from_file_content(cls, file_content: list[str]) -> CaseControlSection:
+    def from_file_content(cls, file_content: Iterable[str]) -> CaseControlSection:
         """Construct this class from the contents of a nastran file."""
         case_control_section = CaseControlSection.empty()
 
@@ -46,6 +48,23 @@ class CaseControlSection:
 
         return case_control_section
 
+    def resolve_subcase(self, subcase_id: int) -> Subcase:
+        """Return a subcase with its unset fields taken from the general section.
+
+        Raises:
+            KeyError: if there is no subcase with the id.
+
+        """
+        subcase = self.subcases[subcase_id]
+        return replace(
+            subcase,
+            **{
+                field.name: getattr(self.general, field.name)
+                for field in fields(subcase)
+                if getattr(subcase, field.name) is None
+            },
+        )
+
     def to_file_content(self) -> list[str]:
         """Export this section into lines for saving to a nastran file."""
         file_content = self.general.to_file_content()
@@ -54,6 +73,10 @@ class CaseControlSection:
             file_content.extend(case.to_file_content())
         return file_content
 
+    def write_to(self, stream: TextIO) -> None:
+        """Write this section to a text stream, the same lines as to_file_content."""
+        stream.writelines(f"{line}\n" for line in self.to_file_content())
+
 
 def _leftpad8(s: str | int) -> str:
     return str(s).rjust(8, " ")
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-
-from .bulk_data import BulkDataSection
+from typing import TextIO
+
+from .bulk_data import (
+    BulkDataSection,
+    IncludeCache,
+    parse_bulk_data_in_parallel,
+    resolve_includes,
+)
 from .case_control import CaseControlSection
 
+_HEADER = ("SOL 101", "CEND")
+"Lines preceding the case control section of an exported simulation."
+
+_BULK_DATA_START = "BEGIN BULK"
+_BULK_DATA_END = "ENDDATA"
+
+_CASE_CONTROL = "Case Control Cards"
+"Comment preceding the case control section in files exported by HyperMesh."
+
+_BULK_DATA = "Bulk Data Cards"
+"Comment preceding the bulk data section in files exported by HyperMesh."
+
 
 @dataclass
 class NastranSimulation:
@@ -15,55 +34,124 @@ class NastranSimulation:
     bulk_data: BulkDataSection = field(default_factory=BulkDataSection.empty)
 
     @classmethod
-    def from_file_content(cls, file_content: list[str]) -> NastranSimulation:
-        """Construct this class from the contents of a nastran file."""
-        lines_sorted_by_section: dict[str, list[str]] = {"unassigned": []}
-
-        current_section_id = "unassigned"
-        for line in _remove_linebreak_from_file_content(file_content):
-            if "Case Control Cards" in line:
-                current_section_id = "case_control"
-                lines_sorted_by_section[current_section_id] = []
-
-            if "Bulk Data Cards" in line:
-                current_section_id = "bulk_data"
-                lines_sorted_by_section[current_section_id] = []
-
+    def from_file_content(
+        cls, file_content: Iterable[str], max_workers: int | None = 1
+    ) -> NastranSimulation:
+        """Construct this class from the contents of a nastran file.
+
+        The lines are consumed in a single pass and handed to the section parsers as they are
+        read, so any iterable of lines (like an open file) can be passed without holding a copy
+        of the entire file in memory. With more than one worker, large bulk data sections are
+        parsed in chunks by a pool of processes, see parse_bulk_data_in_parallel.
+
+        The case control section starts after the "Case Control Cards" comment or the CEND line,
+        the bulk data section after the "Bulk Data Cards" comment or the BEGIN BULK line.
+
+        Raises:
+            MissingSectionError: if the start of the case control or bulk data section is missing.
+
+        """
+        lines = _remove_linebreak_from_file_content(file_content)
+
+        if not _skip_lines_until(lines, _starts_case_control):
+            raise MissingSectionError(_CASE_CONTROL)
+        case_control_lines = []
+        for line in lines:
+            if _starts_bulk_data(line):
+                break
             if not _line_should_be_skipped(line):
-                lines_sorted_by_section[current_section_id].append(line)
+                case_control_lines.append(line)
+        else:
+            raise MissingSectionError(_BULK_DATA)
+
+        case_control = CaseControlSection.from_file_content(case_control_lines)
+        bulk_data = parse_bulk_data_in_parallel(_section_lines(lines), max_workers)
 
-        return NastranSimulation(
-            case_control=CaseControlSection.from_file_content(
-                lines_sorted_by_section["case_control"]
-            ),
-            bulk_data=BulkDataSection.from_file_content(lines_sorted_by_section["bulk_data"]),
-        )
+        return NastranSimulation(case_control=case_control, bulk_data=bulk_data)
 
     @classmethod
-    def from_path(cls, path: Path) -> NastranSimulation:
-        """Read the contents of a path pointing to a file and construct this class from it."""
+    def from_path(
+        cls,
+        path: Path,
+        include_cache: IncludeCache | None = None,
+        max_workers: int | None = 1,
+    ) -> NastranSimulation:
+        """Read the contents of a path pointing to a file and construct this class from it.
+
+        Files included in the bulk data are read as well and their entries are added to the bulk
+        data of the simulation, see resolve_includes.
+
+        Args:
+            path: the location of the nastran file.
+            include_cache: included files parsed while reading this file before. Pass the same
+                cache when reading a model again to only parse the included files that changed.
+            max_workers: the maximum number of processes parsing the bulk data and included files
+                at the same time, see parse_bulk_data_in_parallel. None stands for the number of
+                processors of the machine. By default, the file is parsed in the calling process,
+                which needs no guard of the main module on platforms starting processes by spawning
+                them.
+
+        """
         with path.open() as nastran_file:
-            return NastranSimulation.from_file_content(nastran_file.readlines())
+            simulation = NastranSimulation.from_file_content(nastran_file, max_workers)
+
+        if simulation.bulk_data.includes:
+            simulation.bulk_data = resolve_includes(
+                simulation.bulk_data, path.parent, include_cache, max_workers
+            )
+        return simulation
 
     def to_file_content(self) -> list[str]:
         """Export this simulation to lines that can be stored in a nastran file."""
-        file_content = ["SOL 101", "CEND"]
+        file_content = list(_HEADER)
         file_content.extend(self.case_control.to_file_content())
-        file_content.append("BEGIN BULK")
+        file_content.append(_BULK_DATA_START)
         file_content.extend(self.bulk_data.to_file_content())
-        file_content.append("ENDDATA")
+        file_content.append(_BULK_DATA_END)
         return _add_linebreaks_to_file_content(file_content)
 
+    def write_to(self, stream: TextIO) -> None:
+        """Write this simulation to a text stream, the same lines as to_file_content.
+
+        The cards are formatted one after another while writing, so exporting a large model only
+        needs memory for the model itself, not for its lines.
+
+        Example:
+        ```python
+        with Path("/path/to/nastran.bdf").open("w") as file_:
+            simulation.write_to(file_)
+        ```
+        """
+        stream.writelines(f"{line}\n" for line in _HEADER)
+        self.case_control.write_to(stream)
+        stream.write(f"{_BULK_DATA_START}\n")
+        self.bulk_data.write_to(stream)
+        stream.write(f"{_BULK_DATA_END}\n")
 
-def _remove_linebreak_from_file_content(file_content: list[str]) -> list[str]:
-    stripped_file_content = []
+
+def _remove_linebreak_from_file_content(file_content: Iterable[str]) -> Iterator[str]:
     for line in file_content:
-        if line.endswith("\n"):
-            stripped_file_content.append(line[:-1])
-        else:
-            stripped_file_content.append(line)
+        yield line.removesuffix("\n")
+
+
+def _skip_lines_until(lines: Iterator[str], is_start: Callable[[str], bool]) -> bool:
+    """Consume the lines up to the start of a section and return whether the start was found."""
+    return any(is_start(line) for line in lines)
+
+
+def _starts_case_control(line: str) -> bool:
+    return _CASE_CONTROL in line or line.strip().upper() == "CEND"
 
-    return stripped_file_content
+
+def _starts_bulk_data(line: str) -> bool:
+    return _BULK_DATA in line or line.strip().upper().startswith(_BULK_DATA_START)
+
+
+def _section_lines(lines: Iterator[str]) -> Iterator[str]:
+    """Yield the relevant lines of the last section."""
+    for line in lines:
+        if not _line_should_be_skipped(line):
+            yield line
 
 
 def _add_linebreaks_to_file_content(file_content: list[str]) -> list[str]:
@@ -75,3 +163,10 @@ def _line_should_be_skipped(line: str) -> bool:
     line_is_a_comment = line.startswith("$")
 
     return line_is_empty or line_is_a_comment
+
+
+class MissingSectionError(ValueError):
+    """Raised when the start of a section of a nastran file can not be found."""
+
+    def __init__(self, section_marker: str) -> None:
+        super().__init__(f"The nastran file does not contain the {section_marker} section.")
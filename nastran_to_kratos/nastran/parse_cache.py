@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from dataclasses import fields
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .bulk_data import BulkDataSection, IncludeCache, resolve_includes
+from .bulk_data.entries import _BulkDataEntry, entry_class_for
+from .case_control import CaseControlSection
+from .nastran_simulation import NastranSimulation
+
+CACHE_FORMAT_VERSION = 2
+"Version of the layout of the cache files. Files of other versions are never read."
+
+DEFAULT_MAX_SIZE = 2**30
+"Default maximum size of all files in a cache directory in bytes (1 GiB)."
+
+_HASH_BLOCK_SIZE = 2**20
+
+
+class ParseCache:
+    """A directory storing parsed nastran files, so that unchanged files are not parsed again.
+
+    Simulations are stored under the content hash of the nastran file, without the entries of the
+    files it includes. Every included file is stored on its own under its content hash, like a
+    nastran file with an empty case control section. So after editing one included file, like the
+    loads of a model, only that file is parsed again, even by another process.
+
+    The entries of the bulk data are stored column by column in a NumPy .npz file instead of being
+    pickled, one group of columns for each entry type. Once the size of all files in the directory
+    exceeds the maximum size, the least recently used files are deleted.
+
+    Example:
+    ```python
+    cache = ParseCache(Path("/path/to/cache/dir"))
+    nastran = cache.read(Path("/path/to/nastran.bdf"))
+    ```
+    """
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = directory
+        "Location of the cache files. It is created if it does not exist."
+
+        self.max_size = max_size
+        "Maximum size of all files in the directory in bytes."
+
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def read(self, path: Path, max_workers: int | None = 1) -> NastranSimulation:
+        """Return the simulation in a nastran file, parsing it only if it is not in the cache.
+
+        Args:
+            path: the location of the nastran file.
+            max_workers: the maximum number of processes parsing the file, if it is not cached,
+                see NastranSimulation.from_path.
+
+        """
+        cache_path = self._cache_path(path)
+        simulation = self.load(cache_path)
+        if simulation is None:
+            with path.open() as nastran_file:
+                simulation = NastranSimulation.from_file_content(nastran_file, max_workers)
+            self.store(cache_path, simulation)
+
+        if simulation.bulk_data.includes:
+            simulation.bulk_data = resolve_includes(
+                simulation.bulk_data, path.parent, _CachedIncludeFiles(self), max_workers
+            )
+        return simulation
+
+    def load(self, cache_path: Path) -> NastranSimulation | None:
+        """Return the simulation in a cache file or None if it is missing or of another version.
+
+        The files included by the simulation are not resolved.
+        """
+        try:
+            with np.load(cache_path) as cache_file:
+                columns = {name: cache_file[name] for name in cache_file.files}
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+
+        metadata = json.loads(_text_from_array(columns.pop("metadata")))
+        if metadata["version"] != CACHE_FORMAT_VERSION:
+            return None
+
+        os.utime(cache_path)
+        return NastranSimulation(
+            case_control=CaseControlSection.from_file_content(metadata["case_control"]),
+            bulk_data=_bulk_data_from_columns(metadata, columns),
+        )
+
+    def store(self, cache_path: Path, simulation: NastranSimulation) -> None:
+        """Write a simulation to a cache file and delete the least recently used cache files.
+
+        The INCLUDE statements of the simulation are stored, not the entries of the included files.
+        Simulations containing entries that can not be stored column by column are not cached.
+        """
+        try:
+            metadata, columns = _bulk_data_to_columns(simulation.bulk_data)
+        except UnsupportedFieldValueError:
+            return
+
+        metadata["version"] = CACHE_FORMAT_VERSION
+        metadata["case_control"] = simulation.case_control.to_file_content()
+        columns["metadata"] = _text_to_array(json.dumps(metadata))
+
+        # Write to a temporary file first, so no other process reads a partially written file.
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as file_:
+            np.savez(file_, **columns)  # type: ignore[arg-type]
+        Path(file_.name).replace(cache_path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used cache files until the maximum size is not exceeded."""
+        cache_files = sorted(
+            (cache_path.stat().st_mtime_ns, cache_path.stat().st_size, cache_path)
+            for cache_path in self.directory.glob("*.npz")
+        )
+        total_size = sum(size for _, size, _ in cache_files)
+        for _, size, cache_path in cache_files:
+            if total_size <= self.max_size:
+                break
+            cache_path.unlink(missing_ok=True)
+            total_size -= size
+
+    def _cache_path(self, path: Path) -> Path:
+        return self.directory / f"{_content_hash(path)}.npz"
+
+
+class _CachedIncludeFiles(IncludeCache):
+    """The included files of a model, which are looked up in a ParseCache by their content hash.
+
+    Files parsed while resolving the includes are stored in the ParseCache as well.
+    """
+
+    def __init__(self, parse_cache: ParseCache) -> None:
+        super().__init__()
+        self._parse_cache = parse_cache
+        self._cache_paths: dict[Path, Path] = {}
+
+    def get(self, path: Path) -> BulkDataSection | None:
+        """Return the section of a file from the ParseCache or None if it is not cached."""
+        simulation = self._parse_cache.load(self._cache_path(path))
+        return None if simulation is None else simulation.bulk_data
+
+    def put(self, path: Path, section: BulkDataSection) -> None:
+        """Store the section parsed from a file in the ParseCache."""
+        super().put(path, section)
+        self._parse_cache.store(self._cache_path(path), NastranSimulation(bulk_data=section))
+
+    def _cache_path(self, path: Path) -> Path:
+        # Every file is only hashed once, although it is looked up before it is stored.
+        cache_path = self._cache_paths.get(path)
+        if cache_path is None:
+            cache_path = self._cache_paths[path] = self._parse_cache._cache_path(path)  # noqa: SLF001
+        return cache_path
+
+
+def _content_hash(path: Path) -> str:
+    content_hash = hashlib.sha256()
+    with path.open("rb") as file_:
+        while block := file_.read(_HASH_BLOCK_SIZE):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+def _bulk_data_to_columns(
+    bulk_data: BulkDataSection,
+) -> tuple[dict[str, Any], dict[str, np.ndarray]]:
+    type_indices: dict[type[_BulkDataEntry], int] = {}
+    entries_by_type: list[list[_BulkDataEntry]] = []
+    order = []
+    for entry in bulk_data.entries:
+        type_index = type_indices.get(type(entry))
+        if type_index is None:
+            if entry_class_for(getattr(type(entry), "identifyer", "")) is not type(entry):
+                raise UnsupportedFieldValueError(type(entry).__name__)
+            type_index = type_indices[type(entry)] = len(entries_by_type)
+            entries_by_type.append([])
+        entries_by_type[type_index].append(entry)
+        order.append(type_index)
+
+    metadata: dict[str, Any] = {"entry_types": [], "includes": bulk_data.includes}
+    columns = {"order": np.array(order, dtype=np.int32)}
+    for entry_type, type_index in type_indices.items():
+        entries = entries_by_type[type_index]
+        kinds = {
+            name: _encode_column(
+                [getattr(entry, name) for entry in entries], f"{type_index}.{name}", columns
+            )
+            for name in _field_names(entry_type)
+        }
+        metadata["entry_types"].append({"identifyer": entry_type.identifyer, "fields": kinds})
+
+    return metadata, columns
+
+
+def _bulk_data_from_columns(
+    metadata: dict[str, Any], columns: dict[str, np.ndarray]
+) -> BulkDataSection:
+    entries_by_type = []
+    for type_index, entry_type_metadata in enumerate(metadata["entry_types"]):
+        entry_type = entry_class_for(entry_type_metadata["identifyer"])
+        if entry_type is None:
+            raise UnsupportedFieldValueError(entry_type_metadata["identifyer"])
+
+        field_columns = [
+            _decode_column(kind, f"{type_index}.{name}", columns)
+            for name, kind in entry_type_metadata["fields"].items()
+        ]
+        entries_by_type.append(iter(list(map(entry_type, *field_columns))))
+
+    entries = [next(entries_by_type[type_index]) for type_index in columns["order"].tolist()]
+    return BulkDataSection(entries=entries, includes=metadata["includes"])
+
+
+def _field_names(entry_type: type[_BulkDataEntry]) -> list[str]:
+    return [field.name for field in fields(entry_type) if field.init]  # type: ignore[arg-type]
+
+
+def _encode_column(values: list[Any], prefix: str, columns: dict[str, np.ndarray]) -> str:
+    """Store the values of one field in columns and return the kind of the values."""
+    present = [value for value in values if value is not None]
+    if len(present) < len(values):
+        columns[f"{prefix}.is_none"] = np.array([value is None for value in values])
+
+    value_types = {type(value) for value in present}
+    if value_types <= {int}:
+        columns[prefix] = np.array([0 if value is None else value for value in values], np.int64)
+        return "int"
+    if value_types <= {int, float}:
+        columns[prefix] = np.array([np.nan if value is None else value for value in values])
+        return "float"
+    if value_types == {str}:
+        columns[prefix] = np.array(["" if value is None else value for value in values], np.str_)
+        return "str"
+    if value_types == {list} and all(type(item) is int for value in present for item in value):
+        lengths = [0 if value is None else len(value) for value in values]
+        columns[f"{prefix}.offsets"] = np.cumsum([0, *lengths], dtype=np.int64)
+        columns[prefix] = np.array([item for value in present for item in value], dtype=np.int64)
+        return "int_list"
+
+    raise UnsupportedFieldValueError(prefix)
+
+
+def _decode_column(kind: str, prefix: str, columns: dict[str, np.ndarray]) -> list[Any]:
+    decoded: list[Any] = columns[prefix].tolist()
+    if kind == "int_list":
+        offsets = columns[f"{prefix}.offsets"].tolist()
+        decoded = [decoded[start:end] for start, end in pairwise(offsets)]
+
+    is_none = columns.get(f"{prefix}.is_none")
+    if is_none is not None:
+        for i in np.flatnonzero(is_none).tolist():
+            decoded[i] = None
+    return decoded
+
+
+def _text_to_array(text: str) -> npt.NDArray[np.uint8]:
+    return np.frombuffer(text.encode(), dtype=np.uint8)
+
+
+def _text_from_array(array: npt.NDArray[np.uint8]) -> str:
+    return array.tobytes().decode()
+
+
+class UnsupportedFieldValueError(TypeError):
+    """Raised when an entry contains a value, that can not be stored in a column."""
+
+    def __init__(self, location: str) -> None:
+        super().__init__(f"The values of {location} can not be stored in a cache file.")
@@ -1,16 +1,35 @@
+import json
 from pathlib import Path
 
-from .nastran import NastranSimulation
+from .nastran import NastranSimulation, ParseCache
 from .translation_layer import TranslationLayer
 
 
-def nastran_to_kratos(nastran_input: Path | str, output_dir: Path | str) -> None:
+def nastran_to_kratos(
+    nastran_input: Path | str,
+    output_dir: Path | str,
+    cache_dir: Path | str | None = None,
+    *,
+    group_properties: bool = False,
+    renumber_nodes: bool = False,
+) -> None:
     """Convert a simulation in the nastran format into kratos.
 
     Args:
         nastran_input : The path to the nastran file (usually ending with .bdf)
         output_dir : The path to the directory where the kratos files should be saved (must have
             write permission).
+        cache_dir : The path to a directory for caching parsed nastran files (optional). If the
+            nastran file has been converted with the same cache directory before and did not
+            change, it is loaded from the cache instead of being parsed again. The same holds for
+            each of its included files on its own.
+        group_properties : Whether trusses with the same cross section and material share one
+            property, sub-model part and material in the kratos files, see
+            TranslationLayer.to_kratos.
+        renumber_nodes : Whether the nodes are numbered from 1 in an order with a small bandwidth
+            of the stiffness matrix, see TranslationLayer.renumber_nodes. The original grid id of
+            every node is then written to node_ids.json in the output directory, see
+            NodeRenumbering.
 
     Example:
     ```python
@@ -22,11 +41,16 @@ def nastran_to_kratos(nastran_input: Path | str, output_dir: Path | str) -> None
     nastran_input = Path(nastran_input)
     output_dir = Path(output_dir)
 
-    with nastran_input.open() as nastran_file:
-        nastran_file_content = nastran_file.readlines()
-
-    nastran = NastranSimulation.from_file_content(nastran_file_content)
+    if cache_dir is None:
+        nastran = NastranSimulation.from_path(nastran_input)
+    else:
+        nastran = ParseCache(Path(cache_dir)).read(nastran_input)
     translation_layer = TranslationLayer.from_nastran(nastran)
-    kratos = translation_layer.to_kratos()
+    if renumber_nodes:
+        translation_layer, renumbering = translation_layer.renumber_nodes()
+    kratos = translation_layer.to_kratos(group_properties=group_properties)
 
     kratos.write_to_directory(output_dir)
+    if renumber_nodes:
+        with (output_dir / "node_ids.json").open("w") as node_ids_file:
+            json.dump(renumbering.to_json(), node_ids_file)
@@ -1,14 +1,19 @@
 """All about translation layer."""
 
+from .columnar_translation_layer import ColumnarTranslationLayer, UnsupportedConnectorError
 from .connector import Connector, RBE2Connector, Truss, connectors_from_nastran, trusses_from_nastran
 from .constraint import Constraint, constraints_from_nastran
 from .load import Load, loads_from_nastran
 from .material import Material, materials_from_nastran
-from .point import Point, nodes_from_nastran
+from .point import Point, nodes_from_grid_table, nodes_from_nastran
+from .renumbering import NodeRenumbering
+from .stages import StageTimings, run_stages
 from .translation_layer import TranslationLayer
 
 __all__ = [
     "TranslationLayer",
+    "ColumnarTranslationLayer",
+    "UnsupportedConnectorError",
     "Connector",
     "Truss",
     "RBE2Connector",
@@ -19,7 +24,11 @@ __all__ = [
     "loads_from_nastran",
     "Point",
     "nodes_from_nastran",
+    "nodes_from_grid_table",
     "Material",
     "materials_from_nastran",
     "connectors_from_nastran",
+    "StageTimings",
+    "run_stages",
+    "NodeRenumbering",
 ]
@@ -0,0 +1,597 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from itertools import starmap
+from operator import attrgetter
+
+import numpy as np
+import numpy.typing as npt
+
+from nastran_to_kratos.kratos.kratos_simulation import KratosSimulation, SimulationParameters
+from nastran_to_kratos.kratos.material import KratosMaterial
+from nastran_to_kratos.kratos.model import Condition, Element, Model, Node, SubModel
+from nastran_to_kratos.kratos.simulation_parameters import KratosConstraint, KratosLoad
+from nastran_to_kratos.nastran import BulkDataSection, NastranSimulation
+from nastran_to_kratos.nastran.bulk_data.entries import Force, Mat1, Prod, Spc
+from nastran_to_kratos.nastran.bulk_data.tables import MISSING, CrodTable, GridTable
+
+from .connector import Connector, Truss, resolve_truss_materials
+from .constraint import Constraint
+from .load import Load
+from .material import Material
+from .point import Point
+from .translation_layer import TranslationLayer, _to_nastran_case_control
+
+_AXES = 3
+_COMPONENTS = np.arange(1, 2 * _AXES + 1)
+"The nastran components: the translations along x, y, z and the rotations around x, y, z."
+
+
+@dataclass(eq=False)
+class ColumnarTranslationLayer:
+    """A translation layer storing all nodes, trusses, constraints and loads in NumPy arrays.
+
+    It holds the same simulation as a TranslationLayer with trusses as connectors and translates it
+    into the same kratos and nastran simulations. Instead of one object per node or truss, every
+    quantity is a column with one row per item, so all conversions work on whole columns and the
+    only objects created are the ones of the target format.
+    """
+
+    node_ids: npt.NDArray[np.int64]
+    "Identification number of each node, shape (N,)."
+
+    coordinates: npt.NDArray[np.float64]
+    "Position of each node, shape (N, 3)."
+
+    connectivity: npt.NDArray[np.int64]
+    "Ids of the first and second node of each truss, shape (E, 2)."
+
+    property_indices: npt.NDArray[np.intp]
+    "Row of the cross section and material of each truss in the property columns, shape (E,)."
+
+    cross_sections: npt.NDArray[np.float64]
+    "Cross section of each property, shape (P,)."
+
+    material_names: list[str]
+    "Name of the material of each property."
+
+    young_moduli: npt.NDArray[np.float64]
+    "Young's modulus of the material of each property or NaN if it is unknown, shape (P,)."
+
+    constraint_node_ids: npt.NDArray[np.int64]
+    "Id of the constrained node of each constraint, shape (C,)."
+
+    constrained_components: npt.NDArray[np.bool_]
+    "Whether each constraint fixes the translations and rotations along x, y and z, shape (C, 6)."
+
+    load_node_ids: npt.NDArray[np.int64]
+    "Id of the loaded node of each load, shape (L,)."
+
+    load_moduli: npt.NDArray[np.float64]
+    "Modulus of each load, shape (L,)."
+
+    load_directions: npt.NDArray[np.float64]
+    "Direction of each load, shape (L, 3)."
+
+    @classmethod
+    def empty(cls) -> ColumnarTranslationLayer:
+        """Construct a translation layer without any nodes, trusses, constraints or loads."""
+        return ColumnarTranslationLayer(
+            node_ids=np.empty(0, np.int64),
+            coordinates=np.empty((0, _AXES)),
+            connectivity=np.empty((0, 2), np.int64),
+            property_indices=np.empty(0, np.intp),
+            cross_sections=np.empty(0),
+            material_names=[],
+            young_moduli=np.empty(0),
+            constraint_node_ids=np.empty(0, np.int64),
+            constrained_components=np.empty((0, len(_COMPONENTS)), np.bool_),
+            load_node_ids=np.empty(0, np.int64),
+            load_moduli=np.empty(0),
+            load_directions=np.empty((0, _AXES)),
+        )
+
+    @classmethod
+    def from_nastran(
+        cls, nastran: NastranSimulation, subcase_id: int | None = None
+    ) -> ColumnarTranslationLayer:
+        """Construct this class from nastran, the same as TranslationLayer.from_nastran.
+
+        Every PROD referenced by a CROD becomes one property. The nodes, trusses and properties are
+        taken from the column-oriented tables of the bulk data section.
+
+        Raises:
+            KeyError: if there is no subcase with the id or if a CROD references a missing PROD or
+                a PROD a missing MAT1.
+
+        """
+        bulk_data = nastran.bulk_data
+        grids = bulk_data.grid_table().sorted_by_id()
+        crods = bulk_data.crod_table()
+        prods = bulk_data.prod_table()
+        mat1s = bulk_data.mat1_table()
+        prod_rows, _ = crods.property_rows(prods, mat1s)
+        used_prod_rows, property_indices = np.unique(prod_rows, return_inverse=True)
+        mat1_rows = mat1s.rows(prods.mid[used_prod_rows])
+        forces, spcs = _selected_sets(nastran, subcase_id)
+
+        return ColumnarTranslationLayer(
+            node_ids=grids.id,
+            coordinates=grids.coordinates,
+            connectivity=crods.connectivity,
+            property_indices=property_indices.astype(np.intp),
+            cross_sections=prods.a[used_prod_rows],
+            material_names=[f"MAT1_{mid}" for mid in mat1s.mid[mat1_rows].tolist()],
+            young_moduli=mat1s.e[mat1_rows],
+            constraint_node_ids=_column(spcs, "g1", np.int64),
+            constrained_components=_components_to_flags(_column(spcs, "c1", np.int64)),
+            load_node_ids=_column(forces, "g", np.int64),
+            load_moduli=_column(forces, "f", np.float64),
+            load_directions=np.column_stack(
+                [_column(forces, name, np.float64) for name in ("n1", "n2", "n3")]
+            ).reshape(-1, _AXES),
+        )
+
+    @classmethod
+    def from_kratos(cls, kratos: KratosSimulation) -> ColumnarTranslationLayer:
+        """Construct this class from kratos, the same as TranslationLayer.from_kratos.
+
+        Every kratos material used by a truss becomes one property.
+
+        Raises:
+            KeyError: if no material is found for a truss.
+
+        """
+        layer = ColumnarTranslationLayer.empty()
+        model = kratos.model
+        if model is None:
+            return layer
+
+        layer.node_ids = np.fromiter(model.nodes, np.int64, len(model.nodes))
+        # The y and z axes are swapped, like in Point.from_kratos.
+        layer.coordinates = np.array(
+            [(node.x, node.z, node.y) for node in model.nodes.values()], dtype=np.float64
+        ).reshape(-1, _AXES)
+
+        trusses = model.elements.get("TrussLinearElement3D2N", {})
+        if kratos.materials is not None and trusses:
+            connectivity = []
+            property_indices = []
+            property_index_by_material: dict[int, int] = {}
+            property_materials: list[KratosMaterial] = []
+            for truss, material in resolve_truss_materials(trusses, kratos.materials):
+                connectivity.append(truss.node_ids[:2])
+                property_index = property_index_by_material.setdefault(
+                    id(material), len(property_materials)
+                )
+                if property_index == len(property_materials):
+                    property_materials.append(material)
+                property_indices.append(property_index)
+
+            layer.connectivity = np.array(connectivity, dtype=np.int64)
+            layer.property_indices = np.array(property_indices, dtype=np.intp)
+            layer.cross_sections = np.array(
+                [material.variables["CROSS_AREA"] for material in property_materials], np.float64
+            )
+            layer.material_names = [material.material_name for material in property_materials]
+            layer.young_moduli = np.array(
+                [material.variables["YOUNG_MODULUS"] for material in property_materials],
+                np.float64,
+            )
+
+        if kratos.parameters is not None:
+            constraints = kratos.parameters.constraints
+            loads = kratos.parameters.loads
+            layer.constraint_node_ids = _sub_model_nodes(model, constraints)
+            layer.constrained_components = np.zeros((len(constraints), len(_COMPONENTS)), np.bool_)
+            layer.constrained_components[:, :_AXES] = np.array(
+                [constraint.constrained_per_axis for constraint in constraints], np.bool_
+            ).reshape(-1, _AXES)
+            layer.load_node_ids = _sub_model_nodes(model, loads)
+            layer.load_moduli = np.array([load.modulus for load in loads], np.float64)
+            layer.load_directions = np.array([load.direction for load in loads], np.float64).reshape(
+                -1, _AXES
+            )
+
+        return layer
+
+    @classmethod
+    def from_translation_layer(cls, translation_layer: TranslationLayer) -> ColumnarTranslationLayer:
+        """Construct this class from a TranslationLayer.
+
+        Trusses with the same cross section and material share one property.
+
+        Raises:
+            UnsupportedConnectorError: if a connector is not a truss.
+
+        """
+        trusses: list[Truss] = []
+        for connector in translation_layer.connectors:
+            if not isinstance(connector, Truss):
+                raise UnsupportedConnectorError(connector)
+            trusses.append(connector)
+
+        property_index_by_key: dict[tuple[float, str, float | None], int] = {}
+        property_indices = [
+            property_index_by_key.setdefault(
+                (truss.cross_section, truss.material.name, truss.material.young_modulus),
+                len(property_index_by_key),
+            )
+            for truss in trusses
+        ]
+        properties = list(property_index_by_key)
+
+        nodes = translation_layer.nodes
+        constraints = translation_layer.constraints
+        loads = translation_layer.loads
+        return ColumnarTranslationLayer(
+            node_ids=_column(nodes, "id", np.int64),
+            coordinates=np.array([(node.x, node.y, node.z) for node in nodes], np.float64).reshape(
+                -1, _AXES
+            ),
+            connectivity=np.array(
+                [(truss.first_point_index, truss.second_point_index) for truss in trusses],
+                np.int64,
+            ).reshape(-1, 2),
+            property_indices=np.array(property_indices, np.intp),
+            cross_sections=np.array([key[0] for key in properties], np.float64),
+            material_names=[key[1] for key in properties],
+            young_moduli=np.array(
+                [np.nan if key[2] is None else key[2] for key in properties], np.float64
+            ),
+            constraint_node_ids=_column(constraints, "node_id", np.int64),
+            constrained_components=np.array(
+                [
+                    (*constraint.translation_by_axis, *constraint.rotation_by_axis)
+                    for constraint in constraints
+                ],
+                np.bool_,
+            ).reshape(-1, len(_COMPONENTS)),
+            load_node_ids=_column(loads, "node_id", np.int64),
+            load_moduli=_column(loads, "modulus", np.float64),
+            load_directions=np.array([load.direction for load in loads], np.float64).reshape(
+                -1, _AXES
+            ),
+        )
+
+    def to_translation_layer(self) -> TranslationLayer:
+        """Export this simulation to a TranslationLayer, with one Material per property."""
+        materials = [
+            Material(name=name, young_modulus=young_modulus)
+            for name, young_modulus in zip(
+                self.material_names, _floats_or_none(self.young_moduli), strict=True
+            )
+        ]
+        cross_sections = self.cross_sections.tolist()
+        connectors: list[Connector] = [
+            Truss(
+                first_point_index=g1,
+                second_point_index=g2,
+                cross_section=cross_sections[property_index],
+                material=materials[property_index],
+            )
+            for (g1, g2), property_index in zip(
+                self.connectivity.tolist(), self.property_indices.tolist(), strict=True
+            )
+        ]
+        return TranslationLayer(
+            nodes=list(map(Point, self.node_ids.tolist(), *self.coordinates.T.tolist())),
+            connectors=connectors,
+            constraints=[
+                Constraint(
+                    node_id=node_id,
+                    translation_by_axis=tuple(components[:_AXES]),  # type: ignore[arg-type]
+                    rotation_by_axis=tuple(components[_AXES:]),  # type: ignore[arg-type]
+                )
+                for node_id, components in zip(
+                    self.constraint_node_ids.tolist(),
+                    self.constrained_components.tolist(),
+                    strict=True,
+                )
+            ],
+            loads=[
+                Load(node_id=node_id, modulus=modulus, direction=tuple(direction))  # type: ignore[arg-type]
+                for node_id, modulus, direction in zip(
+                    self.load_node_ids.tolist(),
+                    self.load_moduli.tolist(),
+                    self.load_directions.tolist(),
+                    strict=True,
+                )
+            ],
+        )
+
+    def to_kratos(self, *, group_properties: bool = False) -> KratosSimulation:
+        """Export this simulation to kratos, the same as TranslationLayer.to_kratos."""
+        truss_count = len(self.connectivity)
+        if group_properties:
+            property_ids = self._group_ids()
+            _, material_rows = np.unique(property_ids, return_index=True)
+            group_ids = list(range(1, len(material_rows) + 1))
+            properties_ids = [0, *group_ids]
+            truss_submodels = self._grouped_truss_submodels(property_ids)
+            materials = self._kratos_materials(
+                material_rows, [f"Structure.trusses_{i}" for i in group_ids], group_ids
+            )
+        else:
+            property_ids = np.zeros(truss_count, np.int64)
+            properties_ids = [0]
+            truss_submodels = {
+                f"truss_{i}": SubModel(nodes=nodes, elements=[i])
+                for i, nodes in enumerate(self.connectivity.tolist(), 1)
+            }
+            materials = self._kratos_materials(
+                np.arange(truss_count),
+                [f"Structure.truss_{i}" for i in range(1, truss_count + 1)],
+                [0] * truss_count,
+            )
+
+        properties: dict[int, dict[str, float]] = {
+            properties_id: {} for properties_id in properties_ids
+        }
+        load_node_ids = self.load_node_ids.tolist()
+        model = Model(
+            properties=properties,
+            nodes=dict(
+                zip(self.node_ids.tolist(), starmap(Node, self.coordinates.tolist()), strict=True)
+            ),
+            elements={
+                "TrussLinearElement3D2N": dict(
+                    zip(
+                        range(1, truss_count + 1),
+                        map(Element, property_ids.tolist(), self.connectivity.tolist()),
+                        strict=True,
+                    )
+                )
+            },
+            conditions={
+                "PointLoadCondition2D1N": {
+                    i: Condition(property_id=0, node_ids=[node_id])
+                    for i, node_id in enumerate(load_node_ids, 1)
+                }
+            },
+            sub_models=truss_submodels
+            | {
+                f"constraint_{i}": SubModel(nodes=[node_id])
+                for i, node_id in enumerate(self.constraint_node_ids.tolist(), 1)
+            }
+            | {
+                f"load_{i}": SubModel(nodes=[node_id], conditions=[i])
+                for i, node_id in enumerate(load_node_ids, 1)
+            },
+        )
+        return KratosSimulation(
+            model=model, materials=materials, parameters=self._kratos_parameters()
+        )
+
+    def to_nastran(self) -> NastranSimulation:
+        """Export this simulation to nastran, the same as TranslationLayer.to_nastran."""
+        element_ids = np.arange(1, len(self.connectivity) + 1, dtype=np.int64)
+        missing = np.full(len(self.node_ids), MISSING, np.int64)
+        crods = CrodTable(
+            eid=element_ids,
+            pid=element_ids,
+            g1=self.connectivity[:, 0],
+            g2=self.connectivity[:, 1],
+        ).to_crods()
+        grids = GridTable(
+            id=self.node_ids,
+            cp=missing,
+            x1=self.coordinates[:, 0],
+            x2=self.coordinates[:, 1],
+            x3=self.coordinates[:, 2],
+            cd=missing,
+            ps=missing,
+            seid=missing,
+        ).to_grids()
+        forces = [
+            Force(sid=i, g=node_id, cid=0, f=modulus, n1=n1, n2=n2, n3=n3)
+            for i, (node_id, modulus, (n1, n2, n3)) in enumerate(
+                zip(
+                    self.load_node_ids.tolist(),
+                    self.load_moduli.tolist(),
+                    self.load_directions.tolist(),
+                    strict=True,
+                ),
+                1,
+            )
+        ]
+        mat1s = [
+            Mat1(mid=i, e=young_modulus)
+            for i, young_modulus in enumerate(
+                _floats_or_none(self.young_moduli[self.property_indices]), 1
+            )
+        ]
+        prods = [
+            Prod(pid=i, mid=i, a=cross_section)
+            for i, cross_section in enumerate(self.cross_sections[self.property_indices].tolist(), 1)
+        ]
+        spcs = [
+            Spc(sid=2, g1=node_id, c1=components, d1=0.0)
+            for node_id, components in zip(
+                self.constraint_node_ids.tolist(),
+                _flags_to_components(self.constrained_components).tolist(),
+                strict=True,
+            )
+        ]
+
+        return NastranSimulation(
+            case_control=_to_nastran_case_control(len(self.load_node_ids)),
+            bulk_data=BulkDataSection(entries=[*crods, *forces, *grids, *mat1s, *prods, *spcs]),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two translation layers column by column."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            _columns_are_equal(getattr(self, column.name), getattr(other, column.name))
+            for column in fields(self)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _group_ids(self) -> npt.NDArray[np.int64]:
+        """Number the distinct cross sections and materials of the trusses from 1, in order."""
+        key_indices: dict[tuple[float, str, float | None], int] = {}
+        property_keys = np.fromiter(
+            (
+                key_indices.setdefault(key, len(key_indices))
+                for key in zip(
+                    self.cross_sections.tolist(),
+                    self.material_names,
+                    _floats_or_none(self.young_moduli),
+                    strict=True,
+                )
+            ),
+            np.int64,
+            len(self.material_names),
+        )
+        _, first_rows, truss_keys = np.unique(
+            property_keys[self.property_indices], return_index=True, return_inverse=True
+        )
+        group_ids = np.empty(len(first_rows), np.int64)
+        group_ids[np.argsort(first_rows)] = np.arange(1, len(first_rows) + 1)
+        return group_ids[truss_keys]
+
+    def _grouped_truss_submodels(self, property_ids: npt.NDArray[np.int64]) -> dict[str, SubModel]:
+        """Create one sub-model part per property with its trusses and their distinct nodes."""
+        if len(property_ids) == 0:
+            return {}
+
+        rows = np.argsort(property_ids, kind="stable")
+        starts = np.flatnonzero(np.diff(property_ids[rows])) + 1
+        submodels = {}
+        for group_rows in np.split(rows, starts):
+            property_id = int(property_ids[group_rows[0]])
+            nodes = self.connectivity[group_rows].ravel()
+            _, first_positions = np.unique(nodes, return_index=True)
+            submodels[f"trusses_{property_id}"] = SubModel(
+                properties=[property_id],
+                nodes=nodes[np.sort(first_positions)].tolist(),
+                elements=(group_rows + 1).tolist(),
+            )
+        return submodels
+
+    def _kratos_materials(
+        self, rows: npt.NDArray[np.intp], model_part_names: list[str], properties_ids: list[int]
+    ) -> list[KratosMaterial]:
+        """Create the material of the truss in each row."""
+        variables = [
+            {"CROSS_AREA": cross_section, "DENSITY": 0}
+            | ({} if young_modulus is None else {"YOUNG_MODULUS": young_modulus})
+            for cross_section, young_modulus in zip(
+                self.cross_sections.tolist(), _floats_or_none(self.young_moduli), strict=True
+            )
+        ]
+        return [
+            KratosMaterial(
+                model_part_name=model_part_name,
+                properties_id=properties_id,
+                material_name=self.material_names[property_index],
+                constitutive_law="TrussConstitutiveLaw",
+                variables=dict(variables[property_index]),
+            )
+            for model_part_name, properties_id, property_index in zip(
+                model_part_names,
+                properties_ids,
+                self.property_indices[rows].tolist(),
+                strict=True,
+            )
+        ]
+
+    def _kratos_parameters(self) -> SimulationParameters:
+        return SimulationParameters(
+            constraints=[
+                KratosConstraint(
+                    model_part_name=f"Structure.constraint_{i}",
+                    constrained_per_axis=tuple(translations),  # type: ignore[arg-type]
+                    value_per_axis=tuple(0.0 if fixed else None for fixed in translations),  # type: ignore[arg-type]
+                )
+                for i, translations in enumerate(self.constrained_components[:, :_AXES].tolist(), 1)
+            ],
+            loads=[
+                KratosLoad(
+                    model_part_name=f"Structure.load_{i}",
+                    modulus=modulus,
+                    direction=tuple(direction),  # type: ignore[arg-type]
+                )
+                for i, (modulus, direction) in enumerate(
+                    zip(self.load_moduli.tolist(), self.load_directions.tolist(), strict=True), 1
+                )
+            ],
+        )
+
+
+def _selected_sets(
+    nastran: NastranSimulation, subcase_id: int | None
+) -> tuple[list[Force], list[Spc]]:
+    """Return the forces and spcs translated for the subcase, see TranslationLayer.from_nastran."""
+    bulk_data = nastran.bulk_data
+    if subcase_id is None:
+        return bulk_data.forces, bulk_data.spcs
+
+    subcase = nastran.case_control.resolve_subcase(subcase_id)
+    forces = [] if subcase.load is None else bulk_data.forces_in_set(subcase.load)
+    spcs = [] if subcase.spc is None else bulk_data.spcs_in_set(subcase.spc)
+    return forces, spcs
+
+
+def _column(items: Sequence[object], name: str, dtype: type[np.generic]) -> np.ndarray:
+    """Gather an attribute of all items into an array."""
+    return np.fromiter(map(attrgetter(name), items), dtype, len(items))
+
+
+def _components_to_flags(components: npt.NDArray[np.int64]) -> npt.NDArray[np.bool_]:
+    """Decode nastran component numbers like 123 into one flag per component, shape (C, 6)."""
+    flags = np.zeros((len(components), len(_COMPONENTS)), np.bool_)
+    remaining = np.abs(components)
+    while remaining.any():
+        remaining, digits = np.divmod(remaining, 10)
+        flags |= digits[:, np.newaxis] == _COMPONENTS
+    return flags
+
+
+def _flags_to_components(flags: npt.NDArray[np.bool_]) -> npt.NDArray[np.int64]:
+    """Encode one flag per component into nastran component numbers like 123."""
+    components = np.zeros(len(flags), np.int64)
+    for i, component in enumerate(_COMPONENTS.tolist()):
+        components = np.where(flags[:, i], components * 10 + component, components)
+    return components
+
+
+def _floats_or_none(values: npt.NDArray[np.float64]) -> list[float | None]:
+    return [None if math.isnan(value) else value for value in values.tolist()]
+
+
+def _sub_model_nodes(
+    model: Model, parameters: Sequence[KratosConstraint] | Sequence[KratosLoad]
+) -> npt.NDArray[np.int64]:
+    """Return the first node of the sub-model part of each constraint or load."""
+    return np.fromiter(
+        (
+            model.sub_models[parameter.model_part_name.split(".")[-1]].nodes[0]
+            for parameter in parameters
+        ),
+        np.int64,
+        len(parameters),
+    )
+
+
+def _columns_are_equal(first: object, second: object) -> bool:
+    if isinstance(first, np.ndarray) and isinstance(second, np.ndarray):
+        return first.shape == second.shape and bool(
+            np.array_equal(first, second, equal_nan=first.dtype.kind == "f")
+        )
+    return first == second
+
+
+class UnsupportedConnectorError(TypeError):
+    """Raised when a connector can not be stored in the columns of a ColumnarTranslationLayer."""
+
+    def __init__(self, connector: Connector) -> None:
+        super().__init__(
+            f"{type(connector).__name__} connectors are not supported by the "
+            "ColumnarTranslationLayer, only trusses."
+        )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Iterator
 from dataclasses import dataclass
 
+import numpy as np
+
 from nastran_to_kratos.kratos import KratosSimulation
 from nastran_to_kratos.kratos.material import KratosMaterial
 from nastran_to_kratos.kratos.model import Element, SubModel
@@ -20,9 +23,11 @@ class Connector(ABC):
     second_point_index: int
     material: Material
 
-    def to_kratos_element(self) -> Element:
-        """Export this connector to a kratos element."""
-        return Element(property_id=0, node_ids=[self.first_point_index, self.second_point_index])
+    def to_kratos_element(self, property_id: int = 0) -> Element:
+        """Export this connector to a kratos element with the property of the id."""
+        return Element(
+            property_id=property_id, node_ids=[self.first_point_index, self.second_point_index]
+        )
 
 
 @dataclass
@@ -96,11 +101,7 @@ class RBE2Connector:
     @staticmethod
     def rbe2_connectors_from_nastran(bulk_data: BulkDataSection) -> list[RBE2Connector]:
         """Extracts all RBE2 entries from a BulkDataSection and converts them to RBE2Connector objects."""
-        return [
-            RBE2Connector.from_nastran(entry)
-            for entry in bulk_data.entries
-            if isinstance(entry, Rbe2)
-        ]
+        return [RBE2Connector.from_nastran(rbe2) for rbe2 in bulk_data.rbe2s]
 
 
 @dataclass
@@ -149,45 +150,122 @@ class Truss(Connector):
 
 def trusses_from_nastran(bulk_data: BulkDataSection) -> list[Connector]:
     """Construct all trusses from the nastran Crods."""
-    prods_by_pid = {prod.pid: prod for prod in bulk_data.prods}
-    mat1s_by_mid = {mat1.mid: mat1 for mat1 in bulk_data.mat1s}
+    crods = bulk_data.crod_table()
+    prods = bulk_data.prod_table()
+    mat1s = bulk_data.mat1_table()
+    prod_rows, mat1_rows = crods.property_rows(prods, mat1s)
+
+    used_mat1_rows = np.unique(mat1_rows)
+    materials_by_row = {
+        row: Material(name=f"MAT1_{mid}", young_modulus=None if np.isnan(e) else e)
+        for row, mid, e in zip(
+            used_mat1_rows.tolist(),
+            mat1s.mid[used_mat1_rows].tolist(),
+            mat1s.e[used_mat1_rows].tolist(),
+            strict=True,
+        )
+    }
+
     return [
-        Truss.from_nastran(crod, prods_by_pid[crod.pid], mat1s_by_mid[prods_by_pid[crod.pid].mid])
-        for crod in bulk_data.crods
+        Truss(
+            first_point_index=g1,
+            second_point_index=g2,
+            cross_section=a,
+            material=materials_by_row[mat1_row],
+        )
+        for g1, g2, a, mat1_row in zip(
+            crods.g1.tolist(),
+            crods.g2.tolist(),
+            prods.a[prod_rows].tolist(),
+            mat1_rows.tolist(),
+            strict=True,
+        )
     ]
 
 
 def connectors_from_nastran(bulk: BulkDataSection) -> list[RBE2Connector]:
     """Extracts all RBE2 connectors from the bulk data section."""
-    rbe2s = [entry for entry in bulk.entries if isinstance(entry, Rbe2)]
-    return [RBE2Connector.from_nastran(rbe2) for rbe2 in rbe2s]
+    return [RBE2Connector.from_nastran(rbe2) for rbe2 in bulk.rbe2s]
 
 
 def trusses_from_kratos(kratos: KratosSimulation) -> list[Connector]:
-    """Construct all trusses from a kratos simulation."""
+    """Construct all trusses from a kratos simulation.
+
+    The material of a truss is the only material with the properties id the element refers to. If
+    several materials share that properties id, it is the material of the sub-model part named after
+    the element, like truss_3 for the element 3. Both are looked up in dictionaries built once, so
+    the time needed grows linearly with the number of trusses and materials.
+
+    Raises:
+        KeyError: if no material is found for a truss.
+
+    """
     if kratos.model is None or kratos.materials is None:
         return []
     if "TrussLinearElement3D2N" not in kratos.model.elements:
         return []
 
+    converted_materials: dict[int, Material] = {}
     connectors: list[Connector] = []
-    for truss_id, truss in kratos.model.elements["TrussLinearElement3D2N"].items():
-        truss_material = None
-        for material in kratos.materials:
-            if int(material.model_part_name.split("_")[-1]) == truss_id:
-                truss_material = material
-                break
-
-        if truss_material is None:
-            raise KeyError
+    for truss, truss_material in resolve_truss_materials(
+        kratos.model.elements["TrussLinearElement3D2N"], kratos.materials
+    ):
+        material = converted_materials.get(id(truss_material))
+        if material is None:
+            material = converted_materials[id(truss_material)] = Material.from_kratos(truss_material)
 
         connectors.append(
             Truss(
                 first_point_index=truss.node_ids[0],
                 second_point_index=truss.node_ids[1],
                 cross_section=truss_material.variables["CROSS_AREA"],
-                material=Material.from_kratos(truss_material),
+                material=material,
             )
         )
 
     return connectors
+
+
+def resolve_truss_materials(
+    trusses: dict[int, Element], materials: list[KratosMaterial]
+) -> Iterator[tuple[Element, KratosMaterial]]:
+    """Yield every truss element together with its material, see trusses_from_kratos.
+
+    Raises:
+        KeyError: if no material is found for a truss.
+
+    """
+    materials_by_properties_id = _materials_by_properties_id(materials)
+    materials_by_truss_id = _materials_by_truss_id(materials)
+    for truss_id, truss in trusses.items():
+        truss_material = materials_by_properties_id.get(truss.property_id)
+        if truss_material is None:
+            truss_material = materials_by_truss_id[truss_id]
+        yield truss, truss_material
+
+
+def _materials_by_properties_id(materials: list[KratosMaterial]) -> dict[int, KratosMaterial]:
+    """Index the materials by their properties id, leaving out properties ids used repeatedly."""
+    materials_by_properties_id: dict[int, KratosMaterial] = {}
+    repeated_properties_ids = set()
+    for material in materials:
+        if material.properties_id in materials_by_properties_id:
+            repeated_properties_ids.add(material.properties_id)
+        materials_by_properties_id[material.properties_id] = material
+
+    for properties_id in repeated_properties_ids:
+        del materials_by_properties_id[properties_id]
+    return materials_by_properties_id
+
+
+def _materials_by_truss_id(materials: list[KratosMaterial]) -> dict[int, KratosMaterial]:
+    """Index the materials by the number their sub-model part name ends with, like 3 in truss_3.
+
+    Of several materials of the same sub-model part the first one is kept.
+    """
+    materials_by_truss_id: dict[int, KratosMaterial] = {}
+    for material in materials:
+        suffix = material.model_part_name.rsplit("_", 1)[-1]
+        if suffix.isdigit():
+            materials_by_truss_id.setdefault(int(suffix), material)
+    return materials_by_truss_id
@@ -51,9 +51,10 @@ class Constraint:
         )
 
 
-def constraints_from_nastran(bulk_data: BulkDataSection) -> list[Constraint]:
-    """Construct all constraints from nastran."""
-    return [Constraint.from_nastran(spc) for spc in bulk_data.spcs]
+def constraints_from_nastran(bulk_data: BulkDataSection, sid: int | None = None) -> list[Constraint]:
+    """Construct all constraints from nastran or only the constraints of one constraint set."""
+    spcs = bulk_data.spcs if sid is None else bulk_data.spcs_in_set(sid)
+    return [Constraint.from_nastran(spc) for spc in spcs]
 
 
 def constraints_from_kratos(kratos: KratosSimulation) -> list[Constraint]:
@@ -43,9 +43,10 @@ class Load:
         )
 
 
-def loads_from_nastran(bulk_data: BulkDataSection) -> list[Load]:
-    """Construct all loads from nastran."""
-    return [Load.from_nastran(force) for force in bulk_data.forces]
+def loads_from_nastran(bulk_data: BulkDataSection, sid: int | None = None) -> list[Load]:
+    """Construct all loads from nastran or only the loads of one load set."""
+    forces = bulk_data.forces if sid is None else bulk_data.forces_in_set(sid)
+    return [Load.from_nastran(force) for force in forces]
 
 
 def loads_from_kratos(kratos: KratosSimulation) -> list[Load]:
@@ -6,6 +6,7 @@ from nastran_to_kratos.kratos import KratosSimulation
 from nastran_to_kratos.kratos.model import Node
 from nastran_to_kratos.nastran.bulk_data import BulkDataSection
 from nastran_to_kratos.nastran.bulk_data.entries import Grid
+from nastran_to_kratos.nastran.bulk_data.tables import GridTable
 
 
 @dataclass
@@ -55,8 +56,27 @@ class Point:
 
 
 def nodes_from_nastran(bulk_data: BulkDataSection) -> list[Point]:
-    """Construct all nodes from the nastran grid."""
-    return [Point.from_nastran(grid) for grid in _sort_by_grid_id(bulk_data.grids)]
+    """Construct all nodes sorted by their id from the grid table of the bulk data section.
+
+    When the section was read from a file, the table contains the columns decoded from the GRID
+    cards, so no Grid objects are read, see BulkDataSection.grid_table.
+    """
+    return nodes_from_grid_table(bulk_data.grid_table())
+
+
+def nodes_from_grid_table(grids: GridTable) -> list[Point]:
+    """Construct all nodes sorted by their id from a column-oriented table of nastran grids."""
+    sorted_grids = grids.sorted_by_id()
+    return [
+        Point(id=id_, x=x, y=y, z=z)
+        for id_, x, y, z in zip(
+            sorted_grids.id.tolist(),
+            sorted_grids.x1.tolist(),
+            sorted_grids.x2.tolist(),
+            sorted_grids.x3.tolist(),
+            strict=True,
+        )
+    ]
 
 
 def nodes_from_kratos(kratos: KratosSimulation) -> list[Point]:
@@ -64,7 +84,3 @@ def nodes_from_kratos(kratos: KratosSimulation) -> list[Point]:
     if kratos.model is None:
         return []
     return [Point.from_kratos(id_, node) for id_, node in kratos.model.nodes.items()]
-
-
-def _sort_by_grid_id(grids: list[Grid]) -> list[Grid]:
-    return sorted(grids, key=lambda grid: grid.id)
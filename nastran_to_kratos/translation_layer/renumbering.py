@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass
+class NodeRenumbering:
+    """A map from the original ids of the nodes to dense new ids from 1 to the number of nodes."""
+
+    original_ids: list[int]
+    "Original id of every node, in the order of the new ids (the node with the new id 1 first)."
+
+    @classmethod
+    def reverse_cuthill_mckee(
+        cls, node_ids: Iterable[int], edges: Iterable[tuple[int, int]]
+    ) -> NodeRenumbering:
+        """Number the nodes of a graph such that connected nodes get close ids.
+
+        The order is the Reverse Cuthill-McKee order, which keeps the bandwidth of the stiffness
+        matrix (the largest difference between the ids of two connected nodes) small. Each
+        connected part of the graph is numbered by a breadth-first search starting at a node far
+        away from the rest of the part, visiting the neighbours of every node by increasing number
+        of connections. The resulting order is reversed.
+
+        Args:
+            node_ids: the ids of all nodes. Nodes without edges are numbered as well.
+            edges: the ids of the two nodes connected by each edge, for example by a truss.
+
+        Raises:
+            KeyError: if an edge connects a node that is not in node_ids.
+
+        """
+        original_ids = list(dict.fromkeys(node_ids))
+        indices = {node_id: i for i, node_id in enumerate(original_ids)}
+        pairs = np.array(
+            [(indices[first], indices[second]) for first, second in edges], dtype=np.int64
+        ).reshape(-1, 2)
+        order = _cuthill_mckee_order(len(original_ids), pairs)
+        return cls([original_ids[i] for i in reversed(order)])
+
+    @classmethod
+    def from_json(cls, json_: dict) -> NodeRenumbering:
+        """Construct this class from json."""
+        return cls(json_["original_node_ids"])
+
+    def to_json(self) -> dict:
+        """Export this renumbering to json."""
+        return {"original_node_ids": self.original_ids}
+
+    @cached_property
+    def new_ids(self) -> dict[int, int]:
+        """The new id of every node by its original id."""
+        return {original_id: i + 1 for i, original_id in enumerate(self.original_ids)}
+
+    def original_id(self, new_id: int) -> int:
+        """Return the original id of a node by its new id."""
+        if not 1 <= new_id <= len(self.original_ids):
+            raise KeyError(new_id)
+        return self.original_ids[new_id - 1]
+
+
+def _cuthill_mckee_order(node_count: int, pairs: npt.NDArray[np.int64]) -> list[int]:
+    """Return the node indices in Cuthill-McKee order, one connected part after another."""
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    directed = np.unique(np.concatenate([pairs, pairs[:, ::-1]]), axis=0)
+    degrees = np.bincount(directed[:, 0], minlength=node_count)
+
+    # The neighbours of every node, sorted by their number of connections.
+    directed = directed[np.lexsort((directed[:, 1], degrees[directed[:, 1]], directed[:, 0]))]
+    offsets = np.concatenate([[0], np.cumsum(degrees)]).tolist()
+    neighbours = directed[:, 1].tolist()
+    adjacency = [neighbours[offsets[i] : offsets[i + 1]] for i in range(node_count)]
+    degree_list = degrees.tolist()
+
+    is_visited = [False] * node_count
+    order: list[int] = []
+    for start in np.argsort(degrees, kind="stable").tolist():
+        if is_visited[start]:
+            continue
+        # Breadth-first search, the nodes appended to order are the queue.
+        head = len(order)
+        peripheral = _peripheral_node(start, adjacency, degree_list)
+        is_visited[peripheral] = True
+        order.append(peripheral)
+        while head < len(order):
+            for neighbour in adjacency[order[head]]:
+                if not is_visited[neighbour]:
+                    is_visited[neighbour] = True
+                    order.append(neighbour)
+            head += 1
+    return order
+
+
+def _peripheral_node(start: int, adjacency: list[list[int]], degrees: list[int]) -> int:
+    """Find a node of the connected part of start, which is as far away from the others as possible.
+
+    This is the heuristic of George and Liu: starting from a node with few connections, the node
+    with the fewest connections among the farthest nodes is taken as long as it is farther away
+    from the rest of the part than the previous one.
+    """
+    levels = _levels(start, adjacency)
+    while True:
+        candidate = min(levels[-1], key=degrees.__getitem__)
+        candidate_levels = _levels(candidate, adjacency)
+        if len(candidate_levels) <= len(levels):
+            return start
+        start, levels = candidate, candidate_levels
+
+
+def _levels(start: int, adjacency: list[list[int]]) -> list[list[int]]:
+    """Group the nodes of the connected part of start by their distance to start."""
+    reached = {start}
+    levels = [[start]]
+    while True:
+        level = []
+        for node in levels[-1]:
+            for neighbour in adjacency[node]:
+                if neighbour not in reached:
+                    reached.add(neighbour)
+                    level.append(neighbour)
+        if not level:
+            return levels
+        levels.append(level)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class StageTimings:
+    """The wall time of each stage of a translation and of all stages together, in seconds."""
+
+    stages: dict[str, float] = field(default_factory=dict)
+    "Wall time of each stage by its name, in the order the stages were started."
+
+    total: float = 0.0
+    "Wall time from starting the first stage until the last stage finished."
+
+    def summary(self) -> str:
+        """Return a single line listing the time of every stage and the total time."""
+        stages = ", ".join(f"{name} {seconds:.3f} s" for name, seconds in self.stages.items())
+        return f"{stages} (total {self.total:.3f} s)"
+
+
+def run_stages(
+    stages: Mapping[str, Callable[[], Any]],
+    timings: StageTimings | None = None,
+) -> dict[str, Any]:
+    """Run stages one after another in the calling process and measure the wall time of each.
+
+    The stages are not run concurrently: they are pure Python and hold the GIL, so threads do not
+    shorten the total time, and processes would have to copy the bulk data and the results.
+
+    Args:
+        stages: the function of each stage by its name.
+        timings: if given, the wall time of every stage and of all stages is recorded in it.
+
+    Returns:
+        the result of each stage by its name.
+
+    """
+    start = time.perf_counter()
+    timed_results = {name: _timed(stage) for name, stage in stages.items()}
+
+    if timings is not None:
+        timings.stages.update({name: seconds for name, (_, seconds) in timed_results.items()})
+        timings.total += time.perf_counter() - start
+    return {name: result for name, (result, _) in timed_results.items()}
+
+
+def _timed(stage: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = stage()
+    return result, time.perf_counter() - start
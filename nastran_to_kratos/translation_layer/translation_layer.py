@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from functools import partial
 
 from nastran_to_kratos.kratos.kratos_simulation import KratosSimulation, SimulationParameters
 from nastran_to_kratos.kratos.material import KratosMaterial
@@ -28,6 +30,8 @@ from .connector import Connector, Truss, trusses_from_kratos, trusses_from_nastr
 from .constraint import Constraint, constraints_from_kratos, constraints_from_nastran
 from .load import Load, loads_from_kratos, loads_from_nastran
 from .point import Point, nodes_from_kratos, nodes_from_nastran
+from .renumbering import NodeRenumbering
+from .stages import StageTimings, run_stages
 
 
 @dataclass
@@ -40,13 +44,56 @@ class TranslationLayer:
     loads: list[Load] = field(default_factory=list)
 
     @classmethod
-    def from_nastran(cls, nastran: NastranSimulation) -> TranslationLayer:
-        """Construct this class from nastran."""
+    def from_nastran(
+        cls,
+        nastran: NastranSimulation,
+        subcase_id: int | None = None,
+        *,
+        timings: StageTimings | None = None,
+    ) -> TranslationLayer:
+        """Construct this class from nastran.
+
+        The nodes, trusses, constraints and loads are translated in stages one after another, whose
+        wall time can be measured, see run_stages.
+
+        Args:
+            nastran: the simulation to translate.
+            subcase_id: the subcase whose load set and constraint set are translated. If it is
+                None, all loads and constraints are translated. A subcase selecting no set (not
+                even in the general section of the case control) has no loads or constraints.
+            timings: if given, the wall time of the stages nodes, trusses, constraints and loads is
+                recorded in it.
+
+        Raises:
+            KeyError: if there is no subcase with the id.
+
+        """
+        bulk_data = nastran.bulk_data
+        stages: dict[str, Callable[[], list]] = {
+            "nodes": partial(nodes_from_nastran, bulk_data),
+            "trusses": partial(trusses_from_nastran, bulk_data),
+            "constraints": partial(constraints_from_nastran, bulk_data),
+            "loads": partial(loads_from_nastran, bulk_data),
+        }
+        if subcase_id is not None:
+            subcase = nastran.case_control.resolve_subcase(subcase_id)
+            stages["constraints"] = (
+                list
+                if subcase.spc is None
+                else partial(constraints_from_nastran, bulk_data, subcase.spc)
+            )
+            stages["loads"] = (
+                list
+                if subcase.load is None
+                else partial(loads_from_nastran, bulk_data, subcase.load)
+            )
+
+        results = run_stages(stages, timings)
         return TranslationLayer(
-            nodes=nodes_from_nastran(nastran.bulk_data),
-            connectors=trusses_from_nastran(nastran.bulk_data),
-            constraints=constraints_from_nastran(nastran.bulk_data),
-            loads=loads_from_nastran(nastran.bulk_data),
+            nodes=results["nodes"],
+            connectors=results["trusses"],
+            constraints=results["constraints"],
+            loads=results["loads"],
         )
 
     @classmethod
@@ -59,18 +106,99 @@ class TranslationLayer:
             loads=loads_from_kratos(kratos),
         )
 
-    def to_kratos(self) -> KratosSimulation:
-        """Export this simulation to kratos."""
+    def renumber_nodes(self) -> tuple[TranslationLayer, NodeRenumbering]:
+        """Return a copy of this simulation with the nodes numbered for a small matrix bandwidth.
+
+        The nodes get the ids from 1 to the number of nodes in the Reverse Cuthill-McKee order of
+        the graph of the connectors, see NodeRenumbering.reverse_cuthill_mckee, so that connected
+        nodes get close ids. The nodes and the connectors are sorted by their (lowest) new node id,
+        which keeps the nodes and elements of the kratos model in the same order.
+
+        Returns:
+            the renumbered simulation and the renumbering, which translates the new node ids (for
+            example of kratos results) back to the ids of this simulation.
+
+        Raises:
+            KeyError: if a connector, constraint or load references a node that does not exist.
+
+        """
+        renumbering = NodeRenumbering.reverse_cuthill_mckee(
+            (node.id for node in self.nodes),
+            (
+                (connector.first_point_index, connector.second_point_index)
+                for connector in self.connectors
+            ),
+        )
+        new_ids = renumbering.new_ids
+
+        nodes = [replace(node, id=new_ids[node.id]) for node in self.nodes]
+        connectors = [
+            replace(
+                connector,
+                first_point_index=new_ids[connector.first_point_index],
+                second_point_index=new_ids[connector.second_point_index],
+            )
+            for connector in self.connectors
+        ]
+        renumbered = TranslationLayer(
+            nodes=sorted(nodes, key=lambda node: node.id),
+            connectors=sorted(
+                connectors,
+                key=lambda connector: min(connector.first_point_index, connector.second_point_index),
+            ),
+            constraints=[
+                replace(constraint, node_id=new_ids[constraint.node_id])
+                for constraint in self.constraints
+            ],
+            loads=[replace(load, node_id=new_ids[load.node_id]) for load in self.loads],
+        )
+        return renumbered, renumbering
+
+    def to_kratos(
+        self,
+        *,
+        group_properties: bool = False,
+        timings: StageTimings | None = None,
+    ) -> KratosSimulation:
+        """Export this simulation to kratos.
+
+        The model, materials and parameters are exported in stages one after another, whose wall
+        time can be measured, see run_stages.
+
+        Args:
+            group_properties: if set, all trusses with the same cross section and material share
+                one property, sub-model part (named trusses_1, trusses_2, ...) and material, which
+                keeps large models small. By default, every truss gets its own sub-model part
+                (truss_1, truss_2, ...) and material, all with the property 0.
+            timings: if given, the wall time of the stages model, materials and parameters is
+                recorded in it.
+
+        """
+        if group_properties:
+            property_ids = _property_ids(self.connectors)
+            materials = partial(_to_kratos_grouped_materials, self.connectors, property_ids)
+        else:
+            property_ids = None
+            materials = partial(_to_kratos_materials, self.connectors)
+
+        results = run_stages(
+            {
+                "model": partial(_to_kratos_model, self, property_ids),
+                "materials": materials,
+                "parameters": partial(_to_kratos_parameters, self),
+            },
+            timings,
+        )
         return KratosSimulation(
-            model=_to_kratos_model(self),
-            materials=_to_kratos_materials(self.connectors),
-            parameters=_to_kratos_parameters(self),
+            model=results["model"],
+            materials=results["materials"],
+            parameters=results["parameters"],
         )
 
     def to_nastran(self) -> NastranSimulation:
         """Export this simulation to nastran."""
         return NastranSimulation(
-            case_control=_to_nastran_case_control(self.loads),
+            case_control=_to_nastran_case_control(len(self.loads)),
             bulk_data=BulkDataSection(
                 entries=_to_nastran_crods(self.connectors)
                 + _to_nastran_forces(self.loads)
@@ -82,15 +210,22 @@ class TranslationLayer:
         )
 
 
-def _to_kratos_model(simulation: TranslationLayer) -> Model:
+def _to_kratos_model(simulation: TranslationLayer, property_ids: list[int] | None = None) -> Model:
+    if property_ids is None:
+        properties: dict[int, dict[str, float]] = {0: {}}
+        truss_submodels = _to_kratos_submodels_trusses(simulation.connectors)
+    else:
+        properties = {property_id: {} for property_id in sorted({0, *property_ids})}
+        truss_submodels = _to_kratos_grouped_submodels_trusses(simulation.connectors, property_ids)
+
     return Model(
-        properties={0: {}},
+        properties=properties,
         nodes={point.id: point.to_kratos() for point in simulation.nodes},
-        elements=_to_kratos_elements(simulation.connectors),
+        elements=_to_kratos_elements(simulation.connectors, property_ids),
         conditions=_to_kratos_conditions(simulation.loads),
         sub_models=_merge_dicts(
             [
-                _to_kratos_submodels_trusses(simulation.connectors),
+                truss_submodels,
                 _to_kratos_submodels_constraints(simulation.constraints),
                 _to_kratos_submodels_loads(simulation.loads),
             ]
@@ -106,6 +241,37 @@ def _to_kratos_materials(connectors: list[Connector]) -> list[KratosMaterial]:
     ]
 
 
+def _property_ids(connectors: list[Connector]) -> list[int]:
+    """Number the distinct cross sections and materials of the trusses from 1, in order.
+
+    Connectors other than trusses keep the property 0.
+    """
+    property_ids: dict[tuple[float, str, float | None], int] = {}
+    return [
+        property_ids.setdefault(
+            (connector.cross_section, connector.material.name, connector.material.young_modulus),
+            len(property_ids) + 1,
+        )
+        if isinstance(connector, Truss)
+        else 0
+        for connector in connectors
+    ]
+
+
+def _to_kratos_grouped_materials(
+    connectors: list[Connector], property_ids: list[int]
+) -> list[KratosMaterial]:
+    materials: dict[int, KratosMaterial] = {}
+    for connector, property_id in zip(connectors, property_ids, strict=True):
+        if isinstance(connector, Truss) and property_id not in materials:
+            materials[property_id] = replace(
+                connector.to_kratos_material(property_id),
+                model_part_name=f"Structure.trusses_{property_id}",
+                properties_id=property_id,
+            )
+    return list(materials.values())
+
+
 def _to_kratos_parameters(simulation: TranslationLayer) -> SimulationParameters:
     return SimulationParameters(
         constraints=[
@@ -123,10 +289,17 @@ def _merge_dicts(dicts: list[dict]) -> dict:
     return merged_dict
 
 
-def _to_kratos_elements(connectors: list[Connector]) -> dict[str, dict[int, Element]]:
+def _to_kratos_elements(
+    connectors: list[Connector], property_ids: list[int] | None = None
+) -> dict[str, dict[int, Element]]:
+    if property_ids is None:
+        property_ids = [0] * len(connectors)
     return {
         "TrussLinearElement3D2N": {
-            i + 1: connector.to_kratos_element() for i, connector in enumerate(connectors)
+            i + 1: connector.to_kratos_element(property_id)
+            for i, (connector, property_id) in enumerate(
+                zip(connectors, property_ids, strict=True)
+            )
         }
     }
 
@@ -145,6 +318,24 @@ def _to_kratos_submodels_trusses(connectors: list[Connector]) -> dict[str, SubMo
     }
 
 
+def _to_kratos_grouped_submodels_trusses(
+    connectors: list[Connector], property_ids: list[int]
+) -> dict[str, SubModel]:
+    submodels: dict[str, SubModel] = {}
+    for i, (connector, property_id) in enumerate(zip(connectors, property_ids, strict=True)):
+        if not isinstance(connector, Truss):
+            continue
+        submodel = submodels.get(f"trusses_{property_id}")
+        if submodel is None:
+            submodel = submodels[f"trusses_{property_id}"] = SubModel(properties=[property_id])
+        submodel.nodes.extend((connector.first_point_index, connector.second_point_index))
+        submodel.elements.append(i + 1)
+
+    for submodel in submodels.values():
+        submodel.nodes = list(dict.fromkeys(submodel.nodes))
+    return submodels
+
+
 def _to_kratos_submodels_constraints(constraints: list[Constraint]) -> dict[str, SubModel]:
     return {
         f"constraint_{i+1}": constraint.to_kratos_submodel()
@@ -247,9 +438,9 @@ def _to_nastran_spcs(constraints: list[Constraint]) -> list[_BulkDataEntry]:
     return spcs
 
 
-def _to_nastran_case_control(loads: list[Load]) -> CaseControlSection:
+def _to_nastran_case_control(load_count: int) -> CaseControlSection:
     subcases = {}
-    for i, _ in enumerate(loads):
+    for i in range(load_count):
         subcases[i + 1] = Subcase(
             analysis=Analysis.STATICS,
             label=f"case_{i+1}",
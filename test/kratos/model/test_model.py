@@ -190,5 +190,18 @@ def test_to_mdpa__submodel_empty():
     ]
 
 
+def test_from_mdpa__two_properties():
+    actual = Model.from_mdpa(
+        [
+            "Begin Properties 0\n",
+            "End Properties\n",
+            "\n",
+            "Begin Properties 1\n",
+            "End Properties\n",
+        ]
+    )
+    assert actual.properties == {0: {}, 1: {}}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
@@ -1,3 +1,4 @@
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
 from nastran_to_kratos.nastran.bulk_data.entries import Conrod
 import pytest
 
@@ -11,7 +12,7 @@ def test_read__all_fields_have_values():
 def test_to_file_content():
     conrod = Conrod(eid=2, g1=16, g2=17, mid=4, a=2.69)
     actual = conrod.to_file_content()
-    expected = "CONROD           2      16      17       4    2.69"
+    expected = "CONROD         2      16      17       4    2.69"
 
     print(f"\nExpected: {repr(expected)}")
     print(f"Actual:   {repr(actual)}")
@@ -19,5 +20,11 @@ def test_to_file_content():
     assert actual == expected
 
 
+def test_to_file_content__round_trip():
+    conrod = Conrod(eid=2, g1=16, g2=17, mid=4, a=2.69, j=1.5, c=0.5, nsm=0.25)
+    actual = BulkDataSection.from_file_content([conrod.to_file_content()])
+    assert actual.entries == [conrod]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
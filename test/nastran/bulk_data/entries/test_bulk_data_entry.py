@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import pickle
+from dataclasses import FrozenInstanceError, dataclass, field, replace
+from typing import ClassVar
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
+from nastran_to_kratos.nastran.bulk_data.entries import (
+    FieldTooLongError,
+    Grid,
+    MissingRequiredFieldError,
+    Rbe2,
+    entry_class_for,
+)
+from nastran_to_kratos.nastran.bulk_data.entries._bulk_data_entry import (
+    _ENTRY_CLASS_MAPPING,
+    _BulkDataEntry,
+    _entry_dataclass,
+    _Field,
+    _FieldSchema,
+)
+
+import pytest
+
+
+def unregister(entry_class: type[_BulkDataEntry]) -> None:
+    """Remove a test entry from the registry, so that it does not leak into other tests."""
+    del _ENTRY_CLASS_MAPPING[entry_class.identifyer]
+    del _ENTRY_CLASS_MAPPING[entry_class.identifyer.ljust(8)]
+
+
+@dataclass
+class Pmass(_BulkDataEntry):
+    identifyer: ClassVar[str] = "PMASS"
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(_Field(1, int), _Field(2, float, 0.0))
+
+    pid: int
+    m: float
+
+    def to_file_content(self) -> str:
+        return self._fields_to_line(["PMASS", str(self.pid), str(self.m)])
+
+    def __hash__(self) -> int:
+        return hash(self.pid)
+
+
+unregister(Pmass)
+
+
+@pytest.fixture
+def registered_pmass(monkeypatch):
+    monkeypatch.setitem(_ENTRY_CLASS_MAPPING, "PMASS", Pmass)
+    monkeypatch.setitem(_ENTRY_CLASS_MAPPING, "PMASS   ", Pmass)
+
+
+def test_entry_class_for__builtin():
+    assert entry_class_for("GRID") is Grid
+    assert entry_class_for("GRID    ") is Grid
+
+
+def test_entry_class_for__unknown():
+    assert entry_class_for("UNKNOWN") is None
+
+
+def test_entry_class_for__test_entries_are_not_registered():
+    assert entry_class_for("PMASS") is None
+    assert entry_class_for("PELAS") is None
+
+
+def test_registry__subclass_is_read_by_bulk_data_section(registered_pmass):
+    actual = BulkDataSection.from_file_content(["PMASS          7     2.5"])
+    assert actual.entries == [Pmass(pid=7, m=2.5)]
+
+
+def test_schema__default_for_missing_field():
+    assert Pmass.from_file_content(["PMASS   ", "       7"]) == Pmass(pid=7, m=0.0)
+
+
+def test_schema__required_field_blank():
+    with pytest.raises(MissingRequiredFieldError):
+        Grid.from_file_content(
+            ["GRID    ", "        ", "        ", "     1.0", "     0.0", "     0.0"]
+        )
+
+
+@_entry_dataclass(frozen=True)
+class Pelas(_BulkDataEntry):
+    identifyer: ClassVar[str] = "PELAS"
+    _schema: ClassVar[_FieldSchema] = _FieldSchema(_Field(1, int), _Field(2, float, 0.0))
+
+    pid: int
+    k: float = 0.0
+
+    def to_file_content(self) -> str:
+        return self._fields_to_line(["PELAS", str(self.pid), str(self.k)])
+
+
+unregister(Pelas)
+
+
+def test_fields_to_line__long_real_is_rounded():
+    grid = Grid(id=1, x1=1.0 / 3.0, x2=-123456789.0, x3=1.5e-12)
+    assert grid.to_file_content() == "GRID           1        0.333333-1.235+8 1.5e-12"
+
+
+def test_fields_to_line__integer_too_long():
+    with pytest.raises(FieldTooLongError, match="Field 1 of GRID does not fit into 8 characters"):
+        Grid(id=123456789).to_file_content()
+
+
+def test_entry_dataclass__slots():
+    grid = Grid(id=1, x1=1.0)
+
+    assert not hasattr(grid, "__dict__")
+    assert entry_class_for("GRID") is Grid
+
+
+def test_entry_dataclass__hash():
+    assert hash(Grid(id=1, x1=1.0)) == hash(Grid(id=1, x1=1.0))
+    assert len({Grid(id=1, x1=1.0), Grid(id=1, x1=1.0), Grid(id=2, x1=1.0)}) == 2
+
+
+def test_entry_dataclass__hash_of_list_field():
+    rbe2s = {Rbe2(eid=1, gn=1, cm=123456, gmi=[2, 3]), Rbe2(eid=1, gn=1, cm=123456, gmi=[2, 3])}
+    assert rbe2s == {Rbe2(eid=1, gn=1, cm=123456, gmi=[2, 3])}
+
+
+def test_entry_dataclass__replace():
+    grid = Grid(id=1, x1=1.0)
+    hash(grid)
+
+    moved = replace(grid, x1=2.0)
+    assert moved == Grid(id=1, x1=2.0)
+    assert hash(moved) == hash(Grid(id=1, x1=2.0))
+
+
+def test_entry_dataclass__pickle():
+    grid = Grid(id=1, cp=2, x1=1.0, ps="123")
+    hash(grid)
+
+    unpickled = pickle.loads(pickle.dumps(grid))
+    assert unpickled == grid
+    assert unpickled._cached_hash is None
+    assert hash(unpickled) == hash(grid)
+
+
+def test_entry_dataclass__frozen():
+    pelas = Pelas(pid=3)
+
+    assert pelas == Pelas(3, 0.0)
+    assert hash(pelas) == hash(Pelas(3, 0.0))
+    with pytest.raises(FrozenInstanceError):
+        pelas.k = 1.0
+
+
+def test_entry_dataclass__frozen_pickle():
+    pelas = Pelas(pid=3, k=1.5)
+    assert pickle.loads(pickle.dumps(pelas)) == pelas
+
+
+def test_entry_dataclass__frozen_read():
+    assert Pelas.from_file_content(["PELAS", "3", "1.5"]) == Pelas(pid=3, k=1.5)
+
+
+def test_entry_dataclass__default_factory():
+    with pytest.raises(TypeError, match="default factory"):
+
+        @_entry_dataclass
+        class Pdamp(_BulkDataEntry):
+            pid: int
+            b: list[float] = field(default_factory=list)
+
+            def to_file_content(self) -> str:
+                return "PDAMP"
@@ -57,6 +57,13 @@ def test_read__optional_fields():
     )
 
 
+def test_read__implicit_exponents():
+    raw_entry = ["MAT1", "17", "2.1+5", "", "0.3", "7.85-9", "1.2D-5"]
+
+    actual = Mat1.from_file_content(raw_entry)
+    assert actual == Mat1(mid=17, e=2.1e5, nu=0.3, rho=7.85e-9, a=1.2e-5)
+
+
 def test_to_file_content__all_fields_have_values():
     mat1 = Mat1(
         mid=17,
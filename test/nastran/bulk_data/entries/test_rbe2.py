@@ -76,6 +76,13 @@ def test_read__all_fields_have_values():
     assert actual == expected
 
 
+def test_read__alpha_and_tref_with_implicit_exponents():
+    raw = ["RBE2           5       8     123      30      31  1.5-5   2.+1"]
+    actual = Rbe2.from_file_content(raw)
+    expected = Rbe2(eid=5, gn=8, cm=123, gmi=[30, 31], alpha=1.5e-5, tref=20.0)
+    assert actual == expected
+
+
 def test_round_trip():
     original = Rbe2(eid=7, gn=4, cm=6, gmi=[1, 2, 3, 4], alpha=0.0, tref=100.0)
     text = original.to_file_content()
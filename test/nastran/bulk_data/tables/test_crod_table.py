@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
+from nastran_to_kratos.nastran.bulk_data.entries import Crod, Mat1, Prod
+from nastran_to_kratos.nastran.bulk_data.tables import CrodTable, Mat1Table, ProdTable
+
+
+@pytest.fixture
+def crods() -> list[Crod]:
+    return [
+        Crod(eid=1, pid=20, g1=1, g2=2),
+        Crod(eid=2, pid=10, g1=2, g2=3),
+        Crod(eid=3, pid=20, g1=3, g2=4),
+    ]
+
+
+@pytest.fixture
+def prods() -> list[Prod]:
+    return [Prod(pid=20, mid=7, a=400.0), Prod(pid=10, mid=3, a=350.0, j=1.5, c=0.5, nsm=2.0)]
+
+
+@pytest.fixture
+def mat1s() -> list[Mat1]:
+    return [Mat1(mid=3, e=70_000.0, nu=0.33), Mat1(mid=7, e=210_000.0, mcsid=2)]
+
+
+def test_to_crods__round_trip(crods):
+    assert CrodTable.from_crods(crods).to_crods() == crods
+
+
+def test_to_prods__round_trip(prods):
+    assert ProdTable.from_prods(prods).to_prods() == prods
+
+
+def test_to_mat1s__round_trip(mat1s):
+    assert Mat1Table.from_mat1s(mat1s).to_mat1s() == mat1s
+
+
+def test_optional_reals_are_nan(prods):
+    actual = ProdTable.from_prods(prods)
+    assert np.isnan(actual.j[0])
+    assert actual.j[1] == 1.5
+
+
+def test_connectivity(crods):
+    actual = CrodTable.from_crods(crods).connectivity
+    assert actual.tolist() == [[1, 2], [2, 3], [3, 4]]
+
+
+def test_property_rows(crods, prods, mat1s):
+    prod_rows, mat1_rows = CrodTable.from_crods(crods).property_rows(
+        ProdTable.from_prods(prods), Mat1Table.from_mat1s(mat1s)
+    )
+
+    assert prod_rows.tolist() == [0, 1, 0]
+    assert mat1_rows.tolist() == [1, 0, 1]
+
+
+def test_property_rows__missing_prod(crods, prods, mat1s):
+    with pytest.raises(KeyError):
+        CrodTable.from_crods(crods).property_rows(
+            ProdTable.from_prods(prods[:1]), Mat1Table.from_mat1s(mat1s)
+        )
+
+
+def test_property_rows__missing_mat1(crods, prods, mat1s):
+    with pytest.raises(KeyError):
+        CrodTable.from_crods(crods).property_rows(
+            ProdTable.from_prods(prods), Mat1Table.from_mat1s(mat1s[1:])
+        )
+
+
+def test_tables_from_bulk_data_section(crods, prods, mat1s):
+    bulk_data = BulkDataSection(entries=[*mat1s, *crods, *prods])
+
+    assert bulk_data.crod_table() == CrodTable.from_crods(crods)
+    assert bulk_data.prod_table() == ProdTable.from_prods(prods)
+    assert bulk_data.mat1_table() == Mat1Table.from_mat1s(mat1s)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
+
+
+def test_from_file_content(crods, prods, mat1s):
+    assert CrodTable.from_file_content([crod.to_file_content() for crod in crods]) == (
+        CrodTable.from_crods(crods)
+    )
+    assert ProdTable.from_file_content([prod.to_file_content() for prod in prods]) == (
+        ProdTable.from_prods(prods)
+    )
+    assert Mat1Table.from_file_content([mat1.to_file_content() for mat1 in mat1s]) == (
+        Mat1Table.from_mat1s(mat1s)
+    )
+
+
+def test_to_file_content__same_as_entries(crods, prods, mat1s):
+    assert CrodTable.from_crods(crods).to_file_content() == [
+        crod.to_file_content() for crod in crods
+    ]
+    assert ProdTable.from_prods(prods).to_file_content() == [
+        prod.to_file_content() for prod in prods
+    ]
+    assert Mat1Table.from_mat1s(mat1s).to_file_content() == [
+        mat1.to_file_content() for mat1 in mat1s
+    ]
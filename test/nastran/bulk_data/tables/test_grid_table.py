@@ -0,0 +1,180 @@
+import numpy as np
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
+from nastran_to_kratos.nastran.bulk_data.entries import (
+    Crod,
+    FieldTooLongError,
+    Grid,
+    MissingRequiredFieldError,
+)
+from nastran_to_kratos.nastran.bulk_data.tables import MISSING, GridTable
+
+
+@pytest.fixture
+def grids() -> list[Grid]:
+    return [
+        Grid(id=7, x1=1.0, x2=2.0, x3=3.0),
+        Grid(id=2, cp=5, x1=1000.0, x2=0.0, x3=2.0, cd=3, ps="123", seid=7),
+        Grid(id=4),
+    ]
+
+
+def test_from_grids(grids):
+    actual = GridTable.from_grids(grids)
+
+    assert actual.id.dtype == np.int64
+    assert actual.x1.dtype == np.float64
+    assert actual.id.tolist() == [7, 2, 4]
+    assert actual.cp.tolist() == [MISSING, 5, MISSING]
+    assert actual.ps.tolist() == [MISSING, 123, MISSING]
+    assert actual.coordinates.tolist() == [[1.0, 2.0, 3.0], [1000.0, 0.0, 2.0], [0.0, 0.0, 0.0]]
+
+
+def test_to_grids__round_trip(grids):
+    assert GridTable.from_grids(grids).to_grids() == grids
+
+
+def test_empty():
+    actual = GridTable.empty()
+    assert len(actual) == 0
+    assert actual.to_grids() == []
+
+
+def test_sorted_by_id(grids):
+    actual = GridTable.from_grids(grids).sorted_by_id()
+    assert actual.id.tolist() == [2, 4, 7]
+    assert actual.to_grids() == [grids[1], grids[2], grids[0]]
+
+
+def test_rows(grids):
+    table = GridTable.from_grids(grids)
+    assert table.rows([2, 7, 7, 4]).tolist() == [1, 0, 0, 2]
+
+
+def test_rows__missing_id(grids):
+    table = GridTable.from_grids(grids)
+    with pytest.raises(KeyError):
+        table.rows([2, 3])
+
+
+def test_rows__empty_table():
+    with pytest.raises(KeyError):
+        GridTable.empty().rows([1])
+
+
+def test_contains(grids):
+    table = GridTable.from_grids(grids)
+    assert table.contains([2, 3, 100, 7]).tolist() == [True, False, False, True]
+
+
+def test_eq(grids):
+    assert GridTable.from_grids(grids) == GridTable.from_grids(grids)
+    assert GridTable.from_grids(grids) != GridTable.from_grids(grids[:2])
+
+
+def test_grid_table_from_bulk_data_section(grids):
+    bulk_data = BulkDataSection(entries=[grids[0], Crod(eid=1, pid=1, g1=7, g2=2), grids[1]])
+    assert bulk_data.grid_table() == GridTable.from_grids([grids[0], grids[1]])
+
+
+def test_from_file_content__matches_entry_by_entry(grids):
+    file_content = [grid.to_file_content() for grid in grids]
+
+    actual = GridTable.from_file_content(file_content)
+    assert actual == GridTable.from_grids(grids)
+
+
+def test_from_file_content__bytes():
+    actual = GridTable.from_file_content([b"GRID          12      -1   -2.5    1.E+4     0.0"])
+
+    assert actual.id.tolist() == [12]
+    assert actual.cp.tolist() == [-1]
+    assert actual.coordinates.tolist() == [[-2.5, 1.0e4, 0.0]]
+
+
+def test_from_file_content__implicit_exponents():
+    actual = GridTable.from_file_content(["GRID           1           1.5-3    7.+4 -2.5D+1"])
+
+    assert actual.coordinates.tolist() == [[1.5e-3, 7.0e4, -25.0]]
+
+
+def test_from_file_content__empty():
+    assert GridTable.from_file_content([]) == GridTable.empty()
+
+
+def test_from_file_content__required_field_blank():
+    with pytest.raises(MissingRequiredFieldError):
+        GridTable.from_file_content(["GRID           1", "GRID                         1.0"])
+
+
+def test_from_file_content__other_entry_type():
+    with pytest.raises(ValueError, match="Line 1 is not a GRID entry"):
+        GridTable.from_file_content(["GRID           1", "CROD           1       1       1       2"])
+
+
+def test_from_file_content__invalid_integer():
+    with pytest.raises(ValueError, match="invalid literal for int"):
+        GridTable.from_file_content(["GRID         1.5"])
+
+
+@pytest.mark.parametrize("id_", ["     1 2", "     12-", "    --12", "    - 12", "       -"])
+def test_from_file_content__irregular_integer(id_):
+    with pytest.raises(ValueError, match="invalid literal for int"):
+        GridTable.from_file_content([f"GRID    {id_}"])
+
+
+def test_from_file_content__signed_integers():
+    actual = GridTable.from_file_content(
+        ["GRID         -12", "GRID        +7  ", "GRID    0012    "]
+    )
+
+    assert actual.id.tolist() == [-12, 7, 12]
+
+
+def test_to_file_content(grids):
+    actual = GridTable.from_grids(grids).to_file_content()
+
+    assert actual == [grid.to_file_content() for grid in grids]
+
+
+def test_to_file_content__same_as_entries():
+    rng = np.random.default_rng(0)
+    magnitudes = 10.0 ** rng.integers(-12, 12, (1000, 3))
+    coordinates = [
+        [round(value, decimals) for value, decimals in zip(row, row_decimals, strict=True)]
+        for row, row_decimals in zip(
+            (rng.standard_normal((1000, 3)) * magnitudes).tolist(),
+            rng.integers(0, 10, (1000, 3)).tolist(),
+            strict=True,
+        )
+    ]
+    coordinates[0][0] = -0.0
+    grids = [
+        Grid(id=i + 1, cp=i % 3 or None, x1=x1, x2=x2, x3=x3, cd=i)
+        for i, (x1, x2, x3) in enumerate(coordinates)
+    ]
+
+    actual = GridTable.from_grids(grids).to_file_content()
+
+    assert actual == [grid.to_file_content() for grid in grids]
+
+
+def test_to_file_content__round_trip(grids):
+    table = GridTable.from_grids(grids)
+    assert GridTable.from_file_content(table.to_file_content()) == table
+
+
+def test_to_file_content__empty():
+    assert GridTable.empty().to_file_content() == []
+
+
+def test_to_file_content__integer_too_long():
+    with pytest.raises(
+        FieldTooLongError, match="Field 1 of GRID does not fit into 8 characters: 123456789"
+    ):
+        GridTable.from_grids([Grid(id=1), Grid(id=123456789)]).to_file_content()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
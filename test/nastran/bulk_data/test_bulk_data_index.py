@@ -0,0 +1,151 @@
+from pathlib import Path
+
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import (
+    BulkDataIndex,
+    BulkDataSection,
+    EntryIdentifyerNotSupportedError,
+)
+from nastran_to_kratos.nastran.bulk_data.entries import Crod, Force, Grid, Mat1, Prod, Rbe2, Spc
+from nastran_to_kratos.nastran.bulk_data.tables import CrodTable, GridTable, Mat1Table
+
+
+@pytest.fixture
+def x_movable_rod_path() -> Path:
+    return (
+        Path(__file__).parent.parent.parent.parent
+        / "examples"
+        / "x_movable_rod"
+        / "nastran"
+        / "x_movable_rod.bdf"
+    )
+
+
+def write_file(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_index__x_movable_rod(x_movable_rod_path):
+    with BulkDataIndex(x_movable_rod_path) as index:
+        assert len(index) == 8
+        assert index.card_types == {"GRID", "CROD", "PROD", "MAT1", "SPC", "FORCE"}
+        assert index.count("SPC") == 2
+        assert index.count("RBE2") == 0
+
+
+def test_to_bulk_data_section__all_cards(x_movable_rod_path):
+    with BulkDataIndex(x_movable_rod_path) as index:
+        actual = index.to_bulk_data_section()
+
+    assert actual == BulkDataSection(
+        entries=[
+            Grid(id=1, cp=None, x1=0.0, x2=0.0, x3=0.0),
+            Grid(id=2, cp=None, x1=1000.0, x2=0.0, x3=0.0),
+            Crod(eid=1, pid=1, g1=1, g2=2),
+            Prod(pid=1, mid=1, a=350.0),
+            Mat1(mid=1, e=210000.0),
+            Spc(sid=2, g1=1, c1=12345, d1=0.0),
+            Spc(sid=2, g1=2, c1=2345, d1=0.0),
+            Force(sid=1, g=2, cid=0, f=40000.0, n1=1.0, n2=0.0, n3=0.0),
+        ]
+    )
+
+
+def test_to_bulk_data_section__selected_card_types_keep_file_order(x_movable_rod_path):
+    with BulkDataIndex(x_movable_rod_path) as index:
+        actual = index.to_bulk_data_section(["FORCE", "GRID"])
+
+    assert actual.entries == [
+        Grid(id=1, cp=None, x1=0.0, x2=0.0, x3=0.0),
+        Grid(id=2, cp=None, x1=1000.0, x2=0.0, x3=0.0),
+        Force(sid=1, g=2, cid=0, f=40000.0, n1=1.0, n2=0.0, n3=0.0),
+    ]
+
+
+def test_entries__unsupported_cards_are_only_rejected_when_decoded(tmp_path):
+    path = write_file(
+        tmp_path / "deck.bdf",
+        [
+            "$ comment",
+            "GRID           1               0       0       0",
+            "BADWORD        1",
+            "CROD           1       1       1       2",
+        ],
+    )
+
+    with BulkDataIndex(path) as index:
+        assert list(index.entries("CROD")) == [Crod(eid=1, pid=1, g1=1, g2=2)]
+        assert index.card_type(1) == "BADWORD"
+        with pytest.raises(EntryIdentifyerNotSupportedError):
+            index.entry(1)
+
+
+def test_raw_card__windows_line_endings(tmp_path):
+    path = tmp_path / "deck.bdf"
+    path.write_bytes(b"GRID           1               0       0       0\r\nENDDATA\r\n")
+
+    with BulkDataIndex(path) as index:
+        assert len(index) == 1
+        assert index.raw_card(0) == "GRID           1               0       0       0"
+
+
+def test_index__empty_file(tmp_path):
+    path = write_file(tmp_path / "deck.bdf", [])
+
+    with BulkDataIndex(path) as index:
+        assert len(index) == 0
+        assert index.to_bulk_data_section() == BulkDataSection.empty()
+
+
+def test_table(x_movable_rod_path):
+    with BulkDataIndex(x_movable_rod_path) as index:
+        section = index.to_bulk_data_section()
+
+        assert index.table(GridTable) == section.grid_table()
+        assert index.table(CrodTable) == section.crod_table()
+        assert len(index.table(Mat1Table)) == 1
+
+
+def test_index__large_field_card(tmp_path):
+    path = write_file(
+        tmp_path / "large_field.bdf",
+        [
+            "BEGIN BULK",
+            "GRID*                  2                          1000.0             0.0*G2",
+            "*G2                  2.0",
+            "GRID           3            1000     0.0     0.0",
+            "ENDDATA",
+        ],
+    )
+
+    with BulkDataIndex(path) as index:
+        assert len(index) == 2
+        assert index.entry(0) == Grid(id=2, x1=1000.0, x3=2.0)
+        assert index.table(GridTable) == GridTable.from_grids(
+            [Grid(id=2, x1=1000.0, x3=2.0), Grid(id=3, x1=1000.0)]
+        )
+
+
+def test_index__continuation_lines(tmp_path):
+    path = write_file(
+        tmp_path / "continuation.bdf",
+        [
+            "BEGIN BULK",
+            "RBE2           1      10  123456      20      21      22      23      24+R1",
+            "+R1           25      26",
+            "                      27",
+            "GRID           3            1000     0.0     0.0",
+            "ENDDATA",
+        ],
+    )
+
+    with BulkDataIndex(path) as index:
+        assert len(index) == 2
+        assert index.entry(0) == Rbe2(eid=1, gn=10, cm=123456, gmi=[20, 21, 22, 23, 24, 25, 26, 27])
+        assert index.entry(1) == Grid(id=3, x1=1000.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,8 +1,15 @@
 from nastran_to_kratos.nastran.bulk_data import (
     BulkDataSection,
     EntryIdentifyerNotSupportedError,
+    EntryTypeWithoutSetError,
+    TooManyFreeFieldsError,
 )
-from nastran_to_kratos.nastran.bulk_data.entries import Grid, Crod, Prod, Force, Spc, Mat1
+from nastran_to_kratos.nastran.bulk_data.entries import Grid, Crod, Prod, Force, Spc, Mat1, Rbe2
+from nastran_to_kratos.nastran.bulk_data.entries import MissingRequiredFieldError
+from nastran_to_kratos.nastran.bulk_data.tables import GridTable
+
+import io
+import pickle
 
 import pytest
 
@@ -17,6 +24,22 @@ def test_from_file_content__multiple_entries():
     assert len(actual.entries) == 2
 
 
+def test_from_file_content__generator():
+    file_content = (
+        line
+        for line in [
+            "GRID           2          1000.0     0.0     0.0",
+            "CROD          12      13      21      23",
+        ]
+    )
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [
+        Grid(id=2, x1=1000.0),
+        Crod(eid=12, pid=13, g1=21, g2=23),
+    ]
+
+
 def test_from_file_content__unsupported_entry():
     file_content = ["BADWORD "]
 
@@ -129,5 +152,318 @@ def test_to_file_content():
     ]
 
 
+def test_write_to():
+    section = BulkDataSection(
+        entries=[Grid(id=i, x1=float(i)) for i in range(2500)], includes=["loads.bdf"]
+    )
+
+    stream = io.StringIO()
+    section.write_to(stream)
+    assert stream.getvalue().splitlines() == section.to_file_content()
+
+
+def test_entries_by_type__keep_order():
+    grid1 = Grid(id=1)
+    grid2 = Grid(id=2)
+    crod = Crod(eid=1, pid=1, g1=1, g2=2)
+    section = BulkDataSection(entries=[grid1, crod, grid2])
+
+    assert section.grids == [grid1, grid2]
+    assert section.crods == [crod]
+    assert section.forces == []
+
+
+def test_entries_by_type__are_not_recomputed():
+    section = BulkDataSection(entries=[Grid(id=1), Grid(id=2)])
+    section.grids
+    assert section.entries.of_type(Grid) is section.entries.of_type(Grid)
+
+
+def test_entries_by_type__modifying_the_result():
+    force = Force(sid=1, g=1, cid=0, f=1.0, n1=1.0, n2=0.0, n3=0.0)
+    section = BulkDataSection(entries=[Grid(id=1), force])
+
+    section.grids.append(Grid(id=2))
+    section.forces_in_set(1).clear()
+
+    assert section.grids == [Grid(id=1)]
+    assert section.forces_in_set(1) == [force]
+
+
+def test_entries_by_type__append():
+    section = BulkDataSection.empty()
+    section.entries.append(Grid(id=1))
+    section.entries.extend([Crod(eid=1, pid=1, g1=1, g2=2), Grid(id=2)])
+
+    assert section.grids == [Grid(id=1), Grid(id=2)]
+    assert section.crods == [Crod(eid=1, pid=1, g1=1, g2=2)]
+
+
+def test_entries_by_type__other_modifications():
+    section = BulkDataSection(entries=[Grid(id=1), Grid(id=2)])
+    assert section.grids == [Grid(id=1), Grid(id=2)]
+
+    section.entries.insert(0, Grid(id=3))
+    assert section.grids == [Grid(id=3), Grid(id=1), Grid(id=2)]
+
+    section.entries[1] = Crod(eid=1, pid=1, g1=1, g2=2)
+    assert section.grids == [Grid(id=3), Grid(id=2)]
+
+    del section.entries[0]
+    assert section.grids == [Grid(id=2)]
+
+    section.entries = [Grid(id=4)]
+    assert section.grids == [Grid(id=4)]
+    assert section.crods == []
+
+
+def test_entries_by_type__pickle():
+    section = BulkDataSection(entries=[Grid(id=1), Crod(eid=1, pid=1, g1=1, g2=2)])
+
+    actual = pickle.loads(pickle.dumps(section))
+    assert actual == section
+    assert actual.grids == [Grid(id=1)]
+
+
+def test_entries_in_set():
+    force1 = Force(sid=1, g=1, cid=0, f=1.0, n1=1.0, n2=0.0, n3=0.0)
+    force2 = Force(sid=2, g=1, cid=0, f=2.0, n1=1.0, n2=0.0, n3=0.0)
+    force3 = Force(sid=1, g=2, cid=0, f=3.0, n1=1.0, n2=0.0, n3=0.0)
+    spc = Spc(sid=1, g1=1, c1=123)
+    section = BulkDataSection(entries=[force1, spc, force2, force3])
+
+    assert section.forces_in_set(1) == [force1, force3]
+    assert section.forces_in_set(2) == [force2]
+    assert section.forces_in_set(3) == []
+    assert section.spcs_in_set(1) == [spc]
+
+
+def test_entries_in_set__modifications():
+    force1 = Force(sid=1, g=1, cid=0, f=1.0, n1=1.0, n2=0.0, n3=0.0)
+    force2 = Force(sid=1, g=2, cid=0, f=2.0, n1=1.0, n2=0.0, n3=0.0)
+    section = BulkDataSection(entries=[force1])
+    assert section.forces_in_set(1) == [force1]
+
+    section.entries.append(force2)
+    assert section.forces_in_set(1) == [force1, force2]
+
+    del section.entries[0]
+    assert section.forces_in_set(1) == [force2]
+
+
+def test_entries_in_set__type_without_set():
+    section = BulkDataSection(entries=[Grid(id=1)])
+
+    with pytest.raises(EntryTypeWithoutSetError):
+        section.entries_in_set(Grid, 1)
+
+
+def test_from_file_content__large_field_grid():
+    file_content = [
+        "GRID*                  2               5          1000.0             0.0*G2",
+        "*G2                  2.0               3             123               7",
+    ]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [Grid(id=2, cp=5, x1=1000.0, x2=0.0, x3=2.0, cd=3, ps="123", seid=7)]
+
+
+def test_from_file_content__large_field_followed_by_small_field():
+    file_content = [
+        "GRID*                  2                          1000.0             0.0",
+        "*                    2.0",
+        "CROD          12      13      21      23",
+    ]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [Grid(id=2, x1=1000.0, x3=2.0), Crod(eid=12, pid=13, g1=21, g2=23)]
+
+
+def test_from_file_content__continuation_of_short_large_field_line():
+    file_content = [
+        "GRID*                  1               0             1.0",
+        "*                    3.0",
+    ]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [Grid(id=1, cp=0, x1=1.0, x3=3.0)]
+
+
+def test_from_file_content__continuation_of_short_large_free_field_line():
+    file_content = ["GRID*,1,0,1.0", "*,3.0"]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [Grid(id=1, cp=0, x1=1.0, x3=3.0)]
+
+
+def test_from_file_content__free_field():
+    file_content = ["GRID,2,5,1000.,0.,2.,3,123,7", "CROD,12,13,21,23", "PARAM,POST,-2"]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [
+        Grid(id=2, cp=5, x1=1000.0, x2=0.0, x3=2.0, cd=3, ps="123", seid=7),
+        Crod(eid=12, pid=13, g1=21, g2=23),
+    ]
+
+
+def test_from_file_content__free_field_blank_fields_and_continuation_marker():
+    file_content = ["GRID,2,,1000.,0.,0.,,,,+G2"]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [Grid(id=2, x1=1000.0)]
+
+
+def test_from_file_content__large_free_field():
+    file_content = ["GRID*,2,,1000.,0.,*G2", "*G2,2."]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [Grid(id=2, x1=1000.0, x3=2.0)]
+
+
+def test_from_file_content__too_many_free_fields():
+    with pytest.raises(TooManyFreeFieldsError):
+        BulkDataSection.from_file_content(["GRID,2,,1000.,0.,0.,,,,+G2,1"])
+
+
+def test_from_file_content__continuation_lines():
+    file_content = [
+        "RBE2           1      10  123456      20      21      22      23      24+R1",
+        "+R1           25      26",
+        "                      27     0.5",
+        "MAT1           1 210000.             0.3                                    +M1",
+        "+M1         250.",
+    ]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [
+        Rbe2(eid=1, gn=10, cm=123456, gmi=[20, 21, 22, 23, 24, 25, 26, 27], alpha=0.5),
+        Mat1(mid=1, e=210000.0, nu=0.3, st=250.0),
+    ]
+
+
+def test_from_file_content__continuation_of_short_line():
+    file_content = [
+        "MAT1           1   2.1+5             0.3  7.85-9",
+        "+            10.     20.     30.       4",
+    ]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [
+        Mat1(mid=1, e=2.1e5, nu=0.3, rho=7.85e-9, st=10.0, sc=20.0, ss=30.0, mcsid=4)
+    ]
+
+
+def test_from_file_content__free_field_continuation_of_short_line():
+    file_content = ["MAT1,1,2.1+5,,0.3,7.85-9", "+,10.,20.,30.,4"]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [
+        Mat1(mid=1, e=2.1e5, nu=0.3, rho=7.85e-9, st=10.0, sc=20.0, ss=30.0, mcsid=4)
+    ]
+
+
+def test_from_file_content__free_field_continuation_lines():
+    file_content = ["RBE2,1,10,123456,20,21,22,23,24,+R1", "+R1,25,26", ",27"]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [
+        Rbe2(eid=1, gn=10, cm=123456, gmi=[20, 21, 22, 23, 24, 25, 26, 27]),
+    ]
+
+
+def test_from_file_content__blank_lines_are_skipped():
+    file_content = ["GRID           2          1000.0     0.0     0.0", "", "   "]
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [Grid(id=2, x1=1000.0)]
+
+
+def test_from_file_content__card_with_many_continuation_lines():
+    dependent_grids = list(range(100, 30_100))
+    file_content = [
+        "RBE2           1      10  123456" + "".join(f"{g:>8}" for g in dependent_grids[:5])
+    ]
+    for start in range(5, len(dependent_grids), 8):
+        file_content.append(
+            "+" + " " * 7 + "".join(f"{g:>8}" for g in dependent_grids[start : start + 8])
+        )
+
+    actual = BulkDataSection.from_file_content(file_content)
+    assert actual.entries == [Rbe2(eid=1, gn=10, cm=123456, gmi=dependent_grids)]
+
+
+def _grid_lines(count):
+    return [f"GRID    {i:>8}{i % 7:>8}{i * 0.5:>8}{-i:>8}    1.-3" for i in range(1, count + 1)]
+
+
+def test_from_file_content__blocks_match_card_by_card():
+    file_content = [
+        *_grid_lines(40),
+        *[f"CROD    {i:>8}       1{i:>8}{i + 1:>8}" for i in range(1, 21)],
+        *["PROD           1       1    35.0" for _ in range(20)],
+        *["MAT1           1  2.1+5            0.3  7.85-9" for _ in range(20)],
+    ]
+
+    actual = BulkDataSection.from_file_content(file_content)
+
+    expected = [BulkDataSection.from_file_content([line]).entries[0] for line in file_content]
+    assert actual.entries == expected
+
+
+def test_from_file_content__blocks_keep_order_with_other_cards():
+    file_content = [
+        *_grid_lines(20),
+        "GRID          21                     1.0" + " " * 32 + "+",
+        "+",
+        *_grid_lines(3),
+        "SPC            1       1  123456",
+        *_grid_lines(20),
+    ]
+
+    actual = BulkDataSection.from_file_content(file_content)
+
+    assert [type(entry) for entry in actual.entries] == [Grid] * 24 + [Spc] + [Grid] * 20
+    assert actual.entries[20] == Grid(id=21, x2=1.0)
+    assert actual.entries[:20] == actual.entries[25:]
+
+
+def test_from_file_content__error_in_block():
+    file_content = [*_grid_lines(20), "GRID                         1.0"]
+
+    with pytest.raises(MissingRequiredFieldError):
+        BulkDataSection.from_file_content(file_content)
+
+
+def test_grid_table__decoded_from_the_lines(monkeypatch):
+    section = BulkDataSection.from_file_content(_grid_lines(20))
+    monkeypatch.setattr(GridTable, "from_entries", None)
+
+    actual = section.grid_table()
+    assert actual == GridTable.from_grids(section.grids)
+    assert section.grid_table() is actual
+
+
+def test_grid_table__not_all_grids_in_blocks():
+    section = BulkDataSection.from_file_content([*_grid_lines(20), "GRID,21,,1.0"])
+
+    assert section.grid_table() == GridTable.from_grids(section.grids)
+
+
+def test_grid_table__append():
+    section = BulkDataSection.from_file_content(_grid_lines(20))
+    section.grid_table()
+
+    section.entries.append(Grid(id=21))
+    assert section.grid_table() == GridTable.from_grids(section.grids)
+
+
+def test_grid_table__pickle(monkeypatch):
+    section = BulkDataSection.from_file_content(_grid_lines(20))
+
+    actual = pickle.loads(pickle.dumps(section))
+    monkeypatch.setattr(GridTable, "from_entries", None)
+    assert actual.grid_table() == section.grid_table()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import (
+    BulkDataSection,
+    DeduplicationReport,
+    InvalidToleranceError,
+    deduplicate,
+)
+from nastran_to_kratos.nastran.bulk_data.entries import Conrod, Crod, Grid, Mat1, Prod
+
+
+@pytest.fixture
+def bulk_data() -> BulkDataSection:
+    return BulkDataSection(
+        entries=[
+            Grid(id=1, cp=None, x1=0.0, x2=0.0, x3=0.0),
+            Mat1(mid=1, e=2.1e5, nu=0.3),
+            Mat1(mid=2, e=2.1e5, nu=0.3),
+            Mat1(mid=3, e=7.0e4, nu=0.3),
+            Prod(pid=10, mid=1, a=2.0),
+            Prod(pid=20, mid=2, a=2.0),
+            Prod(pid=30, mid=3, a=2.0),
+            Crod(eid=1, pid=10, g1=1, g2=2),
+            Crod(eid=2, pid=20, g1=2, g2=3),
+            Crod(eid=3, pid=30, g1=3, g2=4),
+            Conrod(eid=4, g1=4, g2=5, mid=2, a=1.0),
+        ],
+        includes=["loads.bdf"],
+    )
+
+
+def test_deduplicate(bulk_data):
+    deduplicated, report = deduplicate(bulk_data)
+
+    assert deduplicated == BulkDataSection(
+        entries=[
+            Grid(id=1, cp=None, x1=0.0, x2=0.0, x3=0.0),
+            Mat1(mid=1, e=2.1e5, nu=0.3),
+            Mat1(mid=3, e=7.0e4, nu=0.3),
+            Prod(pid=10, mid=1, a=2.0),
+            Prod(pid=30, mid=3, a=2.0),
+            Crod(eid=1, pid=10, g1=1, g2=2),
+            Crod(eid=2, pid=10, g1=2, g2=3),
+            Crod(eid=3, pid=30, g1=3, g2=4),
+            Conrod(eid=4, g1=4, g2=5, mid=1, a=1.0),
+        ],
+        includes=["loads.bdf"],
+    )
+    assert report == DeduplicationReport(
+        mat1_ids={2: 1}, prod_ids={20: 10}, mat1s_before=3, prods_before=3
+    )
+    assert report.summary() == "MAT1: 3 -> 2, PROD: 3 -> 2"
+
+
+def test_deduplicate__input_unchanged(bulk_data):
+    entries = list(bulk_data.entries)
+
+    deduplicated, _ = deduplicate(bulk_data)
+
+    assert bulk_data.entries == entries
+    assert deduplicated.entries[0] is entries[0]
+
+
+def test_deduplicate__nothing_to_merge():
+    bulk_data = BulkDataSection(
+        entries=[Mat1(mid=1, e=2.1e5), Mat1(mid=2, e=2.1e5, nu=0.3), Mat1(mid=3, e=2.1e5 + 1e-9)]
+    )
+
+    deduplicated, report = deduplicate(bulk_data)
+
+    assert deduplicated == bulk_data
+    assert report.summary() == "MAT1: 3 -> 3, PROD: 0 -> 0"
+
+
+def test_deduplicate__tolerance():
+    bulk_data = BulkDataSection(
+        entries=[
+            Mat1(mid=1, e=2.1e5, nu=0.3),
+            Mat1(mid=2, e=2.1e5 * (1 + 1e-9), nu=0.3),
+            Mat1(mid=3, e=2.1e5 * (1 - 1e-9), nu=0.3 * (1 + 1e-9)),
+            Mat1(mid=4, e=2.1e5 * (1 + 1e-3), nu=0.3),
+            Mat1(mid=5, e=2.1e5, nu=None),
+            Mat1(mid=6, e=2.1e5, nu=0.3, mcsid=1),
+        ]
+    )
+
+    _, report = deduplicate(bulk_data, rel_tolerance=1e-6)
+
+    assert report.mat1_ids == {2: 1, 3: 1}
+
+
+def test_deduplicate__tolerance_keeps_first_entry():
+    bulk_data = BulkDataSection(
+        entries=[Prod(pid=1, mid=1, a=1.5), Prod(pid=2, mid=1, a=1.0), Prod(pid=3, mid=1, a=1.2)]
+    )
+
+    _, report = deduplicate(bulk_data, rel_tolerance=0.3)
+
+    assert report.prod_ids == {3: 1}
+
+
+@pytest.mark.parametrize("rel_tolerance", [-0.1, 1.0])
+def test_deduplicate__invalid_tolerance(bulk_data, rel_tolerance):
+    with pytest.raises(InvalidToleranceError):
+        deduplicate(bulk_data, rel_tolerance)
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import (
+    BulkDataSection,
+    CyclicIncludeError,
+    IncludeCache,
+    resolve_includes,
+)
+from nastran_to_kratos.nastran.bulk_data.entries import Crod, Force, Grid
+
+
+def write_file(path: Path, lines: list[str]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def model_directory(tmp_path) -> Path:
+    write_file(
+        tmp_path / "mesh.bdf",
+        [
+            "$ mesh of the rod",
+            "GRID           1               0       0       0",
+            "GRID           2            1000       0       0",
+            "CROD           1       1       1       2",
+        ],
+    )
+    write_file(
+        tmp_path / "loads" / "loads.bdf",
+        ["INCLUDE 'case_1.bdf'", "FORCE          2       2       0  1000.0     1.0     0.0     0.0"],
+    )
+    write_file(
+        tmp_path / "loads" / "case_1.bdf",
+        ["FORCE          3       2       0  1000.0     0.0     1.0     0.0"],
+    )
+    return tmp_path
+
+
+def main_bulk_data() -> BulkDataSection:
+    return BulkDataSection.from_file_content(
+        ["INCLUDE 'mesh.bdf'", "INCLUDE", "        'loads/loads.bdf'", "GRID           3"]
+    )
+
+
+def expected_entries() -> list:
+    return [
+        Grid(id=3),
+        Grid(id=1),
+        Grid(id=2, x1=1000.0),
+        Crod(eid=1, pid=1, g1=1, g2=2),
+        Force(sid=2, g=2, cid=0, f=1000.0, n1=1.0, n2=0.0, n3=0.0),
+        Force(sid=3, g=2, cid=0, f=1000.0, n1=0.0, n2=1.0, n3=0.0),
+    ]
+
+
+def test_from_file_content__includes_are_recorded():
+    assert main_bulk_data().includes == ["mesh.bdf", "loads/loads.bdf"]
+    assert main_bulk_data().to_file_content() == [
+        "GRID           3               0       0       0",
+        "INCLUDE 'mesh.bdf'",
+        "INCLUDE 'loads/loads.bdf'",
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_resolve_includes(model_directory, max_workers):
+    actual = resolve_includes(main_bulk_data(), model_directory, max_workers=max_workers)
+
+    assert actual.entries == expected_entries()
+    assert actual.includes == []
+
+
+def test_resolve_includes__only_changed_files_are_parsed_again(model_directory, monkeypatch):
+    cache = IncludeCache()
+    resolve_includes(main_bulk_data(), model_directory, cache, max_workers=1)
+    assert len(cache) == 3
+
+    parsed_paths = []
+    from_path = BulkDataSection.from_path
+
+    def counting_from_path(path: Path) -> BulkDataSection:
+        parsed_paths.append(path.name)
+        return from_path(path)
+
+    monkeypatch.setattr(BulkDataSection, "from_path", counting_from_path)
+    write_file(
+        model_directory / "loads" / "case_1.bdf",
+        ["FORCE          3       2       0  2000.0     0.0     1.0     0.0"],
+    )
+    actual = resolve_includes(main_bulk_data(), model_directory, cache, max_workers=1)
+
+    assert parsed_paths == ["case_1.bdf"]
+    assert actual.forces[-1].f == 2000.0
+
+
+def test_resolve_includes__cycle(tmp_path):
+    write_file(tmp_path / "a.bdf", ["INCLUDE 'b.bdf'"])
+    write_file(tmp_path / "b.bdf", ["INCLUDE 'a.bdf'"])
+
+    with pytest.raises(CyclicIncludeError):
+        resolve_includes(BulkDataSection(entries=[], includes=["a.bdf"]), tmp_path)
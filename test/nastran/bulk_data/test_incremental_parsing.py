@@ -0,0 +1,95 @@
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import (
+    BulkDataSection,
+    ChangeSet,
+    EntryIdentifyerNotSupportedError,
+    IncrementalParser,
+)
+from nastran_to_kratos.nastran.bulk_data.entries import Force, Grid, Rbe2
+
+
+@pytest.fixture
+def file_content() -> list[str]:
+    return [
+        "GRID           1               0       0       0",
+        "GRID           2            1000       0       0",
+        "RBE2           1       1  123456       2",
+        "+             20",
+        "FORCE          1       2       0  1000.0     1.0     0.0     0.0",
+        "INCLUDE 'loads.bdf'",
+        "PARAM,POST,-2",
+    ]
+
+
+def test_parse__first_parse(file_content):
+    bulk_data, changes = IncrementalParser().parse(file_content)
+
+    assert bulk_data == BulkDataSection.from_file_content(file_content)
+    assert changes.added == bulk_data.entries
+    assert changes.removed == []
+    assert changes.unchanged == 0
+
+
+def test_parse__unchanged(file_content):
+    parser = IncrementalParser()
+    previous, _ = parser.parse(file_content)
+
+    bulk_data, changes = parser.parse(file_content)
+    assert bulk_data == previous
+    assert changes == ChangeSet(unchanged=6)
+    assert changes.is_empty()
+    assert all(
+        entry is previous_entry for entry, previous_entry in zip(bulk_data.entries, previous.entries)
+    )
+
+
+def test_parse__edited_card(file_content):
+    parser = IncrementalParser()
+    parser.parse(file_content)
+
+    file_content[4] = "FORCE          1       2       0  2000.0     1.0     0.0     0.0"
+    file_content[3] = "+             20      21"
+    bulk_data, changes = parser.parse(file_content)
+
+    assert bulk_data == BulkDataSection.from_file_content(file_content)
+    assert changes.added == [
+        Rbe2(eid=1, gn=1, cm=123456, gmi=[2, 20, 21]),
+        Force(sid=1, g=2, cid=0, f=2000.0, n1=1.0, n2=0.0, n3=0.0),
+    ]
+    assert changes.removed == [
+        Rbe2(eid=1, gn=1, cm=123456, gmi=[2, 20]),
+        Force(sid=1, g=2, cid=0, f=1000.0, n1=1.0, n2=0.0, n3=0.0),
+    ]
+    assert changes.unchanged == 4
+
+
+def test_parse__removed_card(file_content):
+    parser = IncrementalParser()
+    parser.parse(file_content)
+
+    bulk_data, changes = parser.parse(file_content[1:])
+    assert bulk_data.grids == [Grid(id=2, x1=1000.0)]
+    assert changes.removed == [Grid(id=1)]
+    assert changes.added == []
+
+
+def test_parse__repeated_card():
+    grid = "GRID           1               0       0       0"
+    parser = IncrementalParser()
+    parser.parse([grid])
+
+    bulk_data, changes = parser.parse([grid, grid])
+    assert bulk_data.entries == [Grid(id=1), Grid(id=1)]
+    assert bulk_data.entries[0] is not bulk_data.entries[1]
+    assert changes == ChangeSet(added=[Grid(id=1)], unchanged=1)
+
+    _, changes = parser.parse([grid])
+    assert changes == ChangeSet(removed=[Grid(id=1)], unchanged=1)
+
+
+def test_parse__orphan_continuation_line():
+    with pytest.raises(EntryIdentifyerNotSupportedError):
+        BulkDataSection.from_file_content(["+             20"])
+    with pytest.raises(EntryIdentifyerNotSupportedError):
+        IncrementalParser().parse(["+             20"])
@@ -0,0 +1,68 @@
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection, parse_bulk_data_in_parallel
+from nastran_to_kratos.nastran.bulk_data import parallel_parsing
+from nastran_to_kratos.nastran.bulk_data.parallel_parsing import _chunks
+
+
+@pytest.fixture
+def file_content() -> list[str]:
+    return [
+        "GRID           1               0       0       0",
+        "GRID           2            1000       0       0",
+        "RBE2           1      10  123456      20      21      22      23      24+R1",
+        "+R1           25      26",
+        "",
+        "                      27",
+        "CROD           1       1       1       2",
+        "INCLUDE 'loads.bdf'",
+        "GRID*                  3                          1000.0             0.0",
+        "*                    2.0",
+        "PARAM,POST,-2",
+        "CROD,2,1,2,3",
+    ]
+
+
+def test_chunks__continuation_lines_stay_with_their_card(file_content):
+    actual = list(_chunks(file_content, chunk_size=3))
+
+    assert [len(chunk) for chunk in actual] == [6, 4, 2]
+    assert [line for chunk in actual for line in chunk] == file_content
+
+
+def test_parse_bulk_data_in_parallel(file_content):
+    actual = parse_bulk_data_in_parallel(file_content, max_workers=2, chunk_size=3)
+
+    expected = BulkDataSection.from_file_content(file_content)
+    assert actual == expected
+    assert actual.includes == ["loads.bdf"]
+    assert actual.crods == expected.crods
+
+
+def test_parse_bulk_data_in_parallel__single_chunk_is_parsed_without_processes(
+    file_content, monkeypatch
+):
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(parallel_parsing, "ProcessPoolExecutor", fail)
+
+    actual = parse_bulk_data_in_parallel(file_content, max_workers=4)
+    assert actual == BulkDataSection.from_file_content(file_content)
+
+
+def test_parse_bulk_data_in_parallel__single_processor_is_parsed_without_processes(
+    file_content, monkeypatch
+):
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(parallel_parsing.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(parallel_parsing, "ProcessPoolExecutor", fail)
+
+    actual = parse_bulk_data_in_parallel(file_content, max_workers=None, chunk_size=3)
+    assert actual == BulkDataSection.from_file_content(file_content)
+
+
+def test_parse_bulk_data_in_parallel__empty():
+    assert parse_bulk_data_in_parallel([], max_workers=2) == BulkDataSection.empty()
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import format_real, parse_real, parse_real_column
+
+
+@pytest.mark.parametrize(
+    ("field", "expected"),
+    [
+        ("1.5", 1.5),
+        ("-0.25", -0.25),
+        ("1.", 1.0),
+        (".5", 0.5),
+        ("2.1E5", 2.1e5),
+        ("6.5e-6", 6.5e-6),
+        ("7.E+4", 7.0e4),
+        ("1.5-3", 1.5e-3),
+        ("7.+4", 7.0e4),
+        ("-1.5-3", -1.5e-3),
+        ("+.5+2", 50.0),
+        ("1.5D-3", 1.5e-3),
+        ("2.1d5", 2.1e5),
+        ("1000", 1000.0),
+    ],
+)
+def test_parse_real(field, expected):
+    assert parse_real(field) == expected
+
+
+@pytest.mark.parametrize("field", ["abc", "1.5-", "1.5E", "--1.5"])
+def test_parse_real__invalid(field):
+    with pytest.raises(ValueError, match="could not convert string to float"):
+        parse_real(field)
+
+
+def test_parse_real_column():
+    strings = np.array(
+        [b"1.5", b" -0.25", b"2.1E5", b"1.5-3", b"7.+4", b"-1.234+5", b"1.5D-3", b"2.5\0\0\0"],
+        dtype="S8",
+    )
+
+    actual = parse_real_column(strings)
+    assert actual.tolist() == [1.5, -0.25, 2.1e5, 1.5e-3, 7.0e4, -1.234e5, 1.5e-3, 2.5]
+
+
+def test_parse_real_column__matches_parse_real():
+    fields = ["1.5", "7.+4", "-1.5-3", "1.5D-3", ".5+2", "1.2345-7", "  -3.25", "+1.5+3"]
+
+    actual = parse_real_column(np.array([field.encode() for field in fields], dtype="S8"))
+    assert actual.tolist() == [parse_real(field) for field in fields]
+
+
+def test_parse_real_column__large_fields():
+    fields = ["1.23456789012345", "-123456789012345678", "1.234567890123-30", "9.87654321+300"]
+
+    actual = parse_real_column(np.array([field.encode() for field in fields], dtype="S20"))
+    assert actual.tolist() == [parse_real(field) for field in fields]
+
+
+def test_parse_real_column__invalid():
+    with pytest.raises(ValueError, match="could not convert string to float"):
+        parse_real_column(np.array([b"1.5-3", b"abc"], dtype="S8"))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (210000.0, "210000"),
+        (0.3, "0.3"),
+        (-2.5, "-2.5"),
+        (6.5e-6, "6.5e-06"),
+        (1.23456789, "1.234568"),
+        (-1.23456789, "-1.23457"),
+        (123456789.0, "1.2346+8"),
+        (1.23456789e-7, "1.2346-7"),
+        (-1.5e20, "-1.5e+20"),
+    ],
+)
+def test_format_real(value, expected):
+    assert format_real(value) == expected
+
+
+def test_format_real__keep_point():
+    assert format_real(-6.0, keep_point=True) == "-6.0"
+
+
+def test_format_real__fits_into_field_and_is_read_back_closely():
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(1000) * 10.0 ** rng.integers(-30, 30, 1000)
+
+    for value in values:
+        text = format_real(value)
+        assert len(text) <= 8
+        # Negative values with two digit exponents keep only two significant digits.
+        assert parse_real(text) == pytest.approx(value, rel=5e-2)
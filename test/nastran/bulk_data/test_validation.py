@@ -0,0 +1,122 @@
+from pathlib import Path
+
+import pytest
+
+from nastran_to_kratos.nastran.bulk_data import (
+    BulkDataIndex,
+    BulkDataSection,
+    DanglingReference,
+    DanglingReferencesError,
+    check_references,
+    validate_references,
+)
+from nastran_to_kratos.nastran.bulk_data.entries import (
+    Conrod,
+    Crod,
+    Force,
+    Grid,
+    Mat1,
+    Prod,
+    Rbe2,
+    Spc,
+)
+
+
+@pytest.fixture
+def x_movable_rod_path() -> Path:
+    return (
+        Path(__file__).parent.parent.parent.parent
+        / "examples"
+        / "x_movable_rod"
+        / "nastran"
+        / "x_movable_rod.bdf"
+    )
+
+
+def test_validate_references__x_movable_rod(x_movable_rod_path):
+    with BulkDataIndex(x_movable_rod_path) as index:
+        bulk_data = index.to_bulk_data_section()
+
+    assert validate_references(bulk_data) == []
+    check_references(bulk_data)
+
+
+def test_validate_references__all_reference_types():
+    crod = Crod(eid=1, pid=2, g1=1, g2=3)
+    prod = Prod(pid=1, mid=2, a=1.0)
+    conrod = Conrod(eid=2, g1=1, g2=2, mid=3, a=1.0)
+    force = Force(sid=1, g=4, cid=0, f=1.0, n1=1.0, n2=0.0, n3=0.0)
+    spc = Spc(sid=1, g1=1, c1=123, g2=5, c2=123)
+    rbe2 = Rbe2(eid=3, gn=1, cm=123, gmi=[2, 6, 7])
+    bulk_data = BulkDataSection(
+        entries=[Grid(id=1), Grid(id=2), Mat1(mid=1), crod, prod, conrod, force, spc, rbe2]
+    )
+
+    assert validate_references(bulk_data) == [
+        DanglingReference(crod, 3, "pid", "PROD", 2),
+        DanglingReference(crod, 3, "g2", "GRID", 3),
+        DanglingReference(prod, 4, "mid", "MAT1", 2),
+        DanglingReference(conrod, 5, "mid", "MAT1", 3),
+        DanglingReference(force, 6, "g", "GRID", 4),
+        DanglingReference(spc, 7, "g2", "GRID", 5),
+        DanglingReference(rbe2, 8, "gmi", "GRID", 6),
+        DanglingReference(rbe2, 8, "gmi", "GRID", 7),
+    ]
+
+
+def test_validate_references__blank_fields_are_skipped():
+    bulk_data = BulkDataSection(entries=[Grid(id=1), Spc(sid=1, g1=1, c1=123)])
+
+    assert validate_references(bulk_data) == []
+
+
+def test_validate_references__line_numbers(tmp_path):
+    path = tmp_path / "model.bdf"
+    path.write_text(
+        "\n".join(
+            [
+                "SOL 101",
+                "CEND",
+                "BEGIN BULK",
+                "GRID           1               0       0       0",
+                "RBE2           1       1  123456       2",
+                "+             20",
+                "$ comment",
+                "CROD           1       1       1       2",
+                "ENDDATA",
+            ]
+        )
+        + "\n"
+    )
+
+    with BulkDataIndex(path) as index:
+        bulk_data = index.to_bulk_data_section()
+        line_numbers = index.line_numbers()
+
+    assert line_numbers == [4, 5, 8]
+    actual = validate_references(bulk_data, line_numbers)
+    assert [(reference.line_number, reference.referenced_id) for reference in actual] == [
+        (5, 2),
+        (5, 20),
+        (8, 1),
+        (8, 2),
+    ]
+    assert str(actual[2]) == "card 2 (line 8): CROD 1 refers to the missing PROD 1 in field pid"
+
+
+def test_check_references():
+    crod = Crod(eid=7, pid=1, g1=1, g2=2)
+    bulk_data = BulkDataSection(entries=[Grid(id=1), crod])
+
+    with pytest.raises(DanglingReferencesError) as error:
+        check_references(bulk_data)
+
+    assert error.value.dangling_references == [
+        DanglingReference(crod, 1, "pid", "PROD", 1),
+        DanglingReference(crod, 1, "g2", "GRID", 2),
+    ]
+    assert str(error.value) == (
+        "2 dangling references:\n"
+        "card 1: CROD 7 refers to the missing PROD 1 in field pid\n"
+        "card 1: CROD 7 refers to the missing GRID 2 in field g2"
+    )
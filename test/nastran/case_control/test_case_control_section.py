@@ -1,5 +1,8 @@
+import io
+
 import pytest
 
+from nastran_to_kratos.nastran.case_control import Analysis
 from nastran_to_kratos.nastran.case_control.case_control_section import CaseControlSection, Subcase
 
 
@@ -149,5 +152,28 @@ def test_from_file_content__subcases():
     ]
 
 
+def test_write_to():
+    section = CaseControlSection(
+        general=Subcase(analysis=Analysis.STATICS),
+        subcases={1: Subcase(label="LS_xForce", load=1)},
+    )
+
+    stream = io.StringIO()
+    section.write_to(stream)
+    assert stream.getvalue().splitlines() == section.to_file_content()
+
+
+def test_resolve_subcase():
+    section = CaseControlSection(
+        general=Subcase(analysis=Analysis.STATICS, spc=2, load=1),
+        subcases={1: Subcase(label="LS_xForce", load=3)},
+    )
+
+    assert section.resolve_subcase(1) == Subcase(
+        analysis=Analysis.STATICS, label="LS_xForce", load=3, spc=2
+    )
+    assert section.subcases[1] == Subcase(label="LS_xForce", load=3)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
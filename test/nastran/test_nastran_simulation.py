@@ -1,8 +1,9 @@
+import io
 from pathlib import Path
 
 import pytest
 
-from nastran_to_kratos.nastran import NastranSimulation
+from nastran_to_kratos.nastran import MissingSectionError, NastranSimulation
 from nastran_to_kratos.nastran.case_control import (
     Analysis,
     CaseControlSection,
@@ -83,11 +84,74 @@ def test_from_path__x_movable_rod(x_movable_rod, x_movable_rod_path):
     assert actual == x_movable_rod
 
 
+def test_from_file_content__lazy_iterable(x_movable_rod, x_movable_rod_path):
+    with x_movable_rod_path.open() as f:
+        actual = NastranSimulation.from_file_content(line for line in f)
+    assert actual == x_movable_rod
+
+
+def test_from_file_content__bulk_data_is_streamed():
+    consumed_lines = []
+
+    def lines():
+        for line in [
+            "$$ Case Control Cards\n",
+            "  ANALYSIS = STATICS\n",
+            "$$ Bulk Data Cards\n",
+            "GRID           1               0       0       0\n",
+            "GRID           2            1000       0       0\n",
+        ]:
+            consumed_lines.append(line)
+            yield line
+
+    actual = NastranSimulation.from_file_content(lines())
+    assert len(consumed_lines) == 5
+    assert actual.case_control.general == Subcase(analysis=Analysis.STATICS)
+    assert actual.bulk_data.entries == [Grid(id=1), Grid(id=2, x1=1000.0)]
+
+
 def test_to_file_content_x_movable_rod(x_movable_rod, x_movable_rod_path):
     ground_truth = remove_unimportant_lines(read_file(x_movable_rod_path))
     actual = x_movable_rod.to_file_content()
     assert actual == ground_truth
 
 
+def test_write_to_x_movable_rod(x_movable_rod):
+    stream = io.StringIO()
+    x_movable_rod.write_to(stream)
+    assert stream.getvalue() == "".join(x_movable_rod.to_file_content())
+
+
+def test_from_file_content__without_section_comments(x_movable_rod):
+    actual = NastranSimulation.from_file_content(x_movable_rod.to_file_content())
+    assert actual == x_movable_rod
+
+
+def test_from_file_content__missing_case_control():
+    with pytest.raises(MissingSectionError):
+        NastranSimulation.from_file_content(["GRID           1               0       0       0\n"])
+
+
+def test_from_file_content__missing_bulk_data():
+    with pytest.raises(MissingSectionError):
+        NastranSimulation.from_file_content(["SOL 101\n", "CEND\n", "  ANALYSIS = STATICS\n"])
+
+
+def test_from_path__includes(tmp_path):
+    (tmp_path / "mesh.bdf").write_text("GRID           1               0       0       0\n")
+    path = tmp_path / "model.bdf"
+    path.write_text(
+        "$$ Case Control Cards\n"
+        "$$ Bulk Data Cards\n"
+        "BEGIN BULK\n"
+        "INCLUDE 'mesh.bdf'\n"
+        "GRID           2            1000       0       0\n"
+        "ENDDATA\n"
+    )
+
+    actual = NastranSimulation.from_path(path)
+    assert actual.bulk_data.entries == [Grid(id=2, x1=1000.0), Grid(id=1)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
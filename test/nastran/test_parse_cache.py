@@ -0,0 +1,147 @@
+from pathlib import Path
+
+import pytest
+
+from nastran_to_kratos.nastran import NastranSimulation, ParseCache
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
+from nastran_to_kratos.nastran.bulk_data.entries import Grid, Rbe2
+
+
+@pytest.fixture
+def x_movable_rod_path() -> Path:
+    return (
+        Path(__file__).parent.parent.parent
+        / "examples"
+        / "x_movable_rod"
+        / "nastran"
+        / "x_movable_rod.bdf"
+    )
+
+
+@pytest.fixture
+def model_path(tmp_path) -> Path:
+    (tmp_path / "mesh.bdf").write_text(
+        "GRID           1               0       0       0\n"
+        "GRID*                  2                          1000.0             0.0\n"
+        "*                   -2.5               3             123\n"
+        "RBE2           1      10  123456      20      21     0.5\n"
+    )
+    path = tmp_path / "model.bdf"
+    path.write_text(
+        "$$ Case Control Cards\n"
+        "SUBCASE       1\n"
+        "  LOAD =        1\n"
+        "$$ Bulk Data Cards\n"
+        "BEGIN BULK\n"
+        "INCLUDE 'mesh.bdf'\n"
+        "CROD           1       1       1       2\n"
+        "ENDDATA\n"
+    )
+    return path
+
+
+def test_read__x_movable_rod(tmp_path, x_movable_rod_path):
+    cache = ParseCache(tmp_path / "cache")
+
+    first = cache.read(x_movable_rod_path)
+    second = cache.read(x_movable_rod_path)
+
+    assert first == NastranSimulation.from_path(x_movable_rod_path)
+    assert second == first
+    assert len(list(cache.directory.glob("*.npz"))) == 1
+
+
+def test_read__hit_is_not_parsed(tmp_path, model_path, monkeypatch):
+    cache = ParseCache(tmp_path / "cache")
+    expected = cache.read(model_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(NastranSimulation, "from_file_content", fail)
+    monkeypatch.setattr(BulkDataSection, "from_path", fail)
+    actual = ParseCache(cache.directory).read(model_path)
+
+    assert actual == expected
+    assert actual.bulk_data.rbe2s == [Rbe2(eid=1, gn=10, cm=123456, gmi=[20, 21], alpha=0.5)]
+    assert actual.bulk_data.grids[1] == Grid(id=2, x1=1000.0, x3=-2.5, cd=3, ps="123")
+
+
+def test_read__changed_include_is_parsed_again(tmp_path, model_path):
+    cache = ParseCache(tmp_path / "cache")
+    cache.read(model_path)
+
+    (model_path.parent / "mesh.bdf").write_text("GRID           7               0       0       0\n")
+    actual = cache.read(model_path)
+
+    assert actual.bulk_data.grids == [Grid(id=7)]
+
+
+def test_read__only_the_changed_include_is_parsed_again(tmp_path, model_path, monkeypatch):
+    (model_path.parent / "loads.bdf").write_text(
+        "FORCE          1       1       0  1000.0     1.0     0.0     0.0\n"
+    )
+    model_path.write_text(model_path.read_text().replace("ENDDATA", "INCLUDE 'loads.bdf'\nENDDATA"))
+    ParseCache(tmp_path / "cache").read(model_path)
+
+    parsed_paths = []
+    from_path = BulkDataSection.from_path
+
+    def counting_from_path(path: Path) -> BulkDataSection:
+        parsed_paths.append(path.name)
+        return from_path(path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(BulkDataSection, "from_path", counting_from_path)
+    monkeypatch.setattr(NastranSimulation, "from_file_content", fail)
+    (model_path.parent / "loads.bdf").write_text(
+        "FORCE          1       1       0  2000.0     1.0     0.0     0.0\n"
+    )
+    actual = ParseCache(tmp_path / "cache").read(model_path)
+
+    assert parsed_paths == ["loads.bdf"]
+    assert [force.f for force in actual.bulk_data.forces] == [2000.0]
+    assert len(actual.bulk_data.grids) == 2
+
+
+def test_store__least_recently_used_files_are_evicted(tmp_path):
+    cache = ParseCache(tmp_path / "cache", max_size=0)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"model_{i}.bdf"
+        path.write_text(f"$$ Case Control Cards\n$$ Bulk Data Cards\nGRID    {i:>8}\n")
+        paths.append(path)
+        cache.read(path)
+
+    assert list(cache.directory.glob("*.npz")) == []
+
+    cache.max_size = 10**9
+    for path in paths:
+        cache.read(path)
+    assert len(list(cache.directory.glob("*.npz"))) == 3
+
+    cache.max_size = sum(file_.stat().st_size for file_ in cache.directory.glob("*.npz")) - 1
+    cache.read(paths[0])
+    cache.evict()
+    remaining = {file_.name for file_ in cache.directory.glob("*.npz")}
+    assert len(remaining) == 2
+    assert cache._cache_path(paths[0]).name in remaining
+    assert cache._cache_path(paths[1]).name not in remaining
+
+
+def test_load__corrupt_file(tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+    cache_path = cache.directory / "corrupt.npz"
+    cache_path.write_bytes(b"no zip file")
+
+    assert cache.load(cache_path) is None
+
+
+def test_store__unsupported_entries_are_not_cached(tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+    simulation = NastranSimulation(bulk_data=BulkDataSection(entries=[Grid(id=1, ps=[1.5])]))
+
+    cache.store(cache.directory / "unsupported.npz", simulation)
+    assert list(cache.directory.glob("*")) == []
@@ -37,5 +37,19 @@ def test_integration__x_movable_rod(tmp_path, x_movable_rod_path):
     assert read_file(output_dir / "model.mdpa") == read_file(ground_truth_dir / "model.mdpa")
 
 
+def test_integration__x_movable_rod__renumber_nodes(tmp_path, x_movable_rod_path):
+    output_dir = tmp_path / "x_movable_rod"
+    nastran_input = x_movable_rod_path / "nastran" / "x_movable_rod.bdf"
+
+    nastran_to_kratos(nastran_input, output_dir, renumber_nodes=True)
+
+    original_ids = read_json(output_dir / "node_ids.json")["original_node_ids"]
+    assert sorted(original_ids) == [1, 2]
+    assert read_json(output_dir / "materials.json") == read_json(
+        x_movable_rod_path / "kratos" / "materials.json"
+    )
+    assert (output_dir / "model.mdpa").is_file()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
@@ -0,0 +1,169 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from nastran_to_kratos.nastran import NastranSimulation
+from nastran_to_kratos.nastran.bulk_data import BulkDataSection
+from nastran_to_kratos.nastran.bulk_data.entries import Crod, Force, Grid, Mat1, Prod, Spc
+from nastran_to_kratos.nastran.case_control import CaseControlSection, Subcase
+from nastran_to_kratos.translation_layer import (
+    ColumnarTranslationLayer,
+    Connector,
+    Material,
+    Point,
+    TranslationLayer,
+    Truss,
+    UnsupportedConnectorError,
+)
+
+
+@pytest.fixture
+def nastran() -> NastranSimulation:
+    return NastranSimulation(
+        case_control=CaseControlSection(general=Subcase(), subcases={1: Subcase(load=2, spc=3)}),
+        bulk_data=BulkDataSection(
+            [
+                Grid(id=3, x1=2.0),
+                Grid(id=1),
+                Grid(id=2, x1=1.0, x3=0.5),
+                Crod(eid=1, pid=20, g1=1, g2=2),
+                Crod(eid=2, pid=10, g1=2, g2=3),
+                Crod(eid=3, pid=20, g1=3, g2=1),
+                Prod(pid=10, mid=7, a=22.0),
+                Prod(pid=20, mid=8, a=35.0),
+                Mat1(mid=7, e=69_000.0),
+                Mat1(mid=8),
+                Spc(sid=3, g1=1, c1=123456),
+                Spc(sid=4, g1=3, c1=31),
+                Force(sid=2, g=3, cid=0, f=1000.0, n1=1.0, n2=0.0, n3=0.0),
+            ]
+        ),
+    )
+
+
+@pytest.fixture
+def example() -> NastranSimulation:
+    return NastranSimulation.from_path(
+        Path(__file__).parent.parent.parent.parent
+        / "examples"
+        / "x_movable_rod"
+        / "nastran"
+        / "x_movable_rod.bdf"
+    )
+
+
+def test_from_nastran(nastran):
+    actual = ColumnarTranslationLayer.from_nastran(nastran)
+
+    assert actual.node_ids.tolist() == [1, 2, 3]
+    assert actual.coordinates.tolist() == [[0.0, 0.0, 0.0], [1.0, 0.0, 0.5], [2.0, 0.0, 0.0]]
+    assert actual.connectivity.tolist() == [[1, 2], [2, 3], [3, 1]]
+    assert actual.property_indices.tolist() == [1, 0, 1]
+    assert actual.cross_sections.tolist() == [22.0, 35.0]
+    assert actual.material_names == ["MAT1_7", "MAT1_8"]
+    assert actual.young_moduli.tolist() == [69_000.0, pytest.approx(np.nan, nan_ok=True)]
+    assert actual.constraint_node_ids.tolist() == [1, 3]
+    assert actual.constrained_components.tolist() == [
+        [True, True, True, True, True, True],
+        [True, False, True, False, False, False],
+    ]
+    assert actual.load_node_ids.tolist() == [3]
+    assert actual.load_moduli.tolist() == [1000.0]
+    assert actual.load_directions.tolist() == [[1.0, 0.0, 0.0]]
+
+
+def test_from_nastran__same_as_translation_layer(nastran):
+    actual = ColumnarTranslationLayer.from_nastran(nastran).to_translation_layer()
+    assert actual == TranslationLayer.from_nastran(nastran)
+
+
+def test_from_nastran__subcase(nastran):
+    actual = ColumnarTranslationLayer.from_nastran(nastran, subcase_id=1)
+
+    assert actual.constraint_node_ids.tolist() == [1]
+    assert actual.load_node_ids.tolist() == [3]
+
+
+def test_from_nastran__missing_prod(nastran):
+    nastran.bulk_data.entries.append(Crod(eid=4, pid=30, g1=1, g2=2))
+
+    with pytest.raises(KeyError):
+        ColumnarTranslationLayer.from_nastran(nastran)
+
+
+@pytest.mark.parametrize("group_properties", [False, True])
+def test_to_kratos__same_as_translation_layer(nastran, example, group_properties):
+    for simulation in (nastran, example):
+        actual = ColumnarTranslationLayer.from_nastran(simulation).to_kratos(
+            group_properties=group_properties
+        )
+        expected = TranslationLayer.from_nastran(simulation).to_kratos(
+            group_properties=group_properties
+        )
+
+        assert actual.model == expected.model
+        assert actual.materials == expected.materials
+        assert actual.parameters == expected.parameters
+
+
+def test_to_nastran__same_as_translation_layer(nastran, example):
+    for simulation in (nastran, example):
+        actual = ColumnarTranslationLayer.from_nastran(simulation).to_nastran()
+        assert actual == TranslationLayer.from_nastran(simulation).to_nastran()
+
+
+@pytest.mark.parametrize("group_properties", [False, True])
+def test_from_kratos__same_as_translation_layer(nastran, group_properties):
+    kratos = TranslationLayer.from_nastran(nastran).to_kratos(group_properties=group_properties)
+    # Trusses with a material without a young's modulus can not be read from kratos.
+    for material in kratos.materials:
+        material.variables.setdefault("YOUNG_MODULUS", 1.0)
+
+    actual = ColumnarTranslationLayer.from_kratos(kratos).to_translation_layer()
+    assert actual == TranslationLayer.from_kratos(kratos)
+
+
+def test_from_translation_layer__shared_properties():
+    steel = Material(name="Steel", young_modulus=210_000)
+    translation_layer = TranslationLayer(
+        nodes=[Point.origin(1), Point(2, 1, 0, 0)],
+        connectors=[
+            Truss(first_point_index=1, second_point_index=2, cross_section=35, material=steel),
+            Truss(first_point_index=2, second_point_index=1, cross_section=22, material=steel),
+            Truss(
+                first_point_index=1,
+                second_point_index=2,
+                cross_section=35,
+                material=Material(name="Steel", young_modulus=210_000),
+            ),
+        ],
+    )
+
+    actual = ColumnarTranslationLayer.from_translation_layer(translation_layer)
+
+    assert actual.property_indices.tolist() == [0, 1, 0]
+    assert actual.cross_sections.tolist() == [35, 22]
+    assert actual.to_translation_layer() == translation_layer
+
+
+def test_from_translation_layer__unsupported_connector():
+    @dataclass
+    class Beam(Connector):
+        pass
+
+    translation_layer = TranslationLayer(
+        connectors=[Beam(first_point_index=1, second_point_index=2, material=Material("Steel"))]
+    )
+
+    with pytest.raises(UnsupportedConnectorError, match="Beam connectors are not supported"):
+        ColumnarTranslationLayer.from_translation_layer(translation_layer)
+
+
+def test_empty():
+    actual = ColumnarTranslationLayer.empty()
+
+    assert actual == ColumnarTranslationLayer.from_translation_layer(TranslationLayer())
+    assert actual.to_translation_layer() == TranslationLayer()
+    assert actual.to_kratos(group_properties=True).materials == []
@@ -2,9 +2,13 @@ from pathlib import Path
 
 import pytest
 
+from nastran_to_kratos.kratos import KratosSimulation
+from nastran_to_kratos.kratos.material import KratosMaterial
+from nastran_to_kratos.kratos.model import Element, Model
 from nastran_to_kratos.nastran.bulk_data import BulkDataSection
 from nastran_to_kratos.nastran.bulk_data.entries import Crod, Prod, Mat1, Rbe2
 from nastran_to_kratos.translation_layer import Truss, trusses_from_nastran, Material, RBE2Connector
+from nastran_to_kratos.translation_layer.connector import trusses_from_kratos
 
 
 def test_truss_from_nastran():
@@ -83,6 +87,22 @@ def test_trusses_from_nastran__raise_error_for_missing_prod():
         trusses_from_nastran(bulk_data)
 
 
+def test_trusses_from_nastran__shared_material():
+    crod1 = Crod(eid=1, pid=1, g1=5, g2=6)
+    crod2 = Crod(eid=2, pid=2, g1=6, g2=7)
+    prod1 = Prod(pid=1, mid=3, a=400)
+    prod2 = Prod(pid=2, mid=3, a=900)
+    mat1 = Mat1(mid=3)
+    bulk_data = BulkDataSection(entries=[crod1, crod2, prod1, prod2, mat1])
+
+    actual = trusses_from_nastran(bulk_data)
+    assert actual == [
+        Truss.from_nastran(crod1, prod1, mat1),
+        Truss.from_nastran(crod2, prod2, mat1),
+    ]
+    assert actual[0].material is actual[1].material
+
+
 def test_trusses_from_nastran__raise_error_for_missing_mat1():
     crod1 = Crod(eid=1, pid=1, g1=5, g2=6)
     prod1 = Prod(pid=1, mid=0, a=400)
@@ -150,5 +170,101 @@ def test_to_kratos_process_no_constrained_dofs():
         connector.to_kratos_process(model_part_name="Structure")
 
 
+def _kratos_material(model_part_name: str, properties_id: int, cross_area: float) -> KratosMaterial:
+    return KratosMaterial(
+        model_part_name=model_part_name,
+        properties_id=properties_id,
+        material_name="Steel",
+        constitutive_law="TrussConstitutiveLaw",
+        variables={"YOUNG_MODULUS": 210_000, "CROSS_AREA": cross_area, "DENSITY": 0},
+    )
+
+
+def _kratos_trusses(elements: dict[int, Element], materials: list) -> KratosSimulation:
+    return KratosSimulation(
+        model=Model(elements={"TrussLinearElement3D2N": elements}), materials=materials
+    )
+
+
+def test_trusses_from_kratos__by_truss_id():
+    kratos = _kratos_trusses(
+        {
+            1: Element(property_id=0, node_ids=[1, 2]),
+            2: Element(property_id=0, node_ids=[2, 3]),
+        },
+        [_kratos_material("Structure.truss_2", 0, 20), _kratos_material("Structure.truss_1", 0, 10)],
+    )
+
+    actual = trusses_from_kratos(kratos)
+    assert [truss.cross_section for truss in actual] == [10, 20]
+
+
+def test_trusses_from_kratos__by_properties_id():
+    kratos = _kratos_trusses(
+        {
+            1: Element(property_id=2, node_ids=[1, 2]),
+            2: Element(property_id=1, node_ids=[2, 3]),
+            3: Element(property_id=2, node_ids=[3, 4]),
+        },
+        [
+            _kratos_material("Structure.trusses_1", 1, 10),
+            _kratos_material("Structure.trusses_2", 2, 20),
+        ],
+    )
+
+    actual = trusses_from_kratos(kratos)
+    assert [truss.cross_section for truss in actual] == [20, 10, 20]
+    assert actual[0].material is actual[2].material
+
+
+def test_trusses_from_kratos__missing_material():
+    kratos = _kratos_trusses(
+        {
+            1: Element(property_id=0, node_ids=[1, 2]),
+            2: Element(property_id=0, node_ids=[2, 3]),
+        },
+        [_kratos_material("Structure.truss_1", 0, 10), _kratos_material("Structure.truss_3", 0, 30)],
+    )
+
+    with pytest.raises(KeyError):
+        trusses_from_kratos(kratos)
+
+
+class _CountingKratosMaterial(KratosMaterial):
+    reads = 0
+
+    @property
+    def model_part_name(self) -> str:
+        _CountingKratosMaterial.reads += 1
+        return self._model_part_name
+
+    @model_part_name.setter
+    def model_part_name(self, value: str) -> None:
+        self._model_part_name = value
+
+
+def test_trusses_from_kratos__linear_in_number_of_materials():
+    count = 2_000
+    materials = [
+        _CountingKratosMaterial(
+            model_part_name=f"Structure.truss_{i}",
+            properties_id=0,
+            material_name="Steel",
+            constitutive_law="TrussConstitutiveLaw",
+            variables={"YOUNG_MODULUS": 210_000, "CROSS_AREA": i, "DENSITY": 0},
+        )
+        for i in range(count, 0, -1)
+    ]
+    kratos = _kratos_trusses(
+        {i: Element(property_id=0, node_ids=[i, i + 1]) for i in range(1, count + 1)}, materials
+    )
+    _CountingKratosMaterial.reads = 0
+
+    actual = trusses_from_kratos(kratos)
+
+    assert [truss.cross_section for truss in actual] == list(range(1, count + 1))
+    assert _CountingKratosMaterial.reads <= count
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,7 +4,8 @@ import pytest
 
 from nastran_to_kratos.nastran.bulk_data import BulkDataSection
 from nastran_to_kratos.nastran.bulk_data.entries import Grid
-from nastran_to_kratos.translation_layer import Point, nodes_from_nastran
+from nastran_to_kratos.nastran.bulk_data.tables import GridTable
+from nastran_to_kratos.translation_layer import Point, nodes_from_grid_table, nodes_from_nastran
 
 
 def test_from_nastran():
@@ -32,5 +33,24 @@ def test_nodes_from_nastran__wrong_order():
     assert actual == [Point.from_nastran(grid2), Point.from_nastran(grid1)]
 
 
+def test_nodes_from_nastran__decoded_grid_table(monkeypatch):
+    bulk_data = BulkDataSection.from_file_content(
+        [f"GRID    {i:>8}        {i * 2.0:>8}     1.0     2.0" for i in range(20, 0, -1)]
+    )
+    monkeypatch.setattr(GridTable, "from_entries", None)
+
+    actual = nodes_from_nastran(bulk_data)
+    assert actual == [Point(id=i, x=i * 2.0, y=1.0, z=2.0) for i in range(1, 21)]
+
+
+def test_nodes_from_grid_table():
+    grids = GridTable.from_grids(
+        [Grid(id=3, x1=1.0, x2=2.0, x3=3.0), Grid(id=1, x1=4.0, x2=5.0, x3=6.0)]
+    )
+
+    actual = nodes_from_grid_table(grids)
+    assert actual == [Point(id=1, x=4.0, y=5.0, z=6.0), Point(id=3, x=1.0, y=2.0, z=3.0)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from nastran_to_kratos.translation_layer import NodeRenumbering
+
+
+def bandwidth(edges: list[tuple[int, int]], new_id=lambda node_id: node_id) -> int:
+    return max(abs(new_id(first) - new_id(second)) for first, second in edges)
+
+
+def test_reverse_cuthill_mckee__chain():
+    # A chain 10 - 40 - 20 - 50 - 30 with scattered ids.
+    edges = [(10, 40), (40, 20), (20, 50), (50, 30)]
+
+    actual = NodeRenumbering.reverse_cuthill_mckee([10, 20, 30, 40, 50], edges)
+
+    assert actual.original_ids in ([30, 50, 20, 40, 10], [10, 40, 20, 50, 30])
+    assert bandwidth(edges, actual.new_ids.__getitem__) == 1
+
+
+def test_reverse_cuthill_mckee__grid():
+    # A 20 x 20 grid of nodes, numbered in a random order.
+    width = 20
+    ids = list(range(1, width * width + 1))
+    random.Random(0).shuffle(ids)
+    edges = [
+        (ids[row * width + column], ids[row * width + column + 1])
+        for row in range(width)
+        for column in range(width - 1)
+    ] + [
+        (ids[row * width + column], ids[(row + 1) * width + column])
+        for row in range(width - 1)
+        for column in range(width)
+    ]
+
+    actual = NodeRenumbering.reverse_cuthill_mckee(ids, edges)
+
+    assert sorted(actual.original_ids) == sorted(ids)
+    assert bandwidth(edges) > 100
+    assert bandwidth(edges, actual.new_ids.__getitem__) <= width + 1
+
+
+def test_reverse_cuthill_mckee__unconnected_nodes():
+    actual = NodeRenumbering.reverse_cuthill_mckee([5, 7, 9, 11], [(9, 5), (5, 5)])
+
+    assert sorted(actual.original_ids) == [5, 7, 9, 11]
+    assert abs(actual.new_ids[9] - actual.new_ids[5]) == 1
+
+
+def test_reverse_cuthill_mckee__empty():
+    assert NodeRenumbering.reverse_cuthill_mckee([], []).original_ids == []
+
+
+def test_reverse_cuthill_mckee__unknown_node():
+    with pytest.raises(KeyError):
+        NodeRenumbering.reverse_cuthill_mckee([1, 2], [(1, 3)])
+
+
+def test_original_id():
+    renumbering = NodeRenumbering([30, 10, 20])
+
+    assert [renumbering.original_id(new_id) for new_id in (1, 2, 3)] == [30, 10, 20]
+    assert renumbering.new_ids == {30: 1, 10: 2, 20: 3}
+    with pytest.raises(KeyError):
+        renumbering.original_id(0)
+    with pytest.raises(KeyError):
+        renumbering.original_id(4)
+
+
+def test_json_round_trip():
+    renumbering = NodeRenumbering([30, 10, 20])
+
+    assert renumbering.to_json() == {"original_node_ids": [30, 10, 20]}
+    assert NodeRenumbering.from_json(renumbering.to_json()) == renumbering
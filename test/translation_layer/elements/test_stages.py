@@ -0,0 +1,40 @@
+import pytest
+
+from nastran_to_kratos.translation_layer import StageTimings, run_stages
+
+
+def test_run_stages__results_by_name():
+    actual = run_stages({"first": lambda: 1, "second": lambda: [2]})
+    assert actual == {"first": 1, "second": [2]}
+
+
+def test_run_stages__keep_order():
+    actual = run_stages({name: lambda name=name: name for name in "edcba"})
+    assert list(actual) == list("edcba")
+
+
+def test_run_stages__timings():
+    timings = StageTimings()
+    run_stages({"first": lambda: None, "second": lambda: None}, timings=timings)
+    run_stages({"third": lambda: None}, timings=timings)
+
+    assert list(timings.stages) == ["first", "second", "third"]
+    assert all(seconds >= 0 for seconds in timings.stages.values())
+    assert timings.total >= max(timings.stages.values())
+
+
+def test_run_stages__exception():
+    def fail() -> None:
+        raise KeyError(1)
+
+    with pytest.raises(KeyError):
+        run_stages({"first": lambda: None, "second": fail})
+
+
+def test_run_stages__empty():
+    assert run_stages({}) == {}
+
+
+def test_stage_timings__summary():
+    timings = StageTimings(stages={"nodes": 0.12, "trusses": 0.2}, total=0.35)
+    assert timings.summary() == "nodes 0.120 s, trusses 0.200 s (total 0.350 s)"
@@ -31,6 +31,7 @@ from nastran_to_kratos.translation_layer import (
     nodes_from_nastran,
     trusses_from_nastran,
     Material,
+    StageTimings,
 )
 
 
@@ -77,6 +78,60 @@ def test_from_nastran__loads():
     assert actual.loads == [Load.from_nastran(force1), Load.from_nastran(force2)]
 
 
+def test_from_nastran__subcase():
+    force1 = Force(sid=1, g=1, cid=1, f=40_000, n1=1.0, n2=0.0, n3=0.0)
+    force2 = Force(sid=2, g=1, cid=1, f=20_000, n1=0.0, n2=1.0, n3=0.0)
+    spc1 = Spc(sid=10, g1=2, c1=123456)
+    spc2 = Spc(sid=20, g1=2, c1=246)
+    nastran = NastranSimulation(
+        case_control=CaseControlSection(
+            general=Subcase(spc=10),
+            subcases={1: Subcase(load=1), 2: Subcase(load=2, spc=20), 3: Subcase(load=3)},
+        ),
+        bulk_data=BulkDataSection([force1, spc1, force2, spc2]),
+    )
+
+    assert TranslationLayer.from_nastran(nastran, subcase_id=1).loads == [Load.from_nastran(force1)]
+    assert TranslationLayer.from_nastran(nastran, subcase_id=1).constraints == [
+        Constraint.from_nastran(spc1)
+    ]
+    assert TranslationLayer.from_nastran(nastran, subcase_id=2).loads == [Load.from_nastran(force2)]
+    assert TranslationLayer.from_nastran(nastran, subcase_id=2).constraints == [
+        Constraint.from_nastran(spc2)
+    ]
+    assert TranslationLayer.from_nastran(nastran, subcase_id=3).loads == []
+
+
+def test_from_nastran__unknown_subcase():
+    nastran = NastranSimulation(bulk_data=BulkDataSection([]))
+
+    with pytest.raises(KeyError):
+        TranslationLayer.from_nastran(nastran, subcase_id=1)
+
+
+def test_from_nastran__timings():
+    nastran = NastranSimulation(
+        case_control=CaseControlSection(general=Subcase(), subcases={1: Subcase(load=1)}),
+        bulk_data=BulkDataSection(
+            [
+                Grid(id=1),
+                Grid(id=2, x1=1.0),
+                Crod(eid=1, pid=1, g1=1, g2=2),
+                Prod(pid=1, mid=1, a=35.0),
+                Mat1(mid=1, e=210_000.0),
+                Spc(sid=1, g1=1, c1=123456),
+                Force(sid=1, g=2, cid=0, f=1000.0, n1=1.0, n2=0.0, n3=0.0),
+            ]
+        ),
+    )
+    timings = StageTimings()
+
+    for subcase_id in (None, 1):
+        actual = TranslationLayer.from_nastran(nastran, subcase_id, timings=timings)
+        assert actual == TranslationLayer.from_nastran(nastran, subcase_id)
+    assert list(timings.stages) == ["nodes", "trusses", "constraints", "loads"]
+
+
 def test_to_kratos__model():
     translation_layer = TranslationLayer(
         nodes=[
@@ -184,6 +239,122 @@ def test_to_kratos__materials():
     ]
 
 
+def _grouped_translation_layer() -> TranslationLayer:
+    steel = Material(name="Steel", young_modulus=210_000)
+    return TranslationLayer(
+        nodes=[Point.origin(1), Point(2, 1, 0, 0), Point(3, 2, 0, 0)],
+        connectors=[
+            Truss(first_point_index=1, second_point_index=2, cross_section=35, material=steel),
+            Truss(
+                first_point_index=2,
+                second_point_index=3,
+                cross_section=22,
+                material=Material(name="Aluminum", young_modulus=69_000),
+            ),
+            Truss(first_point_index=2, second_point_index=3, cross_section=35, material=steel),
+        ],
+    )
+
+
+def test_to_kratos__group_properties__model():
+    actual = _grouped_translation_layer().to_kratos(group_properties=True)
+
+    assert actual.model == Model(
+        properties={0: {}, 1: {}, 2: {}},
+        nodes={1: Node(0, 0, 0), 2: Node(1, 0, 0), 3: Node(2, 0, 0)},
+        elements={
+            "TrussLinearElement3D2N": {
+                1: KratosElement(property_id=1, node_ids=[1, 2]),
+                2: KratosElement(property_id=2, node_ids=[2, 3]),
+                3: KratosElement(property_id=1, node_ids=[2, 3]),
+            }
+        },
+        conditions={"PointLoadCondition2D1N": {}},
+        sub_models={
+            "trusses_1": SubModel(properties=[1], nodes=[1, 2, 3], elements=[1, 3]),
+            "trusses_2": SubModel(properties=[2], nodes=[2, 3], elements=[2]),
+        },
+    )
+
+
+def test_to_kratos__group_properties__materials():
+    actual = _grouped_translation_layer().to_kratos(group_properties=True)
+
+    assert actual.materials == [
+        KratosMaterial(
+            model_part_name="Structure.trusses_1",
+            properties_id=1,
+            material_name="Steel",
+            constitutive_law="TrussConstitutiveLaw",
+            variables={"YOUNG_MODULUS": 210_000, "CROSS_AREA": 35, "DENSITY": 0},
+        ),
+        KratosMaterial(
+            model_part_name="Structure.trusses_2",
+            properties_id=2,
+            material_name="Aluminum",
+            constitutive_law="TrussConstitutiveLaw",
+            variables={"YOUNG_MODULUS": 69_000, "CROSS_AREA": 22, "DENSITY": 0},
+        ),
+    ]
+
+
+def test_to_kratos__group_properties__round_trip(tmp_path):
+    translation_layer = _grouped_translation_layer()
+    translation_layer.to_kratos(group_properties=True).write_to_directory(tmp_path)
+
+    actual = TranslationLayer.from_kratos(KratosSimulation.from_directory(tmp_path))
+    assert actual.connectors == translation_layer.connectors
+
+
+@pytest.mark.parametrize("group_properties", [False, True])
+def test_to_kratos__timings(group_properties):
+    timings = StageTimings()
+    actual = _grouped_translation_layer().to_kratos(
+        group_properties=group_properties, timings=timings
+    )
+    expected = _grouped_translation_layer().to_kratos(group_properties=group_properties)
+
+    assert actual.model == expected.model
+    assert actual.materials == expected.materials
+    assert actual.parameters == expected.parameters
+    assert list(timings.stages) == ["model", "materials", "parameters"]
+
+
+def test_renumber_nodes():
+    steel = Material(name="Steel", young_modulus=210_000)
+    translation_layer = TranslationLayer(
+        nodes=[Point(30, 2, 0, 0), Point(1000, 0, 0, 0), Point(7, 1, 0, 0)],
+        connectors=[
+            Truss(first_point_index=7, second_point_index=30, cross_section=22, material=steel),
+            Truss(first_point_index=1000, second_point_index=7, cross_section=35, material=steel),
+        ],
+        constraints=[Constraint(1000, (True, True, True), (True, True, True))],
+        loads=[Load(30, 1000.0, (1.0, 0.0, 0.0))],
+    )
+
+    actual, renumbering = translation_layer.renumber_nodes()
+
+    assert [node.id for node in actual.nodes] == [1, 2, 3]
+    assert [renumbering.original_id(node.id) for node in actual.nodes] == [1000, 7, 30]
+    assert [node.x for node in actual.nodes] == [0, 1, 2]
+    assert [
+        (connector.first_point_index, connector.second_point_index, connector.cross_section)
+        for connector in actual.connectors
+    ] == [(1, 2, 35), (2, 3, 22)]
+    assert actual.constraints[0].node_id == 1
+    assert actual.loads[0].node_id == 3
+    assert translation_layer.nodes[0].id == 30
+
+
+def test_renumber_nodes__missing_node():
+    translation_layer = TranslationLayer(
+        nodes=[Point.origin(1)], loads=[Load(2, 1000.0, (1.0, 0.0, 0.0))]
+    )
+
+    with pytest.raises(KeyError):
+        translation_layer.renumber_nodes()
+
+
 def test_to_kratos__simulation_parameters():
     translation_layer = TranslationLayer(
         nodes=[Point.origin(1)],